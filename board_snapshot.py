@@ -0,0 +1,255 @@
+"""
+보드 스냅샷 제공자
+TTL 동안 한 번 가져온 보드 포스트를 여러 작업이 함께 사용하도록 공유
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from padlet_api_complete import PadletAPI
+from padlet_models import Post, iter_posts
+
+DEFAULT_SNAPSHOT_TTL = 120.0  # 초
+DEFAULT_REFRESH_INTERVAL = 60.0  # 초
+
+
+@dataclass
+class BoardSnapshot:
+    """한 시점의 보드 포스트 (파싱 완료)"""
+    board_id: str
+    posts: List[Post]
+    fetched_at: datetime
+    version: int                              # 포스트 구성이 바뀔 때만 증가
+    source_path: Optional[str] = None         # 캐시된 원본 응답 파일 (백업용)
+    fingerprint: Tuple = field(default=(), repr=False)
+    _derived: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    _derived_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    def derive(self, name: str, builder: Callable[["BoardSnapshot"], Any]) -> Any:
+        """
+        스냅샷에서 파생된 값을 한 번만 계산해 공유
+
+        스냅샷 객체는 내용이 바뀔 때만 교체되므로 파생 값은 버전별로 한 번 계산된다.
+        동시에 여러 스레드가 요청해도 builder는 한 번만 실행된다.
+
+        Args:
+            name: 파생 값 이름
+            builder: 스냅샷을 받아 값을 만드는 함수
+
+        Returns:
+            builder 결과 (호출자는 수정하지 말 것)
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if name not in self._derived:
+                self._derived[name] = builder(self)
+            return self._derived[name]
+
+
+class BoardSnapshotProvider:
+    """
+    TTL 기반 보드 스냅샷 캐시
+
+    - TTL 안에 들어온 요청은 마지막 스냅샷을 그대로 반환 (API 호출 없음)
+    - 여러 스레드가 동시에 만료를 만나도 한 번만 다시 가져옴
+    - 내용이 그대로면 기존 스냅샷 객체를 유지해 파생 값(derive) 캐시를 재사용
+    - 몇 번의 fetch를 아꼈는지 stats()로 확인
+    """
+
+    def __init__(self, api: PadletAPI, board_id: str, ttl: float = DEFAULT_SNAPSHOT_TTL):
+        self.api = api
+        self.board_id = board_id
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._snapshot: Optional[BoardSnapshot] = None
+        self._expires_at = 0.0
+        self._stats = {
+            "fetches": 0,
+            "served": 0,
+            "fetches_saved": 0,
+        }
+
+    def get(self, max_age: Optional[float] = None) -> BoardSnapshot:
+        """
+        현재 스냅샷 반환 (만료되었으면 새로 가져옴)
+
+        Args:
+            max_age: 이번 호출에만 적용할 TTL (None이면 self.ttl)
+
+        Returns:
+            BoardSnapshot
+
+        Raises:
+            requests.exceptions.RequestException: 새로 가져오다 실패한 경우
+        """
+        with self._lock:
+            self._stats["served"] += 1
+            snapshot = self._snapshot
+            if snapshot is not None and self._is_fresh(snapshot, max_age):
+                self._stats["fetches_saved"] += 1
+                return snapshot
+            return self._refresh_locked()
+
+    def refresh(self) -> BoardSnapshot:
+        """TTL과 관계없이 스냅샷을 새로 가져옴"""
+        with self._lock:
+            return self._refresh_locked()
+
+    def peek(self) -> Optional[BoardSnapshot]:
+        """
+        마지막 스냅샷을 즉시 반환 (만료 여부와 관계없이, 네트워크 요청 없음)
+
+        갱신 중이어도 잠금을 기다리지 않는다.
+        """
+        return self._snapshot
+
+    def invalidate(self):
+        """다음 get()에서 다시 가져오도록 스냅샷 만료 처리"""
+        with self._lock:
+            self._expires_at = 0.0
+
+    def _is_fresh(self, snapshot: BoardSnapshot, max_age: Optional[float]) -> bool:
+        if max_age is None:
+            return time.monotonic() < self._expires_at
+        age = (datetime.now() - snapshot.fetched_at).total_seconds()
+        return age < max_age
+
+    def _refresh_locked(self) -> BoardSnapshot:
+        posts = list(iter_posts(self.api.iter_board_items(self.board_id, types=("post",))))
+        self._stats["fetches"] += 1
+
+        fingerprint = tuple((post.id, post.updated_at) for post in posts)
+        previous = self._snapshot
+        if previous is not None and previous.fingerprint == fingerprint:
+            # 변경 없음: 같은 객체를 유지하고 시각만 갱신
+            previous.fetched_at = datetime.now()
+            previous.source_path = self.api.board_cache_path(self.board_id)
+            self._expires_at = time.monotonic() + self.ttl
+            return previous
+
+        version = 1 if previous is None else previous.version + 1
+        self._snapshot = BoardSnapshot(
+            board_id=self.board_id,
+            posts=posts,
+            fetched_at=datetime.now(),
+            version=version,
+            source_path=self.api.board_cache_path(self.board_id),
+            fingerprint=fingerprint,
+        )
+        self._expires_at = time.monotonic() + self.ttl
+        return self._snapshot
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        스냅샷 사용 통계
+
+        Returns:
+            fetches: 실제로 보드를 가져온 횟수
+            served: get() 호출 수
+            fetches_saved: 스냅샷 재사용으로 생략한 fetch 수
+            version: 현재 스냅샷 버전 (없으면 0)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["version"] = self._snapshot.version if self._snapshot else 0
+        return stats
+
+
+class SnapshotRefresher:
+    """
+    백그라운드 스냅샷 갱신 스레드 (stale-while-revalidate)
+
+    - 화면 렌더링은 snapshot()으로 마지막 정상 스냅샷을 바로 가져가고
+      네트워크 요청은 이 스레드에서만 발생
+    - 갱신에 실패하면 이전 스냅샷을 유지하고 다음 주기에 다시 시도
+    """
+
+    def __init__(self, provider: BoardSnapshotProvider,
+                 interval: float = DEFAULT_REFRESH_INTERVAL):
+        self.provider = provider
+        self.interval = interval
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._status_lock = threading.Lock()
+        self._status = {
+            "refreshes": 0,
+            "failures": 0,
+            "last_latency_ms": None,
+            "last_success": None,
+            "last_error": None,
+        }
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="snapshot-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def refresh_now(self):
+        """다음 주기를 기다리지 않고 바로 갱신하도록 요청"""
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            try:
+                self.provider.refresh()
+            except Exception as e:
+                with self._status_lock:
+                    self._status["failures"] += 1
+                    self._status["last_error"] = str(e)
+                print(f"Snapshot refresh error: {e}")
+            else:
+                with self._status_lock:
+                    self._status["refreshes"] += 1
+                    self._status["last_latency_ms"] = round((time.perf_counter() - started) * 1000)
+                    self._status["last_success"] = datetime.now()
+                    self._status["last_error"] = None
+
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def snapshot(self) -> Optional[BoardSnapshot]:
+        """마지막 정상 스냅샷 (아직 한 번도 받지 못했으면 None)"""
+        return self.provider.peek()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        갱신 상태
+
+        Returns:
+            refreshes: 성공한 갱신 수
+            failures: 실패한 갱신 수
+            last_latency_ms: 마지막 성공 갱신 소요 시간
+            last_success: 마지막 성공 시각
+            last_error: 마지막 실패 메시지 (성공하면 None)
+            staleness_seconds: 현재 스냅샷을 받은 뒤 지난 시간 (없으면 None)
+            running: 스레드 동작 여부
+        """
+        with self._status_lock:
+            status = dict(self._status)
+        snapshot = self.provider.peek()
+        status["staleness_seconds"] = (
+            (datetime.now() - snapshot.fetched_at).total_seconds() if snapshot else None
+        )
+        status["running"] = bool(self._thread and self._thread.is_alive())
+        return status
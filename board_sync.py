@@ -0,0 +1,166 @@
+"""
+보드 변경 동기화 엔진
+연속된 스냅샷을 비교해 추가/수정/이동/삭제 이벤트를 구독자에게 전달
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from board_snapshot import BoardSnapshot, BoardSnapshotProvider
+from padlet_models import Post
+
+ADDED = "added"
+EDITED = "edited"
+MOVED = "moved"
+DELETED = "deleted"
+EVENT_KINDS = (ADDED, EDITED, MOVED, DELETED)
+
+
+@dataclass(slots=True)
+class PostEvent:
+    """포스트 변경 이벤트"""
+    kind: str
+    post_id: str
+    post: Optional[Post] = None         # 변경 후 포스트 (삭제면 None)
+    previous: Optional[Post] = None     # 변경 전 포스트 (추가면 None)
+
+
+def _location_key(post: Post) -> Tuple:
+    return (post.latitude, post.longitude, post.location_name, post.section_id)
+
+
+def _content_key(post: Post) -> Tuple:
+    return (post.subject, post.body, post.color, post.attachment_url)
+
+
+def diff_posts(previous: Dict[str, Post], posts: Iterable[Post]) -> List[PostEvent]:
+    """
+    이전 포스트 인덱스와 새 포스트 목록 비교
+
+    updatedAt이 같은 포스트는 내용을 비교하지 않는다.
+    위치와 내용이 함께 바뀌면 moved, edited 이벤트를 모두 만든다.
+
+    Args:
+        previous: {post_id: Post} 이전 인덱스
+        posts: 새 스냅샷의 포스트
+
+    Returns:
+        변경 이벤트 리스트 (추가/수정/이동 → 삭제 순)
+    """
+    events = []
+    seen = set()
+
+    for post in posts:
+        seen.add(post.id)
+        old = previous.get(post.id)
+        if old is None:
+            events.append(PostEvent(ADDED, post.id, post, None))
+            continue
+        if old.updated_at == post.updated_at and old.updated_at is not None:
+            continue
+
+        if _location_key(old) != _location_key(post):
+            events.append(PostEvent(MOVED, post.id, post, old))
+        if _content_key(old) != _content_key(post):
+            events.append(PostEvent(EDITED, post.id, post, old))
+
+    for post_id, old in previous.items():
+        if post_id not in seen:
+            events.append(PostEvent(DELETED, post_id, None, old))
+
+    return events
+
+
+class DeltaSync:
+    """
+    스냅샷 사이의 변경분만 구독자에게 전달
+
+    - 스냅샷 버전이 같으면 비교 없이 바로 반환
+    - 첫 poll()에서는 모든 포스트가 added로 전달되므로
+      구독자는 같은 코드로 초기 상태를 만들 수 있다
+    """
+
+    def __init__(self, provider: BoardSnapshotProvider):
+        self.provider = provider
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, Post] = {}
+        self._version = 0
+        self._subscribers: List[Tuple[Callable[[PostEvent], None], Optional[frozenset]]] = []
+        self._stats = {
+            "polls": 0,
+            "diffs": 0,
+            "events": 0,
+        }
+
+    def subscribe(self, callback: Callable[[PostEvent], None],
+                  kinds: Optional[Iterable[str]] = None):
+        """
+        변경 이벤트 구독
+
+        Args:
+            callback: PostEvent를 받는 함수
+            kinds: 받을 이벤트 종류 (None이면 전부)
+        """
+        wanted = frozenset(kinds) if kinds else None
+        with self._lock:
+            self._subscribers.append((callback, wanted))
+
+    @property
+    def posts(self) -> Dict[str, Post]:
+        """마지막으로 동기화한 포스트 인덱스 {post_id: Post}"""
+        return self._index
+
+    def poll(self, max_age: Optional[float] = None) -> List[PostEvent]:
+        """
+        최신 스냅샷을 가져와 변경분을 구독자에게 전달
+
+        Args:
+            max_age: 스냅샷 TTL 재정의 (BoardSnapshotProvider.get 참고)
+
+        Returns:
+            이번에 전달한 이벤트 리스트
+
+        Raises:
+            requests.exceptions.RequestException: 스냅샷을 가져오지 못한 경우
+        """
+        snapshot = self.provider.get(max_age=max_age)
+        with self._lock:
+            self._stats["polls"] += 1
+            if snapshot.version == self._version:
+                return []
+            return self._apply_locked(snapshot)
+
+    def _apply_locked(self, snapshot: BoardSnapshot) -> List[PostEvent]:
+        events = diff_posts(self._index, snapshot.posts)
+        self._index = {post.id: post for post in snapshot.posts}
+        self._version = snapshot.version
+        self._stats["diffs"] += 1
+        self._stats["events"] += len(events)
+
+        for event in events:
+            for callback, wanted in self._subscribers:
+                if wanted is not None and event.kind not in wanted:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    # 구독자 하나의 오류가 다른 구독자에게 번지지 않도록 함
+                    print(f"Delta sync subscriber error ({event.kind} {event.post_id}): {e}")
+        return events
+
+    def stats(self) -> Dict[str, int]:
+        """
+        동기화 통계
+
+        Returns:
+            polls: poll() 호출 수
+            diffs: 실제로 비교를 수행한 횟수
+            events: 전달한 이벤트 수
+            tracked_posts: 현재 추적 중인 포스트 수
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["tracked_posts"] = len(self._index)
+        return stats
@@ -0,0 +1,316 @@
+"""
+Padlet 대량 게시 엔진
+병렬 전송 + 내용 기반 멱등 키 장부로 재실행해도 같은 게시물을 두 번 올리지 않음
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from padlet_async import DEFAULT_CONCURRENCY, Fanout
+
+DEFAULT_LEDGER_DB = os.getenv('PADLET_POST_LEDGER', os.path.join('css_art_map_data', 'post_ledger.sqlite'))
+
+# 장부 상태
+IN_FLIGHT = "in_flight"      # 전송 중 (프로세스가 죽으면 결과 불명)
+POSTED = "posted"            # 게시 완료
+UNKNOWN = "unknown"          # 네트워크 오류 등으로 게시 여부를 알 수 없음
+
+# 결과 상태
+SKIPPED = "skipped"          # 이미 게시된 항목 (또는 같은 배치 내 중복)
+FAILED = "failed"
+
+POST_REF_LENGTH = 16         # 포스트 본문에 넣는 멱등 키 앞부분 길이 (64비트)
+
+
+def idempotency_key(item: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> str:
+    """
+    항목 내용으로 멱등 키 생성
+
+    Args:
+        item: 게시할 항목
+        fields: 키에 포함할 필드 (None이면 전체)
+
+    Returns:
+        SHA-256 hex (같은 내용이면 항상 같은 키)
+    """
+    if fields is not None:
+        item = {name: item.get(name) for name in fields}
+    canonical = json.dumps(item, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def post_ref(key: str) -> str:
+    """포스트 본문에 넣어 두는 멱등 키 표시 (결과 불명 항목을 보드에서 다시 찾을 때 사용)"""
+    return key[:POST_REF_LENGTH]
+
+
+def is_rejected(status_code: Optional[int]) -> bool:
+    """서버가 요청을 확실히 거절했는지 (408/429를 뺀 4xx는 게시되지 않았음이 확실)"""
+    return bool(status_code) and 400 <= status_code < 500 and status_code not in (408, 429)
+
+
+class PostLedger:
+    """
+    게시 장부 (SQLite)
+
+    - reserve(): INSERT OR IGNORE로 키를 선점해 같은 키를 두 번 보내지 않음
+    - 확실히 거절된 요청(408/429를 뺀 4xx)은 키를 풀어서 재실행 시 다시 시도
+    - 결과를 모르는 요청(5xx, 408, 429, 타임아웃 등)은 UNKNOWN으로 남기고,
+      다시 보내기 전에 보드에서 먼저 찾아봄 (attempted_at: 첫 전송 시각)
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DEFAULT_LEDGER_DB
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ledger ("
+                " key TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " post_id TEXT,"
+                " error TEXT,"
+                " attempted_at REAL,"
+                " updated_at TEXT NOT NULL)"
+            )
+            # 이전 버전 장부에는 첫 전송 시각 열이 없음
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(ledger)")}
+            if "attempted_at" not in columns:
+                conn.execute("ALTER TABLE ledger ADD COLUMN attempted_at REAL")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def reserve(self, key: str, retry_unknown: bool = False) -> Optional[str]:
+        """
+        키 선점
+
+        Args:
+            key: 멱등 키
+            retry_unknown: 결과 불명(UNKNOWN/IN_FLIGHT) 항목도 다시 시도할지
+
+        Returns:
+            None이면 선점 성공 (전송해도 됨), 아니면 기존 상태
+        """
+        now = datetime.now().isoformat()
+        attempted_at = int(time.time())     # Padlet 생성 시각은 초 단위
+        with self._connect() as conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO ledger (key, status, attempted_at, updated_at) VALUES (?, ?, ?, ?)",
+                (key, IN_FLIGHT, attempted_at, now)
+            ).rowcount
+            if inserted:
+                return None
+
+            status = conn.execute("SELECT status FROM ledger WHERE key = ?", (key,)).fetchone()[0]
+            if retry_unknown and status in (UNKNOWN, IN_FLIGHT):
+                conn.execute(
+                    "UPDATE ledger SET status = ?, attempted_at = COALESCE(attempted_at, ?), updated_at = ?"
+                    " WHERE key = ?",
+                    (IN_FLIGHT, attempted_at, now, key)
+                )
+                return None
+            return status
+
+    def complete(self, key: str, post_id: Optional[str]):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE ledger SET status = ?, post_id = ?, error = NULL, updated_at = ? WHERE key = ?",
+                (POSTED, post_id, datetime.now().isoformat(), key)
+            )
+
+    def release(self, key: str):
+        """확실히 실패한 항목의 선점 해제 (다음 실행에서 다시 시도)"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM ledger WHERE key = ?", (key,))
+
+    def mark_unknown(self, key: str, error: str):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE ledger SET status = ?, error = ?, updated_at = ? WHERE key = ?",
+                (UNKNOWN, error, datetime.now().isoformat(), key)
+            )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT status, post_id, error, attempted_at, updated_at FROM ledger WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"status": row[0], "post_id": row[1], "error": row[2],
+                "attempted_at": row[3], "updated_at": row[4]}
+
+
+@dataclass(slots=True)
+class BulkResult:
+    """항목 하나의 게시 결과"""
+    index: int                      # 입력 순서
+    key: str
+    item: Dict[str, Any]
+    status: str                     # posted / skipped / failed
+    result: Dict[str, Any] = field(default_factory=dict)
+    latency: float = 0.0            # 요청 소요 시간 (초, 건너뛴 항목은 0)
+
+
+@dataclass
+class BulkStats:
+    """대량 게시 통계"""
+    submitted: int = 0
+    posted: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        """초당 게시 수"""
+        return self.posted / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> str:
+        return (f"posted {self.posted}, skipped {self.skipped}, failed {self.failed} "
+                f"in {self.elapsed:.2f}s ({self.throughput:.1f} posts/s, "
+                f"p50 {self.percentile(50) * 1000:.0f}ms, p95 {self.percentile(95) * 1000:.0f}ms)")
+
+
+class BulkPoster:
+    """
+    대량 게시 엔진
+
+    - 장부로 중복 게시 방지 (같은 배치 안의 중복도 한 번만 게시)
+    - 결과 불명 항목은 find_existing으로 보드에서 먼저 찾아보고, 없을 때만 다시 게시
+    - Fanout 세마포어로 동시 요청 수 제한
+    - 결과는 끝나는 순서대로 바로 반환
+    """
+
+    def __init__(self, post_func: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 ledger: Optional[PostLedger] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 key_func: Callable[[Dict[str, Any]], str] = idempotency_key,
+                 fanout: Optional[Fanout] = None,
+                 find_existing: Optional[Callable[[str, float], Optional[str]]] = None):
+        """
+        Args:
+            post_func: 항목 하나를 게시하는 함수 (본문에 post_ref(key)를 넣어야 find_existing으로 찾을 수 있음)
+            find_existing: (멱등 키, 첫 전송 시각) → 보드에 이미 있는 포스트 ID (없으면 None)
+        """
+        self.post_func = post_func
+        self.find_existing = find_existing
+        self.ledger = ledger or PostLedger()
+        self.key_func = key_func
+        self.fanout = fanout or Fanout(concurrency=concurrency)
+        self.stats = BulkStats()
+
+    def _timed_post(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        result = self.post_func(item)
+        return {"result": result, "latency": time.perf_counter() - started}
+
+    def iter_results(self, items: Iterable[Dict[str, Any]],
+                     retry_unknown: bool = False) -> Iterator[BulkResult]:
+        """
+        항목들을 게시하고 결과를 끝나는 순서대로 반환
+
+        Args:
+            items: 게시할 항목
+            retry_unknown: find_existing 없이도 결과 불명 항목을 다시 보낼지 (중복 게시 위험)
+
+        Yields:
+            BulkResult
+        """
+        stats = self.stats = BulkStats()
+        started = time.perf_counter()
+
+        pending = []
+        reserved = set()        # 이번 실행에서 선점한 키 (같은 배치 안의 중복은 장부를 보기 전에 건너뜀)
+        for index, item in enumerate(items):
+            stats.submitted += 1
+            key = self.key_func(item)
+            if key in reserved:
+                stats.skipped += 1
+                yield BulkResult(index, key, item, SKIPPED, {"ledger_status": IN_FLIGHT, "duplicate": True})
+                continue
+            reserved.add(key)
+            existing = self.ledger.reserve(key)
+            # IN_FLIGHT는 다른 실행이 아직 보내는 중일 수 있으므로 retry_unknown일 때만 확인
+            if existing == UNKNOWN or (existing == IN_FLIGHT and retry_unknown):
+                existing = self._reconcile(key, retry_unknown)
+            if existing is None:
+                pending.append((index, key, item))
+                continue
+            stats.skipped += 1
+            record = self.ledger.get(key) or {}
+            yield BulkResult(index, key, item, SKIPPED,
+                             {"ledger_status": existing, "post_id": record.get("post_id")})
+
+        for position, outcome in self.fanout.imap_unordered(self._timed_post,
+                                                            [item for _, _, item in pending]):
+            index, key, item = pending[position]
+            result = outcome.get("result", outcome)
+            latency = outcome.get("latency", 0.0)
+            stats.latencies.append(latency)
+
+            if "error" not in result:
+                post_id = (result.get("data") or {}).get("id")
+                self.ledger.complete(key, post_id)
+                stats.posted += 1
+                status = POSTED
+            else:
+                if is_rejected(result.get("status_code")):
+                    # 서버가 거절한 요청은 게시되지 않았으므로 다음 실행에서 재시도
+                    self.ledger.release(key)
+                else:
+                    self.ledger.mark_unknown(key, result["error"])
+                stats.failed += 1
+                status = FAILED
+
+            stats.elapsed = time.perf_counter() - started
+            yield BulkResult(index, key, item, status, result, latency)
+
+        stats.elapsed = time.perf_counter() - started
+
+    def _reconcile(self, key: str, retry_unknown: bool) -> Optional[str]:
+        """
+        결과 불명 항목 처리: 보드에 있으면 POSTED로 기록, 없으면 다시 선점
+
+        Returns:
+            None이면 다시 게시, 아니면 장부 상태 (건너뜀)
+        """
+        record = self.ledger.get(key) or {}
+        attempted_at = record.get("attempted_at")
+        # 첫 전송 시각이 없는 예전 기록은 본문에 키 표시도 없어 찾을 수 없음
+        if self.find_existing is None or attempted_at is None:
+            return self.ledger.reserve(key, retry_unknown=retry_unknown)
+
+        try:
+            post_id = self.find_existing(key, attempted_at)
+        except Exception as e:
+            print(f"Ledger reconcile error ({key[:8]}): {e}")
+            return record.get("status", UNKNOWN)
+        if post_id:
+            self.ledger.complete(key, post_id)
+            return POSTED
+        return self.ledger.reserve(key, retry_unknown=True)
+
+    def post_all(self, items: Iterable[Dict[str, Any]], retry_unknown: bool = False) -> List[BulkResult]:
+        """모든 결과를 입력 순서대로 반환"""
+        results = list(self.iter_results(items, retry_unknown=retry_unknown))
+        results.sort(key=lambda r: r.index)
+        return results
@@ -3,10 +3,16 @@ import json
 from datetime import datetime
 from typing import List, Dict, Optional
 from padlet_api_complete import PadletAPI, extract_board_id_from_url
+from padlet_async import AsyncPadletAPI, DEFAULT_CONCURRENCY
+from bulk_poster import BulkPoster, PostLedger, idempotency_key, post_ref, SKIPPED, FAILED
+from padlet_models import iter_posts
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# 멱등 키에 포함할 필드 (같은 보드에 같은 내용이면 같은 게시물로 간주)
+EXPERIENCE_KEY_FIELDS = ("board_id", "location", "title", "experience", "emotion", "image_url")
+
 class CSSArtMapProject:
     """
     "헤맨만큼 내 땅이다" - CSS 미술 탐험 지도 프로젝트
@@ -48,7 +54,8 @@ class CSSArtMapProject:
                                title: str,
                                experience: str,
                                emotion: str = "👍",
-                               image_url: Optional[str] = None) -> Dict:
+                               image_url: Optional[str] = None,
+                               ref: Optional[str] = None) -> Dict:
         """
         방문자 경험을 지도에 게시
         
@@ -58,6 +65,7 @@ class CSSArtMapProject:
             experience: 경험 내용
             emotion: 감정 이모지
             image_url: 사진 URL (선택)
+            ref: 본문 끝에 붙일 게시 표시 (대량 게시 때 같은 게시물을 다시 찾는 용도)
         
         Returns:
             생성된 게시물 정보
@@ -67,12 +75,15 @@ class CSSArtMapProject:
         
         location = self.locations[location_name]
         color = self.emotion_colors.get(emotion, "blue")
+        body = f"{experience}\n\n📍 {location['name']}\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        if ref:
+            body += f"\n🔖 {ref}"
         
         # 게시물 생성
         post_data = self.api.create_post(
             board_id=self.board_id,
             subject=f"{emotion} {title}",
-            body=f"{experience}\n\n📍 {location['name']}\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+            body=body,
             color=color,
             attachment_url=image_url,
             map_props={
@@ -100,29 +111,78 @@ class CSSArtMapProject:
             html_content=f"<p>{tip}</p>"
         )
     
-    def batch_post_experiences(self, experiences: List[Dict]) -> List[Dict]:
+    def batch_post_experiences(self, experiences: List[Dict],
+                               concurrency: int = DEFAULT_CONCURRENCY,
+                               ledger: Optional[PostLedger] = None,
+                               retry_unknown: bool = False) -> List[Dict]:
         """
-        여러 경험을 한번에 게시
+        여러 경험을 한번에 게시 (최대 concurrency개씩 병렬 전송)
+        
+        같은 내용은 장부(PostLedger)에 기록된 멱등 키로 한 번만 게시되므로
+        중간에 실패한 배치를 그대로 다시 실행해도 중복 게시물이 생기지 않는다.
+        결과를 알 수 없었던 항목은 본문의 키 표시로 보드에서 먼저 찾아보고 없을 때만 다시 게시한다.
         
         Args:
             experiences: 경험 정보 리스트
                 [{"location": "코엑스", "title": "...", "experience": "...", "emotion": "😍"}, ...]
+            concurrency: 동시에 보낼 최대 요청 수
+            ledger: 게시 장부 (None이면 기본 경로)
+            retry_unknown: 전송 중(IN_FLIGHT)으로 남은 항목도 확인 후 다시 보낼지
+                (다른 실행이 돌고 있지 않을 때만)
         
         Returns:
-            생성된 게시물들의 정보
+            생성된 게시물들의 정보 (입력 순서 유지)
         """
-        results = []
-        for exp in experiences:
-            result = self.post_visitor_experience(
+        def _key(exp: Dict) -> str:
+            return idempotency_key({"board_id": self.board_id, **exp}, EXPERIENCE_KEY_FIELDS)
+        
+        def _post(exp: Dict) -> Dict:
+            return self.post_visitor_experience(
                 location_name=exp.get("location"),
                 title=exp.get("title"),
                 experience=exp.get("experience"),
                 emotion=exp.get("emotion", "👍"),
-                image_url=exp.get("image_url")
+                image_url=exp.get("image_url"),
+                ref=post_ref(_key(exp))
             )
-            results.append(result)
-            print(f"Posted: {exp.get('title')} at {exp.get('location')}")
         
+        board_posts: Optional[List] = None
+        
+        def _find_existing(key: str, since: float) -> Optional[str]:
+            # 결과 불명 항목이 있을 때만 보드를 한 번 읽음
+            nonlocal board_posts
+            if board_posts is None:
+                items = self.api.iter_board_items(self.board_id, include_sections=False, types=("post",))
+                board_posts = list(iter_posts(items))
+            ref = post_ref(key)
+            for post in board_posts:
+                if post.created_at and ref in post.body and post.created_at.timestamp() >= since:
+                    return post.id
+            return None
+        
+        poster = BulkPoster(
+            _post,
+            ledger=ledger,
+            key_func=_key,
+            fanout=AsyncPadletAPI(api=self.api, concurrency=concurrency),
+            find_existing=_find_existing
+        )
+        
+        results: List[Optional[Dict]] = [None] * len(experiences)
+        
+        # 끝나는 순서대로 결과 출력
+        for outcome in poster.iter_results(experiences, retry_unknown=retry_unknown):
+            exp = outcome.item
+            if outcome.status == SKIPPED:
+                print(f"Skipped (already {outcome.result['ledger_status']}): "
+                      f"{exp.get('title')} at {exp.get('location')}")
+            else:
+                status = "Failed" if outcome.status == FAILED else "Posted"
+                print(f"{status}: {exp.get('title')} at {exp.get('location')} "
+                      f"({outcome.latency * 1000:.0f}ms)")
+            results[outcome.index] = outcome.result
+        
+        print(f"Batch: {poster.stats.summary()}")
         return results
     
     def get_popular_locations(self) -> Dict:
@@ -9,13 +9,61 @@ import time
 import schedule
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
-from collections import Counter, defaultdict
+from collections import Counter
 import re
+import shutil
+import requests
 from padlet_api_complete import PadletAPI, extract_board_id_from_url
+from padlet_async import AsyncPadletAPI
+from board_snapshot import BoardSnapshotProvider
+from board_sync import DeltaSync, PostEvent, ADDED, EDITED, MOVED, DELETED
+from padlet_models import Post
+from term_index import TermIndex
+from gallery_registry import REGISTRY
+from gallery_spatial import nearest_gallery
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# 감정 분석에 사용하는 이모지
+EMOTIONS = ["😍", "😴", "💸", "🤔", "👍"]
+
+# 트렌딩 키워드에서 제외할 단어
+KEYWORD_STOPWORDS = {"있습니다", "있어요", "합니다", "해요", "이", "가", "을", "를", "의", "에", "와", "과"}
+KEYWORD_TOKENIZER_VERSION = "hangul-1"
+
+
+def _location_key(post: Post) -> str:
+    """
+    인기 장소 집계 키
+
+    장소명이 레지스트리 갤러리면 정식 이름, 아니면 좌표로 가까운 갤러리,
+    둘 다 없으면 장소명 그대로 (표기가 달라도 같은 갤러리는 한 줄로 모임)
+    """
+    gallery = REGISTRY.resolve(post.location_name)
+    if (gallery is None or gallery.is_area) and post.has_location:
+        gallery = nearest_gallery(post.latitude, post.longitude) or gallery
+    return gallery.id if gallery else post.location_name
+
+
+def _bump(counter: Counter, keys, sign: int):
+    """카운터 값을 sign만큼 조정하고 0 이하가 된 항목은 제거"""
+    for key in keys:
+        counter[key] += sign
+        if counter[key] <= 0:
+            del counter[key]
+
+
+def _keywords(text: str) -> List[str]:
+    # 한글 단어만 추출 (한 글자 단어와 불용어 제외)
+    return [word for word in re.findall(r'[가-힣]+', text)
+            if len(word) > 1 and word not in KEYWORD_STOPWORDS]
+
+
+def _post_emotions(post: Post) -> List[str]:
+    return [emotion for emotion in EMOTIONS if emotion in post.subject or emotion in post.body]
+
+
 class CSSArtMapAutomation:
     """
     자동화된 Padlet 관리 시스템
@@ -30,6 +78,9 @@ class CSSArtMapAutomation:
         self.board_url = "https://padlet.com/CSS2025/css_-1_map-blwpq840o1u57awd"
         self.board_id = extract_board_id_from_url(self.board_url)
         
+        # 같은 시간대에 실행되는 작업들이 보드 스냅샷 하나를 공유
+        self.snapshots = BoardSnapshotProvider(self.api, self.board_id, ttl=120)
+        
         # 데이터 저장 경로
         self.data_dir = "css_art_map_data"
         os.makedirs(self.data_dir, exist_ok=True)
@@ -49,6 +100,64 @@ class CSSArtMapAutomation:
             "peak_hours": Counter(),
             "active_users": set()
         }
+        
+        # 포스트별 키워드 색인 (재시작해도 바뀐 포스트만 다시 토큰화)
+        self.keywords = TermIndex(os.path.join(self.data_dir, "keyword_index.json"),
+                                  tokenizer=_keywords, tokenizer_version=KEYWORD_TOKENIZER_VERSION)
+        self._keywords_pruned = False
+        
+        # 변경분 동기화: 작업마다 보드 전체를 다시 훑지 않고 바뀐 포스트만 처리
+        self.sync = DeltaSync(self.snapshots)
+        self._pending_moderation: Dict[str, Post] = {}
+        self._pending_questions: Dict[str, Post] = {}
+        self._backup_dirty = True
+        self._last_backup_file = None
+        
+        self.sync.subscribe(self._apply_stats_event)
+        self.sync.subscribe(self._queue_for_review, kinds=(ADDED, EDITED))
+        self.sync.subscribe(self._mark_backup_dirty)
+    
+    def _apply_stats_event(self, event: PostEvent):
+        """변경 이벤트로 누적 통계를 증분 갱신"""
+        old, new = event.previous, event.post
+        
+        if event.kind == ADDED:
+            self.stats["total_posts"] += 1
+            location = _location_key(new)
+            if location:
+                _bump(self.stats["popular_locations"], [location], 1)
+            if new.created_at:
+                _bump(self.stats["peak_hours"], [new.created_at.hour], 1)
+            _bump(self.stats["emotion_distribution"], _post_emotions(new), 1)
+            self.keywords.add(new.id, new.text)
+        elif event.kind == DELETED:
+            self.stats["total_posts"] -= 1
+            location = _location_key(old)
+            if location:
+                _bump(self.stats["popular_locations"], [location], -1)
+            if old.created_at:
+                _bump(self.stats["peak_hours"], [old.created_at.hour], -1)
+            _bump(self.stats["emotion_distribution"], _post_emotions(old), -1)
+            self.keywords.remove(old.id)
+        elif event.kind == MOVED:
+            location = _location_key(old)
+            if location:
+                _bump(self.stats["popular_locations"], [location], -1)
+            location = _location_key(new)
+            if location:
+                _bump(self.stats["popular_locations"], [location], 1)
+        elif event.kind == EDITED:
+            _bump(self.stats["emotion_distribution"], _post_emotions(old), -1)
+            _bump(self.stats["emotion_distribution"], _post_emotions(new), 1)
+            self.keywords.update(new.id, new.text)
+    
+    def _queue_for_review(self, event: PostEvent):
+        """새 글/수정된 글을 모더레이션과 자동 응답 대기열에 추가"""
+        self._pending_moderation[event.post_id] = event.post
+        self._pending_questions[event.post_id] = event.post
+    
+    def _mark_backup_dirty(self, event: PostEvent):
+        self._backup_dirty = True
     
     def backup_board_data(self) -> str:
         """
@@ -59,21 +168,40 @@ class CSSArtMapAutomation:
         """
         print(f"\n🔄 백업 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # 보드 데이터 가져오기
-        board_data = self.api.get_board(self.board_id, include_posts=True, include_sections=True)
-        
-        if "error" in board_data:
-            print(f"❌ 백업 실패: {board_data['error']}")
+        # 보드 스냅샷 가져오기 (다른 작업이 방금 가져온 것이 있으면 재사용)
+        try:
+            self.sync.poll()
+            snapshot = self.snapshots.get()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ 백업 실패: {e}")
             return None
         
+        # 마지막 백업 이후 바뀐 포스트가 없으면 생략
+        if not self._backup_dirty and self._last_backup_file:
+            print(f"⏭️ 변경 없음, 백업 생략 (마지막 백업: {self._last_backup_file})")
+            return self._last_backup_file
+        
         # 백업 파일명 (시간별)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = os.path.join(self.data_dir, f"backup_{timestamp}.json")
         
-        # JSON 저장
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(board_data, f, ensure_ascii=False, indent=2)
+        if snapshot.source_path and os.path.exists(snapshot.source_path):
+            # 스냅샷의 원본 응답을 그대로 복사 (다시 받거나 직렬화하지 않음)
+            shutil.copyfile(snapshot.source_path, backup_file)
+        else:
+            # 캐시 파일이 없으면 (검증자 없는 응답 등) 보드를 직접 받아 저장
+            board_data = self.api.get_board(self.board_id, include_posts=True, include_sections=True)
+            
+            if "error" in board_data:
+                print(f"❌ 백업 실패: {board_data['error']}")
+                return None
+            
+            # JSON 저장
+            with open(backup_file, 'w', encoding='utf-8') as f:
+                json.dump(board_data, f, ensure_ascii=False, indent=2)
         
+        self._backup_dirty = False
+        self._last_backup_file = backup_file
         print(f"✅ 백업 완료: {backup_file}")
         return backup_file
     
@@ -86,70 +214,34 @@ class CSSArtMapAutomation:
         """
         print(f"\n📊 활동 분석 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        board_data = self.api.get_board(self.board_id, include_posts=True)
-        
-        if "error" in board_data:
-            return {"error": board_data["error"]}
+        # 변경분만 반영해 누적 통계 갱신 (바뀐 포스트가 없으면 비교도 생략)
+        try:
+            self.sync.poll()
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
+        
+        # 첫 동기화 후에는 꺼져 있는 동안 삭제된 포스트를 색인에서 정리
+        if not self._keywords_pruned:
+            self.keywords.retain(self.sync.posts)
+            self._keywords_pruned = True
+        try:
+            self.keywords.save()
+        except OSError as e:
+            print(f"키워드 색인 저장 실패: {e}")
         
         analysis = {
             "timestamp": datetime.now().isoformat(),
-            "total_posts": 0,
-            "posts_by_location": defaultdict(int),
-            "posts_by_emotion": defaultdict(int),
-            "posts_by_hour": defaultdict(int),
+            "total_posts": self.stats["total_posts"],
+            "posts_by_location": dict(self.stats["popular_locations"]),
+            "posts_by_emotion": dict(self.stats["emotion_distribution"]),
+            "posts_by_hour": dict(self.stats["peak_hours"]),
             "most_active_time": None,
             "trending_keywords": [],
             "engagement_rate": 0
         }
         
-        posts = board_data.get("data", {}).get("relationships", {}).get("posts", {}).get("data", [])
-        analysis["total_posts"] = len(posts)
-        
-        # 실제 포스트 데이터가 included에 있다면 분석
-        included = board_data.get("included", [])
-        post_contents = []
-        
-        for item in included:
-            if item.get("type") == "post":
-                attributes = item.get("attributes", {})
-                content = attributes.get("content", {})
-                
-                # 텍스트 수집
-                subject = content.get("subject", "")
-                body = content.get("bodyHtml", "")
-                post_contents.append(f"{subject} {body}")
-                
-                # 위치 분석
-                map_props = attributes.get("mapProps", {})
-                if map_props.get("locationName"):
-                    analysis["posts_by_location"][map_props["locationName"]] += 1
-                
-                # 시간대 분석
-                created_at = attributes.get("createdAt", "")
-                if created_at:
-                    try:
-                        post_time = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                        hour = post_time.hour
-                        analysis["posts_by_hour"][hour] += 1
-                    except:
-                        pass
-                
-                # 감정 분석 (이모지 찾기)
-                emotions = ["😍", "😴", "💸", "🤔", "👍"]
-                for emotion in emotions:
-                    if emotion in subject or emotion in body:
-                        analysis["posts_by_emotion"][emotion] += 1
-        
-        # 키워드 추출 (간단한 버전)
-        all_text = " ".join(post_contents)
-        words = re.findall(r'[가-힣]+', all_text)  # 한글 단어만 추출
-        word_freq = Counter(words)
-        
-        # 불용어 제거 및 상위 키워드
-        stopwords = {"있습니다", "있어요", "합니다", "해요", "이", "가", "을", "를", "의", "에", "와", "과"}
-        filtered_words = [(word, count) for word, count in word_freq.most_common(20) 
-                         if word not in stopwords and len(word) > 1]
-        analysis["trending_keywords"] = filtered_words[:10]
+        # 상위 키워드 (불용어는 색인할 때 제외됨)
+        analysis["trending_keywords"] = self.keywords.top_k(10)
         
         # 가장 활발한 시간대
         if analysis["posts_by_hour"]:
@@ -167,6 +259,18 @@ class CSSArtMapAutomation:
         print(f"  - 주요 감정: {dict(analysis['posts_by_emotion'])}")
         print(f"  - 트렌딩 키워드: {[w[0] for w in analysis['trending_keywords'][:5]]}")
         
+        cache_stats = self.api.board_cache.stats()
+        print(f"  - 보드 캐시: 적중 {cache_stats['hits']}회 / 미스 {cache_stats['misses']}회, "
+              f"절약 {cache_stats['bytes_saved'] / 1024:.1f}KB")
+        snapshot_stats = self.snapshots.stats()
+        print(f"  - 보드 스냅샷: 조회 {snapshot_stats['fetches']}회 / "
+              f"재사용 {snapshot_stats['fetches_saved']}회 (v{snapshot_stats['version']})")
+        sync_stats = self.sync.stats()
+        print(f"  - 변경 동기화: 비교 {sync_stats['diffs']}회 / 이벤트 {sync_stats['events']}개")
+        keyword_stats = self.keywords.stats()
+        print(f"  - 키워드 색인: 포스트 {keyword_stats['documents']}개 / "
+              f"토큰화 {keyword_stats['tokenized']}회 / 생략 {keyword_stats['skipped']}회")
+        
         return analysis
     
     def moderate_content(self) -> List[Dict]:
@@ -178,43 +282,42 @@ class CSSArtMapAutomation:
         """
         print(f"\n🔍 콘텐츠 모더레이션: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        board_data = self.api.get_board(self.board_id, include_posts=True)
+        flagged_posts = []
         
-        if "error" in board_data:
+        # 마지막 검사 이후 추가/수정된 포스트만 검사
+        try:
+            self.sync.poll()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ 모더레이션 실패: {e}")
             return []
         
-        flagged_posts = []
-        included = board_data.get("included", [])
+        pending = list(self._pending_moderation.values())
+        self._pending_moderation.clear()
+        print(f"  검사 대상: 새 글/수정된 글 {len(pending)}개")
         
-        for item in included:
-            if item.get("type") == "post":
-                post_id = item.get("id")
-                attributes = item.get("attributes", {})
-                content = attributes.get("content", {})
-                
-                subject = content.get("subject", "")
-                body = content.get("bodyHtml", "")
-                full_text = f"{subject} {body}".lower()
-                
-                # 부적절한 단어 체크
-                for blocked_word in self.blocked_words:
-                    if blocked_word.lower() in full_text:
-                        flagged_posts.append({
-                            "post_id": post_id,
-                            "reason": f"금지 단어 포함: {blocked_word}",
-                            "subject": subject,
-                            "created_at": attributes.get("createdAt")
-                        })
-                        break
-                
-                # 스팸 패턴 체크 (연속된 특수문자, URL 남발 등)
-                if full_text.count("http") > 3:
+        for post in pending:
+            full_text = post.text.lower()
+            created_at = post.created_at.isoformat() if post.created_at else None
+            
+            # 부적절한 단어 체크
+            for blocked_word in self.blocked_words:
+                if blocked_word.lower() in full_text:
                     flagged_posts.append({
-                        "post_id": post_id,
-                        "reason": "과도한 링크 포함",
-                        "subject": subject,
-                        "created_at": attributes.get("createdAt")
+                        "post_id": post.id,
+                        "reason": f"금지 단어 포함: {blocked_word}",
+                        "subject": post.subject,
+                        "created_at": created_at
                     })
+                    break
+            
+            # 스팸 패턴 체크 (연속된 특수문자, URL 남발 등)
+            if full_text.count("http") > 3:
+                flagged_posts.append({
+                    "post_id": post.id,
+                    "reason": "과도한 링크 포함",
+                    "subject": post.subject,
+                    "created_at": created_at
+                })
         
         if flagged_posts:
             print(f"⚠️ 검토 필요 게시물 {len(flagged_posts)}개 발견")
@@ -285,39 +388,38 @@ class CSSArtMapAutomation:
         """
         print(f"\n💬 자동 응답 체크: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        board_data = self.api.get_board(self.board_id, include_posts=True)
-        
-        if "error" in board_data:
+        # 마지막 체크 이후 추가/수정된 포스트만 확인
+        try:
+            self.sync.poll()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ 자동 응답 체크 실패: {e}")
             return
         
-        included = board_data.get("included", [])
+        pending = list(self._pending_questions.values())
+        self._pending_questions.clear()
         
-        for item in included:
-            if item.get("type") == "post":
-                content = item.get("attributes", {}).get("content", {})
-                body = content.get("bodyHtml", "")
+        for post in pending:
+            # 질문 패턴 감지
+            if any(keyword in post.body for keyword in ["처음", "초보", "어디부터", "모르겠", "도와"]):
+                post_id = post.id
                 
-                # 질문 패턴 감지
-                if any(keyword in body for keyword in ["처음", "초보", "어디부터", "모르겠", "도와"]):
-                    post_id = item.get("id")
-                    
-                    # 이미 응답했는지 체크 (실제 구현시 DB 필요)
-                    # 여기서는 예시로만
-                    
-                    help_message = """
-                    <p>안녕하세요! 처음 오신 분을 위한 팁을 드릴게요 😊</p>
-                    <ul>
-                        <li>평일 오전이 가장 한가합니다</li>
-                        <li>프리즈는 코엑스, 키아프는 같은 장소입니다</li>
-                        <li>삼청동 작은 갤러리들도 놓치지 마세요</li>
-                        <li>편한 신발은 필수입니다!</li>
-                    </ul>
-                    <p>즐거운 관람 되세요! 🎨</p>
-                    """
-                    
-                    # 도움말 댓글 달기 (중복 방지 로직 필요)
-                    # self.api.create_comment(post_id, help_message)
-                    print(f"  ℹ️ 초보자 질문 감지: {content.get('subject', '')[:30]}...")
+                # 이미 응답했는지 체크 (실제 구현시 DB 필요)
+                # 여기서는 예시로만
+                
+                help_message = """
+                <p>안녕하세요! 처음 오신 분을 위한 팁을 드릴게요 😊</p>
+                <ul>
+                    <li>평일 오전이 가장 한가합니다</li>
+                    <li>프리즈는 코엑스, 키아프는 같은 장소입니다</li>
+                    <li>삼청동 작은 갤러리들도 놓치지 마세요</li>
+                    <li>편한 신발은 필수입니다!</li>
+                </ul>
+                <p>즐거운 관람 되세요! 🎨</p>
+                """
+                
+                # 도움말 댓글 달기 (중복 방지 로직 필요)
+                # self.api.create_comment(post_id, help_message)
+                print(f"  ℹ️ 초보자 질문 감지: {post.subject[:30]}...")
     
     def run_scheduled_tasks(self):
         """
@@ -399,6 +501,21 @@ class EventDayManager:
             }
         )
     
+    def create_live_event_posts(self, messages: List[Tuple[str, str]],
+                                concurrency: int = 4) -> List[Dict]:
+        """
+        여러 현장 메시지를 병렬로 게시
+        
+        Args:
+            messages: (메시지, 장소) 튜플 리스트
+            concurrency: 동시에 보낼 최대 요청 수
+        
+        Returns:
+            생성된 게시물들 (입력 순서 유지)
+        """
+        fanout = AsyncPadletAPI(api=self.api, concurrency=concurrency)
+        return fanout.map(lambda m: self.create_live_event_post(*m), messages)
+    
     def get_live_statistics(self) -> Dict:
         """
         행사용 실시간 통계 (큰 화면 표출용)
@@ -0,0 +1,154 @@
+"""
+대시보드 집계
+Padlet 데이터와 로컬 후기의 지표 카드/특별한 기록 값을 한 번의 순회로 계산하고
+데이터 버전이 바뀔 때만 다시 계산 (차트용 집계는 review_frame, 단어 빈도는 term_index 참고)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from geodesic import farthest_from
+
+# 서울 시청 좌표 (거리 계산 기준점)
+SEOUL_CITY_HALL = (37.5665, 126.9780)
+
+# Padlet 포스트의 기본 장소명 (집계에서 제외)
+DEFAULT_GALLERY_NAME = '갤러리'
+
+_HTML_TAG = re.compile('<.*?>')
+_WORD = re.compile(r'[가-힣]+|[a-zA-Z]+')
+
+# 불용어
+STOPWORDS = {'은', '는', '이', '가', '을', '를', '에', '의', '와', '과', '도', '로', '으로', '만', '라서', '하고', '지만', '에서', '으로서', '부터', '까지', '이고', '이며', '이나', '나', '고', '한', '하는', '할', '해', '했', '된', '되는', '되고', '되어', '됩니다', '합니다', '있습니다', '있다', '있고', '없다', '있는', '있어', '같은', '같다', 'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been', 'be'}
+
+# review_terms의 규칙이 바뀌면 올려서 저장된 단어 색인을 다시 만들게 함
+REVIEW_TERMS_VERSION = "review_terms-1"
+
+
+def review_terms(text: str) -> List[str]:
+    """후기 본문의 단어 (HTML 태그 제거 후 두 글자 이상 한글/영문 단어, 불용어 제외)"""
+    words = _WORD.findall(_HTML_TAG.sub('', text or '').lower())
+    return [w for w in words if len(w) > 1 and w not in STOPWORDS]
+
+
+@dataclass
+class PartialAggregates:
+    """레코드 묶음 하나(Padlet 또는 로컬)의 집계 결과"""
+    count: int = 0
+    locations: Set[str] = field(default_factory=set)
+    reviews: List[Dict[str, Any]] = field(default_factory=list)    # 본문이 있는 레코드
+    longest_review: Optional[Dict[str, Any]] = None
+    longest_length: int = -1
+    farthest_review: Optional[Dict[str, Any]] = None
+    max_distance: float = 0.0
+
+
+def aggregate_records(records: Iterable[Dict[str, Any]],
+                      exclude_gallery: Optional[str] = None) -> PartialAggregates:
+    """
+    레코드를 한 번 순회하며 모든 대시보드 지표 계산
+
+    Args:
+        records: reviews 형식 레코드 (gallery, review, latitude, longitude)
+        exclude_gallery: 장소 집계에서 제외할 이름 (Padlet 기본값)
+
+    Returns:
+        PartialAggregates
+    """
+    partial = PartialAggregates()
+    located: List[Dict[str, Any]] = []    # 좌표가 있는 후기 (거리는 끝에서 한 번에 계산)
+
+    for record in records:
+        partial.count += 1
+
+        gallery = record.get('gallery', '')
+        if gallery and gallery != exclude_gallery:
+            partial.locations.add(gallery)
+
+        text = record.get('review')
+        if not text:
+            continue
+        partial.reviews.append(record)
+
+        # 가장 긴 후기
+        if len(text) > partial.longest_length:
+            partial.longest_length = len(text)
+            partial.longest_review = record
+
+        if record.get('latitude') and record.get('longitude'):
+            located.append(record)
+
+    # 서울에서 가장 먼 후기 (숫자가 아닌 좌표는 NaN으로 제외)
+    index, distance = farthest_from(*SEOUL_CITY_HALL,
+                                    [r['latitude'] for r in located],
+                                    [r['longitude'] for r in located])
+    if index >= 0 and distance > partial.max_distance:
+        partial.max_distance = distance
+        partial.farthest_review = located[index]
+
+    return partial
+
+
+@dataclass
+class DashboardAggregates:
+    """대시보드에 표시하는 모든 지표"""
+    total_locations: int
+    total_reviews: int
+    padlet_count: int
+    all_reviews: List[Dict[str, Any]]
+    most_common_words: List[Tuple[str, int]]
+    longest_review: Optional[Dict[str, Any]]
+    farthest_review: Optional[Dict[str, Any]]
+    max_distance: float
+
+
+def merge_aggregates(padlet: PartialAggregates, local: PartialAggregates,
+                     most_common_words: Optional[List[Tuple[str, int]]] = None) -> DashboardAggregates:
+    """
+    Padlet/로컬 집계 합치기 (Padlet 쪽이 먼저 나온 것으로 간주해 동점 처리)
+
+    Args:
+        padlet: Padlet 집계
+        local: 로컬 후기 집계
+        most_common_words: 단어 색인(TermIndex.top_k)에서 구한 상위 단어
+    """
+    longest, farthest, max_distance = padlet.longest_review, padlet.farthest_review, padlet.max_distance
+    if local.longest_length > padlet.longest_length:
+        longest = local.longest_review
+    if local.max_distance > max_distance:
+        farthest, max_distance = local.farthest_review, local.max_distance
+
+    return DashboardAggregates(
+        total_locations=len(padlet.locations | local.locations),
+        total_reviews=padlet.count + local.count,
+        padlet_count=padlet.count,
+        all_reviews=padlet.reviews + local.reviews,
+        most_common_words=most_common_words or [],
+        longest_review=longest,
+        farthest_review=farthest,
+        max_distance=max_distance,
+    )
+
+
+class AggregateMemo:
+    """
+    마지막 키 하나만 기억하는 메모
+
+    키(스냅샷 버전, 로컬 후기 수 등)가 그대로면 계산 없이 이전 결과를 반환한다.
+    """
+
+    def __init__(self):
+        self.key: Optional[Hashable] = None
+        self.value: Any = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if self.key is not None and self.key == key:
+            self.hits += 1
+            return self.value
+        self.misses += 1
+        self.value = compute()
+        self.key = key
+        return self.value
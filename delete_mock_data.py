@@ -14,6 +14,9 @@ import requests
 import json
 import os
 import re
+import padlet_http
+from padlet_async import Fanout
+from padlet_models import Post, iter_posts
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
@@ -54,7 +57,7 @@ class PadletCleanup:
         params = {"include": "posts"}
         
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params)
+            response = padlet_http.request("GET", endpoint, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -70,7 +73,7 @@ class PadletCleanup:
         
         try:
             # We'll use a HEAD request to check if the endpoint exists without actually deleting
-            response = requests.head(delete_endpoint, headers=self.headers)
+            response = padlet_http.request("HEAD", delete_endpoint, headers=self.headers)
             delete_available = response.status_code != 404
         except:
             delete_available = False
@@ -97,56 +100,33 @@ class PadletCleanup:
                 return True
         return False
     
-    def analyze_post(self, post_data: Dict[str, Any], included_posts: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def analyze_post(self, post: Post) -> Optional[Dict[str, Any]]:
         """Analyze a single post to see if it matches removal criteria"""
-        post_id = post_data.get("id")
-        
-        # Find the full post data in included section
-        full_post = None
-        for included_post in included_posts:
-            if included_post.get("id") == post_id and included_post.get("type") == "post":
-                full_post = included_post
-                break
-        
-        if not full_post:
-            return None
-        
-        attributes = full_post.get("attributes", {})
-        content = attributes.get("content", {})
-        map_props = attributes.get("mapProps", {})
-        
-        # Extract post information
-        subject = content.get("subject", "")
-        body = content.get("body", "")
-        latitude = map_props.get("latitude")
-        longitude = map_props.get("longitude")
-        location_name = map_props.get("locationName", "")
-        
         # Check removal criteria
         reasons = []
         
         # Check Antarctica location
-        if latitude is not None and self.is_in_antarctica(latitude):
-            reasons.append(f"Located in Antarctica (lat: {latitude})")
+        if post.latitude is not None and self.is_in_antarctica(post.latitude):
+            reasons.append(f"Located in Antarctica (lat: {post.latitude})")
         
         # Check text content
-        text_fields = [subject, body, location_name]
+        text_fields = [post.subject, post.body, post.location_name]
         for field_name, field_value in zip(["subject", "body", "location"], text_fields):
             if self.contains_target_text(field_value):
                 reasons.append(f"Contains target text in {field_name}: '{field_value}'")
         
         if reasons:
             return {
-                "id": post_id,
-                "subject": subject,
-                "body": body,
-                "latitude": latitude,
-                "longitude": longitude,
-                "location_name": location_name,
-                "created_at": attributes.get("createdAt"),
-                "updated_at": attributes.get("updatedAt"),
+                "id": post.id,
+                "subject": post.subject,
+                "body": post.body,
+                "latitude": post.latitude,
+                "longitude": post.longitude,
+                "location_name": post.location_name,
+                "created_at": post.created_at.isoformat() if post.created_at else None,
+                "updated_at": post.updated_at.isoformat() if post.updated_at else None,
                 "reasons": reasons,
-                "full_content": content
+                "full_content": {"subject": post.subject, "body": post.body}
             }
         
         return None
@@ -172,36 +152,31 @@ class PadletCleanup:
         print(f"Board: {board_info.get('title', 'Unknown')}")
         print(f"Total posts: {len(posts_refs)}")
         
+        # Parse included posts once, keyed by id
+        posts_by_id = {post.id: post for post in iter_posts(included_data)}
+        
         # Analyze each post
         posts_to_remove = []
         all_posts_summary = []
         
         for post_ref in posts_refs:
-            analysis = self.analyze_post(post_ref, included_data)
+            post = posts_by_id.get(post_ref.get("id"))
+            if not post:
+                continue
+            
+            analysis = self.analyze_post(post)
             
             if analysis:
                 posts_to_remove.append(analysis)
             
             # Also collect summary for all posts
-            full_post = None
-            for included_post in included_data:
-                if (included_post.get("id") == post_ref.get("id") and 
-                    included_post.get("type") == "post"):
-                    full_post = included_post
-                    break
-            
-            if full_post:
-                attrs = full_post.get("attributes", {})
-                content = attrs.get("content", {})
-                map_props = attrs.get("mapProps", {})
-                
-                all_posts_summary.append({
-                    "id": post_ref.get("id"),
-                    "subject": content.get("subject", "")[:50] + "..." if len(content.get("subject", "")) > 50 else content.get("subject", ""),
-                    "latitude": map_props.get("latitude"),
-                    "longitude": map_props.get("longitude"),
-                    "created_at": attrs.get("createdAt")
-                })
+            all_posts_summary.append({
+                "id": post.id,
+                "subject": post.subject[:50] + "..." if len(post.subject) > 50 else post.subject,
+                "latitude": post.latitude,
+                "longitude": post.longitude,
+                "created_at": post.created_at.isoformat() if post.created_at else None
+            })
         
         return {
             "board_info": {
@@ -223,7 +198,7 @@ class PadletCleanup:
         endpoint = f"{self.base_url}/posts/{post_id}"
         
         try:
-            response = requests.delete(endpoint, headers=self.headers)
+            response = padlet_http.request("DELETE", endpoint, headers=self.headers)
             if response.status_code == 204:
                 return {"success": True, "message": "Post deleted successfully"}
             elif response.status_code == 404:
@@ -233,6 +208,11 @@ class PadletCleanup:
         except requests.exceptions.RequestException as e:
             return {"success": False, "message": str(e)}
 
+    def attempt_delete_posts(self, post_ids: List[str], concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Attempt to delete several posts in parallel (bounded by concurrency)"""
+        fanout = Fanout(concurrency=concurrency)
+        return fanout.map(self.attempt_delete_post, post_ids)
+
 
 def run_demonstration_mode():
     """Demonstration mode showing what the script would find and API limitations"""
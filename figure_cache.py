@@ -0,0 +1,177 @@
+"""
+차트 캐시
+Plotly 그림 객체를 (차트 id, 데이터 지문)별로 보관하고, 데이터가 그대로면
+그림을 다시 만들지 않고 저장된 객체를 바로 사용 (LRU, 개수/용량 상한)
+
+딕셔너리 스펙을 넘기면 st.plotly_chart가 go.Figure를 다시 만들며 검증하므로
+검증이 끝난 go.Figure를 그대로 돌려준다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024  # 8MB
+
+
+def data_fingerprint(*parts: Any) -> str:
+    """
+    차트 입력 데이터의 지문
+
+    Args:
+        parts: 차트를 그리는 데 쓰는 값 (리스트, 딕셔너리, pandas 객체 등)
+
+    Returns:
+        16자리 hex (같은 데이터면 항상 같은 값)
+    """
+    hasher = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        if hasattr(part, "to_json"):      # pandas Series/DataFrame
+            part = part.to_json(date_format="iso")
+        hasher.update(json.dumps(part, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8"))
+        hasher.update(b"\x1f")
+    return hasher.hexdigest()
+
+
+class FigureCache:
+    """
+    Plotly 그림 객체의 LRU 캐시
+
+    - 키는 (차트 id, 데이터 지문), 값은 go.Figure와 직렬화 크기 (크기는 저장할 때 한 번 계산)
+    - 개수(max_entries)나 전체 크기(max_bytes)를 넘으면 가장 오래 쓰지 않은 그림부터 제거
+    - 여러 세션(스레드)이 함께 사용해도 안전 (반환된 그림은 공유 객체이므로 수정하지 말 것)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[Hashable, str], Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, chart_id: Hashable, fingerprint: str) -> Optional[Any]:
+        """
+        캐시된 그림
+
+        Returns:
+            st.plotly_chart에 바로 넘길 수 있는 go.Figure (없으면 None)
+        """
+        key = (chart_id, fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        return entry[0]
+
+    def put(self, chart_id: Hashable, fingerprint: str, figure) -> Any:
+        """
+        그림 저장
+
+        Args:
+            chart_id: 차트 이름
+            fingerprint: data_fingerprint() 결과
+            figure: go.Figure (to_json()이 있는 객체, 크기 계산용)
+
+        Returns:
+            저장한 그림 (figure 그대로)
+        """
+        size = len(figure.to_json())
+        key = (chart_id, fingerprint)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if size <= self.max_bytes:
+                self._entries[key] = (figure, size)
+                self._bytes += size
+                self._evict_locked()
+        return figure
+
+    def get_or_build(self, chart_id: Hashable, fingerprint: str,
+                     builder: Callable[[], Any]) -> Any:
+        """캐시에 있으면 저장된 그림, 없으면 builder()로 그림을 만들어 저장 후 반환"""
+        figure = self.get(chart_id, fingerprint)
+        if figure is None:
+            figure = self.put(chart_id, fingerprint, builder())
+        return figure
+
+    def _evict_locked(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계
+
+        Returns:
+            hits, misses, evictions, entries(현재 개수), bytes(현재 직렬화 크기 합)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        return stats
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크: 캐시 미스 vs 딕셔너리 스펙 적중 vs 그림 객체 적중
+# ---------------------------------------------------------------------------
+
+def _render_cost(figure_or_spec) -> str:
+    """st.plotly_chart가 그림을 받아 전송용 JSON을 만드는 과정 (streamlit 1.28과 같은 호출)"""
+    import plotly.io
+    import plotly.tools
+    figure = plotly.tools.return_figure_from_figure_or_data(figure_or_spec, validate_figure=True)
+    return plotly.io.to_json(figure, validate=False)
+
+
+def _sample_heatmap():
+    import plotly.graph_objects as go
+    z = [[(row * 24 + col) % 17 for col in range(24)] for row in range(7)]
+    fig = go.Figure(data=go.Heatmap(z=z, x=list(range(24)), y=["월", "화", "수", "목", "금", "토", "일"],
+                                    colorscale="Purples"))
+    fig.update_layout(height=300, margin=dict(l=0, r=0, t=20, b=0))
+    return fig
+
+
+def run_benchmark(repeat: int = 50):
+    """미스(그림 생성 + 저장), 예전 적중(json.loads한 스펙), 지금 적중(그림 객체)의 렌더 준비 시간 비교"""
+    cache = FigureCache()
+    fingerprint = data_fingerprint("benchmark")
+
+    def _timed(func) -> float:
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - t0) / repeat * 1000
+
+    def _miss():
+        cache.clear()
+        _render_cost(cache.get_or_build("heatmap", fingerprint, _sample_heatmap))
+
+    spec = cache.put("heatmap", fingerprint, _sample_heatmap()).to_json()
+    miss = _timed(_miss)
+    dict_hit = _timed(lambda: _render_cost(json.loads(spec)))
+    figure_hit = _timed(lambda: _render_cost(cache.get_or_build("heatmap", fingerprint, _sample_heatmap)))
+    print(f"miss {miss:.2f}ms | dict spec hit {dict_hit:.2f}ms | figure hit {figure_hit:.2f}ms "
+          f"({miss / figure_hit:.1f}x faster than miss, {dict_hit / figure_hit:.1f}x faster than dict spec)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -94,14 +94,13 @@ def get_gallery_coordinates(gallery_name, custom_location=None):
     Returns:
         dict: {"lat": float, "lon": float} or None if not found
     """
-    # 정확한 매칭 시도
-    if gallery_name in GALLERY_COORDINATES:
-        return GALLERY_COORDINATES[gallery_name]
-    
-    # 부분 매칭 시도 (갤러리 이름이 포함된 경우)
-    for gallery, coords in GALLERY_COORDINATES.items():
-        if gallery_name in gallery or gallery in gallery_name:
-            return coords
+    # 레지스트리에서 이름/별칭 매칭, 없으면 n-gram 퍼지 검색으로 가장 비슷한 갤러리
+    # 직접 입력한 지역이 있으면 퍼지 검색 없이 정확한 이름/별칭만 (비슷한 이름의 다른 갤러리로 가지 않도록)
+    # (gallery_registry가 이 모듈을 임포트하므로 여기서 임포트)
+    from gallery_search import find_gallery
+    gallery = find_gallery(gallery_name, include_areas=False, fuzzy=not custom_location)
+    if gallery:
+        return {"lat": gallery.lat, "lon": gallery.lng}
     
     # 직접 입력 갤러리의 경우 지역별 좌표 사용
     if custom_location and custom_location in AREA_COORDINATES:
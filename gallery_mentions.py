@@ -0,0 +1,240 @@
+"""
+후기 본문 갤러리 언급 추출
+레지스트리의 모든 이름/별칭으로 Aho-Corasick 오토마톤을 한 번 만들고
+본문을 한 번 훑어 언급된 갤러리를 모두 찾음 (이름 안쪽의 띄어쓰기만 허용, 짧은 이름/영문 이름은 단어 경계 확인)
+"""
+
+import html
+import re
+from collections import deque
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from gallery_names import NAME_PARTS, fold_text, name_key
+from gallery_registry import REGISTRY, Gallery, GalleryRegistry
+
+MIN_MENTION_LENGTH = 2
+SHORT_MENTION_LENGTH = 3    # 이 길이 이하인 이름은 앞뒤가 글자(한글/영문/숫자)가 아닐 때만 인정
+
+# 일반 단어나 사람 이름과 겹쳐 본문에서는 갤러리로 보지 않는 별칭 (이름 입력란에서는 그대로 사용)
+AMBIGUOUS_MENTIONS = {
+    "박", "가나", "현대", "국제", "선재", "조현", "도산", "성수", "바톤", "페이스", "그래프", "아뜰리에",
+    "화큐", "삼성역", "송은", "김리아", "에스터", "전혁림", "바크", "가이아",
+    "sp", "pace", "graph", "baton",
+}
+
+# 짧은 이름 바로 뒤에 붙어도 단어 경계로 보는 조사 (예: "리움에서", "학고재의")
+PARTICLES = ("에서", "에는", "에도", "에", "은", "는", "이", "가", "을", "를", "의", "도", "와", "과",
+             "까지", "부터", "으로", "로", "랑", "이랑")
+
+_HTML_TAG = re.compile(r"<[^>]*>")
+
+
+class Mention(NamedTuple):
+    """본문의 갤러리 언급"""
+    gallery_id: str
+    start: int              # fold_text(본문)에서의 위치
+    end: int                # (끝 글자 다음 위치)
+    text: str               # 본문에 적힌 표기 (정규화된 형태)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _ends_word(folded: str, end: int) -> bool:
+    """end 위치에서 단어가 끝나는지 (뒤가 공백/끝이거나 조사 하나 뒤에 끝남)"""
+    if end >= len(folded) or not folded[end].isalnum():
+        return True
+    for particle in PARTICLES:
+        after = end + len(particle)
+        if folded.startswith(particle, end) and (after >= len(folded) or not folded[after].isalnum()):
+            return True
+    return False
+
+
+def _name_gaps(name: str, key: str) -> FrozenSet[int]:
+    """
+    이름 안에서 띄어쓰기를 허용할 위치 (키 앞에서부터 센 글자 수)
+
+    등록된 표기의 띄어쓰기 위치와, 키 앞뒤의 일반 단어(gallery_names.NAME_PARTS) 경계
+    (예: "양혜규 스튜디오" → {3, 4}, "갤러리현대" → {3})
+    """
+    gaps, position = set(), 0
+    for word in fold_text(name).split()[:-1]:
+        position += len(word)
+        gaps.add(position)
+    for part in NAME_PARTS:
+        if len(key) > len(part):
+            if key.startswith(part):
+                gaps.add(len(part))
+            if key.endswith(part):
+                gaps.add(len(key) - len(part))
+    return frozenset(gaps)
+
+
+class MentionAutomaton:
+    """
+    갤러리 이름 다중 패턴 매칭 (Aho-Corasick)
+
+    - 패턴은 name_key(공백 제거 키)로 등록하고 본문의 공백은 건너뛰며 훑되, 이름 안쪽의
+      허용된 위치(_name_gaps)에 있는 공백만 인정 ("갤러리 현대" = "갤러리현대", "문화 큐레이터" ≠ "화큐")
+    - 영문/숫자로 시작하거나 끝나는 패턴은 앞뒤가 영문/숫자가 아닐 때만 인정 ("pkm" ≠ "pkmx")
+    - SHORT_MENTION_LENGTH 이하의 짧은 패턴은 앞뒤가 단어 경계일 때만 인정 ("김송은" ≠ "송은",
+      뒤에 조사 하나는 허용: "리움에서" = "리움")
+    - 겹치는 언급은 먼저 시작하고 더 긴 쪽만 남김
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._patterns: List[Tuple[str, str]] = []     # 패턴 번호 → (키, 갤러리 id)
+        self._gaps: List[FrozenSet[int]] = []           # 패턴 번호 → 띄어쓰기 허용 위치
+        self._keys: Dict[str, int] = {}
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, name: str, gallery_id: str) -> bool:
+        """패턴 추가 (같은 키가 이미 있으면 띄어쓰기 위치만 합치고 False, 너무 짧아도 False)"""
+        key = name_key(name)
+        if len(key) < MIN_MENTION_LENGTH:
+            return False
+        if key in self._keys:
+            pattern = self._keys[key]
+            self._gaps[pattern] = self._gaps[pattern] | _name_gaps(name, key)
+            return False
+        pattern = len(self._patterns)
+        self._patterns.append((key, gallery_id))
+        self._gaps.append(_name_gaps(name, key))
+        self._keys[key] = pattern
+
+        state = 0
+        for ch in key:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state].append(pattern)
+        self._built = False
+        return True
+
+    def build(self) -> "MentionAutomaton":
+        """실패 링크 계산 (패턴을 모두 추가한 뒤 한 번, BFS)"""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+        self._built = True
+        return self
+
+    def find(self, text: str) -> List[Mention]:
+        """
+        본문에서 갤러리 언급 찾기
+
+        Args:
+            text: 본문 (HTML 태그/엔티티 포함 가능)
+
+        Returns:
+            [Mention, ...] 본문 순서 (겹치는 언급은 먼저 시작하고 더 긴 것 하나)
+        """
+        if not self._built:
+            self.build()
+        folded = fold_text(html.unescape(_HTML_TAG.sub(" ", text or "")))
+        goto, fail, output, patterns, gaps = self._goto, self._fail, self._output, self._patterns, self._gaps
+
+        found = []
+        consumed: List[int] = []        # 공백이 아닌 글자의 위치
+        state = 0
+        for i, ch in enumerate(folded):
+            if ch == " ":
+                continue
+            consumed.append(i)
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern in output[state]:
+                key, gallery_id = patterns[pattern]
+                span = consumed[-len(key):]
+                start = span[0]
+                if span[-1] - start + 1 > len(key) and any(
+                        span[j] - span[j - 1] > 1 and j not in gaps[pattern] for j in range(1, len(key))):
+                    continue    # 이름 안쪽이 아닌 곳의 띄어쓰기를 건너뛴 매칭
+                before = folded[start - 1] if start > 0 else " "
+                after = folded[i + 1] if i + 1 < len(folded) else " "
+                if len(key) <= SHORT_MENTION_LENGTH:
+                    if before.isalnum() or not _ends_word(folded, i + 1):
+                        continue
+                elif ((_is_word_char(key[0]) and _is_word_char(before))
+                      or (_is_word_char(key[-1]) and _is_word_char(after))):
+                    continue
+                found.append(Mention(gallery_id, start, i + 1, folded[start:i + 1]))
+
+        # 먼저 시작하고 긴 언급 우선, 겹치는 나머지는 버림
+        found.sort(key=lambda mention: (mention.start, -mention.end))
+        mentions, last_end = [], 0
+        for mention in found:
+            if mention.start >= last_end:
+                mentions.append(mention)
+                last_end = mention.end
+        return mentions
+
+
+def build_mention_automaton(registry: GalleryRegistry = REGISTRY) -> MentionAutomaton:
+    """레지스트리의 정식 이름, 영문명, 별칭으로 오토마톤 생성 (애매한 별칭 제외)"""
+    ambiguous = {name_key(name) for name in AMBIGUOUS_MENTIONS}
+    automaton = MentionAutomaton()
+    for gallery in registry.galleries(include_areas=True):
+        for name in (gallery.id, gallery.name_en) + gallery.aliases:
+            if name and name_key(name) not in ambiguous:
+                automaton.add(name, gallery.id)
+    return automaton.build()
+
+
+# 임포트할 때 한 번 생성
+MENTIONS = build_mention_automaton()
+
+
+def extract_mentions(text: str) -> List[Mention]:
+    """본문의 갤러리 언급 목록 (MentionAutomaton.find)"""
+    return MENTIONS.find(text)
+
+
+def mentioned_gallery(text: str, include_areas: bool = False) -> Optional[Gallery]:
+    """
+    본문이 가리키는 대표 갤러리
+
+    Args:
+        text: 제목/본문
+        include_areas: 갤러리 언급이 없을 때 지역(동네) 언급도 사용할지
+
+    Returns:
+        가장 많이 언급된 갤러리 (같으면 먼저 나온 것, 없으면 None)
+    """
+    counts: Dict[str, int] = {}
+    for mention in MENTIONS.find(text):
+        counts[mention.gallery_id] = counts.get(mention.gallery_id, 0) + 1
+
+    best, best_area = None, None
+    for gallery_id, count in counts.items():      # dict는 처음 나온 순서 유지
+        gallery = REGISTRY.get(gallery_id)
+        if gallery.is_area:
+            if best_area is None or count > counts[best_area.id]:
+                best_area = gallery
+        elif best is None or count > counts[best.id]:
+            best = gallery
+    return best or (best_area if include_areas else None)
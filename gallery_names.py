@@ -0,0 +1,97 @@
+"""
+갤러리 이름 정규화
+유니코드 NFC, 공백/문장부호 접기, 대소문자 무시, 띄어쓰기 무시 키를 한 번 컴파일한 표로 처리하고
+자주 나오는 이름은 크기 제한 LRU 캐시로 바로 반환
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict
+
+NAME_CACHE_SIZE = 8192
+
+# 공백으로 접을 문장부호 (괄호 포함, 가운뎃점/따옴표/대시 등 한글 문서에서 자주 쓰는 기호 포함)
+_PUNCTUATION = (
+    "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"
+    "·・‧•∙ㆍ‐‑‒–—―‘’‚‛“”„‟′″"
+    "「」『』〈〉《》【】〔〕（）［］｛｝、。，．：；！？～"
+)
+_FOLD = {ord(ch): " " for ch in _PUNCTUATION}
+# 전각 영숫자 → 반각 (예: "ＰＫＭ" → "PKM")
+_FOLD.update({code: code - 0xFEE0 for code in range(0xFF10, 0xFF5F) if code not in _FOLD})
+_FOLD[0x3000] = " "  # 전각 공백
+
+# 갤러리 이름 앞뒤에 붙는 일반 단어 (name_key 형태)
+NAME_PARTS = (
+    "갤러리", "미술관", "화랑", "아트", "스페이스", "센터", "스튜디오", "재단", "서울", "한남", "청담",
+    "gallery", "museum", "art", "space", "seoul",
+)
+
+_BRACKETED = re.compile(r"[\(\[（［【〔][^\)\]）］】〕]*[\)\]）］】〕]")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).translate(_FOLD).casefold().split())
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def normalize_name(text: str) -> str:
+    """
+    표시/비교용 정규화 이름
+
+    Args:
+        text: 원래 이름 (예: "Gallery  SP", "갤러리·진선")
+
+    Returns:
+        NFC, 문장부호를 공백으로, 대소문자 무시, 연속 공백을 하나로 (예: "gallery sp", "갤러리 진선")
+    """
+    return _normalize(text)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def name_key(text: str) -> str:
+    """
+    색인용 이름 키 (normalize_name에서 공백까지 제거해 띄어쓰기 무시)
+
+    예: "갤러리 진선" / "갤러리진선" / "갤러리·진선" → "갤러리진선"
+    """
+    return _normalize(text).replace(" ", "")
+
+
+def fold_text(text: str) -> str:
+    """
+    긴 본문용 정규화 (normalize_name과 같은 규칙, 캐시하지 않음)
+
+    후기 본문처럼 매번 다른 긴 문자열이 LRU 캐시를 밀어내지 않도록 따로 둔다.
+    """
+    return _normalize(text)
+
+
+def distinctive_key(text: str) -> str:
+    """이름 키에서 일반 단어(NAME_PARTS)를 뺀 고유한 부분 (예: "갤러리 현대" → "현대", "갤러리" → "")"""
+    key = name_key(text)
+    for part in NAME_PARTS:
+        key = key.replace(part, "")
+    return key
+
+
+def strip_brackets(text: str) -> str:
+    """괄호로 묶인 부분 제거 (예: "(삼청) PKM갤러리" → "PKM갤러리", "키아프 (COEX)" → "키아프")"""
+    return _BRACKETED.sub(" ", text).strip()
+
+
+def cache_info() -> Dict[str, int]:
+    """
+    캐시 통계
+
+    Returns:
+        hits, misses, size(현재 개수), maxsize (name_key 기준)
+    """
+    info = name_key.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
+
+
+def clear_cache():
+    normalize_name.cache_clear()
+    name_key.cache_clear()
@@ -0,0 +1,274 @@
+"""
+갤러리 레지스트리
+흩어져 있던 갤러리 표(updated_locations, gallery_coordinates, kmz_parser,
+웹폼 이름 매핑, 입력 별칭)를 임포트할 때 한 번 합쳐 정식 id, 별칭, 분류, 좌표를 관리하고
+정규화한 이름 → 갤러리 해시 색인으로 어떤 별칭이든 O(1)에 찾음
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from gallery_names import name_key, strip_brackets
+from updated_locations import COMPLETE_GALLERY_LOCATIONS, LOCATION_ALIASES
+from gallery_coordinates import GALLERY_COORDINATES, AREA_COORDINATES
+from kmz_parser import GALLERY_LOCATIONS as KMZ_LOCATIONS
+
+AREA_CATEGORY = "지역"
+
+# 좌표 출처 (앞일수록 정확)
+SOURCE_VERIFIED = "google_maps"     # updated_locations (구글 지도 확인)
+SOURCE_KMZ = "kmz"                  # kmz_parser (행사 지도 KMZ)
+SOURCE_AREA = "area"                # gallery_coordinates.AREA_COORDINATES (지역 대표 좌표)
+
+# 웹폼 드롭다운에 쓰는 이름 → 정식 id (예전 normalize_gallery_name의 매핑 표)
+FORM_NAMES = {
+    "프리즈 서울": "코엑스",
+    "프리즈 서울 (COEX)": "코엑스",
+    "키아프": "코엑스",
+    "키아프 (COEX)": "코엑스",
+    "갤러리 진선": "갤러리진선",
+    "우손갤러리 서울": "우손갤러리",
+    "초이앤초이 갤러리": "초이앤초이갤러리",
+    "바라캇 컨템포러리": "바라캇컨템포러리",
+    "BAIK ART Seoul": "백아트",
+    "갤러리 조선": "갤러리조선",
+    "아라리오갤러리 서울": "아라리오갤러리",
+    "재단법인 예울": "여재단",
+    "전혁림 (포즈뮤지엄사진)": "전혁림",
+    "(ICA) 우양미술관·더성북도원미술관": "우양미술관",
+    "(삼청) PKM갤러리": "PKM갤러리",
+    "갤러리 가이아": "갤러리가이아",
+    "갤러리 그라프": "갤러리그라프",
+    "갤러리 피치": "갤러리피치",
+    "갤러리 플래닛": "갤러리플래닛",
+    "갤러리위 청담": "갤러리위청담",
+    "Gladstone Gallery Seoul": "글래드스톤갤러리",
+    "White Cube Seoul": "화이트큐브서울",
+    "G Gallery 지갤러리": "G갤러리",
+    "LEE EUGEAN GALLERY 이유진갤러리": "이유진갤러리",
+    "송은": "송은아트스페이스",
+    "아뜰리에 에르메스": "아뜰리에에르메스",
+    "BHAK": "바크",
+    "갤러리 SP": "갤러리SP",
+    "가나아트 한남": "가나아트한남",
+    "타데우스 로팍 서울": "타데우스로팍",
+    "ThisWeekendRoom": "디스위켄드룸",
+    "조현화랑 서울": "조현화랑",
+    "두아르트 스퀘이라 서울": "두아르트",
+    "삼성미술관": "리움미술관",
+}
+
+# 입력 폼 자동완성 별칭 (예전 UserFriendlyInputSystem.location_aliases 중 LOCATION_ALIASES에 없던 것)
+INPUT_ALIASES = {
+    "코엑스": ["프리즈서울", "frieze seoul", "프리즈 서울", "키아프", "kiaf", "kiaf seoul"],
+    "삼청동": ["삼청", "삼청동길", "북촌"],
+    "한남동": ["한남"],
+    "성수동": ["성수", "뚝섬"],
+}
+
+# KMZ 표기가 정식 이름/영문명과 달라 자동으로 합쳐지지 않는 항목
+KMZ_NAMES = {
+    "리화랑": "이화익갤러리",
+}
+
+
+def _kmz_category(category: str) -> str:
+    """KMZ 폴더 이름을 분류로 (예: "한남 나이트 (9/2 화)" → "한남")"""
+    return category.split(" 나이트")[0]
+
+
+@dataclass(frozen=True)
+class Gallery:
+    """정식 갤러리 항목"""
+    id: str                                     # 정식 이름 (COMPLETE_GALLERY_LOCATIONS 키)
+    name_en: str
+    category: str
+    lat: float
+    lng: float
+    aliases: Tuple[str, ...] = field(default=(), compare=False)
+    source: str = SOURCE_VERIFIED
+
+    @property
+    def is_area(self) -> bool:
+        """갤러리가 아니라 동네(지역) 항목인지"""
+        return self.category == AREA_CATEGORY
+
+    @property
+    def coordinates(self) -> Tuple[float, float]:
+        return self.lat, self.lng
+
+
+class GalleryRegistry:
+    """
+    갤러리 레지스트리
+
+    - resolve(): 정식 이름, 영문명, 별칭, 웹폼 이름을 정규화한 키로 O(1) 조회
+    - 같은 키가 서로 다른 갤러리를 가리키면 먼저 등록된 쪽을 유지하고 conflicts에 기록
+    """
+
+    def __init__(self):
+        self._galleries: Dict[str, Gallery] = {}
+        self._aliases: Dict[str, List[str]] = {}
+        self._index: Dict[str, str] = {}            # 이름 키 → 정식 id
+        self.conflicts: List[Tuple[str, str, str]] = []   # (이름, 유지한 id, 무시한 id)
+
+    # ------------------------------------------------------------------
+    # 구성
+    # ------------------------------------------------------------------
+
+    def add_gallery(self, gallery_id: str, name_en: str, category: str,
+                    lat: float, lng: float, source: str = SOURCE_VERIFIED):
+        """정식 항목 추가 (이미 있으면 무시)"""
+        if gallery_id in self._galleries:
+            return
+        self._galleries[gallery_id] = Gallery(gallery_id, name_en, category, float(lat), float(lng),
+                                              source=source)
+        self._aliases[gallery_id] = []
+        self._index_name(gallery_id, gallery_id)
+        if name_en:
+            self._index_name(name_en, gallery_id)
+
+    def add_alias(self, alias: str, gallery_id: str):
+        """별칭 추가 (정식 id가 없으면 무시)"""
+        if gallery_id not in self._galleries or not alias:
+            return
+        if self._index_name(alias, gallery_id) and alias != gallery_id and alias not in self._aliases[gallery_id]:
+            self._aliases[gallery_id].append(alias)
+
+    def _index_name(self, name: str, gallery_id: str) -> bool:
+        key = name_key(name)
+        if not key:
+            return False
+        current = self._index.setdefault(key, gallery_id)
+        if current != gallery_id:
+            self.conflicts.append((name, current, gallery_id))
+            return False
+        return True
+
+    def freeze(self) -> "GalleryRegistry":
+        """별칭 목록을 Gallery 항목에 반영 (구성이 끝난 뒤 한 번 호출)"""
+        for gallery_id, gallery in self._galleries.items():
+            self._galleries[gallery_id] = Gallery(
+                gallery.id, gallery.name_en, gallery.category, gallery.lat, gallery.lng,
+                tuple(self._aliases[gallery_id]), gallery.source,
+            )
+        return self
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._galleries)
+
+    def __iter__(self) -> Iterator[Gallery]:
+        return iter(self._galleries.values())
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
+
+    def get(self, gallery_id: str) -> Optional[Gallery]:
+        """정식 id로 조회"""
+        return self._galleries.get(gallery_id)
+
+    def is_gallery(self, gallery_id: str) -> bool:
+        """정식 id가 (지역 항목이 아닌) 갤러리인지"""
+        gallery = self._galleries.get(gallery_id)
+        return gallery is not None and not gallery.is_area
+
+    def resolve(self, name: Optional[str]) -> Optional[Gallery]:
+        """
+        이름/별칭으로 갤러리 찾기
+
+        Args:
+            name: 정식 이름, 영문명, 별칭, 웹폼 이름 등 (gallery_names.name_key로 정규화해 비교)
+
+        Returns:
+            Gallery (없으면 None). 그대로 못 찾으면 괄호로 묶인 부분을 빼고 한 번 더 찾음
+            (예: "프리즈 서울 (COEX)" → "프리즈 서울")
+        """
+        if not name:
+            return None
+        gallery_id = self._index.get(name_key(name))
+        if gallery_id is None:
+            base = strip_brackets(name)
+            if base and base != name:
+                gallery_id = self._index.get(name_key(base))
+        return self._galleries[gallery_id] if gallery_id is not None else None
+
+    def canonical_name(self, name: str) -> str:
+        """정식 id (못 찾으면 입력 그대로)"""
+        gallery = self.resolve(name)
+        return gallery.id if gallery else name
+
+    def coordinates(self, name: str) -> Optional[Tuple[float, float]]:
+        """이름으로 (위도, 경도) (없으면 None)"""
+        gallery = self.resolve(name)
+        return gallery.coordinates if gallery else None
+
+    def galleries(self, include_areas: bool = False) -> List[Gallery]:
+        """등록 순서대로 갤러리 목록 (기본은 지역 항목 제외)"""
+        return [gallery for gallery in self._galleries.values() if include_areas or not gallery.is_area]
+
+    def by_category(self) -> Dict[str, List[Gallery]]:
+        """분류별 갤러리 목록"""
+        categories: Dict[str, List[Gallery]] = {}
+        for gallery in self._galleries.values():
+            categories.setdefault(gallery.category, []).append(gallery)
+        return categories
+
+    def names(self) -> Dict[str, str]:
+        """색인된 모든 이름 키 → 정식 id (복사본)"""
+        return dict(self._index)
+
+
+def build_registry() -> GalleryRegistry:
+    """
+    흩어진 갤러리 표를 합쳐 레지스트리 생성
+
+    우선순위: updated_locations 좌표가 기준이고, KMZ에만 있는 갤러리는 KMZ 좌표,
+    지역은 AREA_COORDINATES 좌표를 사용한다. 이름은 정식 이름/영문명을 먼저 색인하고
+    별칭은 앞서 색인된 이름을 덮어쓰지 않는다.
+    """
+    registry = GalleryRegistry()
+
+    # 1) 정식 이름/영문명
+    for gallery_id, info in COMPLETE_GALLERY_LOCATIONS.items():
+        registry.add_gallery(gallery_id, info.get("name", ""), info.get("category", ""),
+                             info["lat"], info["lng"])
+
+    # 2) KMZ: 같은 갤러리면 한국어 표기를 별칭으로, 없던 갤러리면 새 항목으로
+    for folder, galleries in KMZ_LOCATIONS.items():
+        for name, info in galleries.items():
+            target = (registry.get(KMZ_NAMES.get(name, ""))
+                      or registry.resolve(name)
+                      or registry.resolve(info.get("name_en")))
+            if target:
+                registry.add_alias(name, target.id)
+            else:
+                registry.add_gallery(name, info.get("name_en", ""), _kmz_category(folder),
+                                     info["lat"], info["lng"], source=SOURCE_KMZ)
+
+    # 3) 지역
+    for area, coords in AREA_COORDINATES.items():
+        registry.add_gallery(area, "", AREA_CATEGORY, coords["lat"], coords["lon"], source=SOURCE_AREA)
+
+    # 4) 별칭: 자동완성 별칭 → 웹폼 이름 → gallery_coordinates 표기
+    for gallery_id, aliases in LOCATION_ALIASES.items():
+        for alias in aliases:
+            registry.add_alias(alias, gallery_id)
+    for gallery_id, aliases in INPUT_ALIASES.items():
+        for alias in aliases:
+            registry.add_alias(alias, gallery_id)
+    for form_name, gallery_id in FORM_NAMES.items():
+        registry.add_alias(form_name, gallery_id)
+    for name in GALLERY_COORDINATES:
+        gallery = registry.resolve(name)
+        if gallery:
+            registry.add_alias(name, gallery.id)
+
+    return registry.freeze()
+
+
+# 임포트할 때 한 번 생성
+REGISTRY = build_registry()
@@ -0,0 +1,223 @@
+"""
+갤러리 퍼지 검색
+이름/별칭의 n-gram 역색인으로 오타나 부분 입력에도 가장 비슷한 갤러리 상위 k개를 반환
+(한글은 음절을 자모로 풀어 n-gram을 만들어 받침/모음 하나 틀린 입력도 찾음)
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from gallery_names import distinctive_key, name_key
+from gallery_registry import REGISTRY, Gallery, GalleryRegistry
+
+DEFAULT_NGRAM = 3
+FUZZY_MIN_SCORE = 0.7       # 이 점수 미만이면 같은 장소로 보지 않음
+GENERIC_FUZZY_MIN_SCORE = 0.85  # "갤러리 X"처럼 일반 단어가 점수를 부풀리는 짧은 검색어의 최소 점수
+MIN_DISTINCTIVE_LENGTH = 2  # 일반 단어를 뺀 부분이 이보다 짧으면 퍼지 검색하지 않음
+SHORT_DISTINCTIVE_LENGTH = 3
+
+_BOUNDARY = "\x02"          # 단어 앞뒤 표시 (짧은 이름도 n-gram이 생기도록)
+
+# 한글 음절 → 초성/중성/종성 자모 (11,172자 표를 한 번 만들어 str.translate로 분해)
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+_JAMO = {
+    code: (chr(0x1100 + (code - _HANGUL_BASE) // 588)
+           + chr(0x1161 + (code - _HANGUL_BASE) % 588 // 28)
+           + (chr(0x11A7 + (code - _HANGUL_BASE) % 28) if (code - _HANGUL_BASE) % 28 else ""))
+    for code in range(_HANGUL_BASE, _HANGUL_LAST + 1)
+}
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (예: "갤" → ㄱ + ㅐ + ㄹ, 그 외 문자는 그대로)"""
+    return text.translate(_JAMO)
+
+
+def ngrams(text: str, n: int = DEFAULT_NGRAM, jamo: bool = True) -> Set[str]:
+    """
+    검색용 n-gram 집합
+
+    Args:
+        text: 이름 (name_key로 정규화한 뒤 분해)
+        n: n-gram 길이
+        jamo: 한글을 자모로 풀어서 만들지
+
+    Returns:
+        n-gram 집합 (앞뒤 경계 표시 포함)
+    """
+    key = name_key(text)
+    if not key:
+        return set()
+    if jamo:
+        key = to_jamo(key)
+    padded = f"{_BOUNDARY}{key}{_BOUNDARY}"
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class Match(NamedTuple):
+    """검색 결과"""
+    id: Hashable            # 문서 id (갤러리 정식 이름)
+    score: float            # 0~1 (Dice 계수)
+    name: str               # 가장 비슷했던 이름/별칭
+
+
+class NgramIndex:
+    """
+    n-gram 역색인
+
+    - add(): 문서 id에 이름(별칭) 여러 개를 등록
+    - search(): 질의와 n-gram이 겹치는 이름만 모아 Dice 계수로 점수화하고 문서별 최고점 상위 k개 반환
+      (겹침 수는 포스팅 배열을 np.bincount로 한 번에 세므로 이름이 수천 개여도 1ms 안쪽)
+    """
+
+    def __init__(self, n: int = DEFAULT_NGRAM, jamo: bool = True):
+        self.n = n
+        self.jamo = jamo
+        self._postings: Dict[str, List[int]] = {}      # n-gram → 이름 번호 목록
+        self._entries: List[Tuple[Hashable, str]] = []  # 이름 번호 → (문서 id, 이름)
+        self._sizes: List[int] = []                     # 이름 번호 → n-gram 수
+        self._seen: Set[Tuple[Hashable, str]] = set()
+        self._arrays: Optional[Tuple[Dict[str, np.ndarray], np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, doc_id: Hashable, names: Iterable[str]):
+        """문서 id에 이름들을 등록 (같은 문서에 같은 키의 이름은 한 번만)"""
+        for name in names:
+            grams = ngrams(name, self.n, self.jamo)
+            marker = (doc_id, name_key(name))
+            if not grams or marker in self._seen:
+                continue
+            self._seen.add(marker)
+            entry = len(self._entries)
+            self._entries.append((doc_id, name))
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(entry)
+        self._arrays = None
+
+    def _compiled(self) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """포스팅 목록을 배열로 (add() 뒤 첫 검색에서 한 번)"""
+        if self._arrays is None:
+            postings = {gram: np.asarray(entries, dtype=np.intp) for gram, entries in self._postings.items()}
+            self._arrays = (postings, np.asarray(self._sizes, dtype=np.float64))
+        return self._arrays
+
+    def search(self, query: str, k: int = 5, min_score: float = 0.0,
+               accept: Optional[Callable[[Hashable], bool]] = None) -> List[Match]:
+        """
+        비슷한 문서 상위 k개
+
+        Args:
+            query: 검색어 (오타, 띄어쓰기, 일부만 입력해도 됨)
+            k: 개수
+            min_score: 이 점수 미만은 제외
+            accept: 문서 id를 받아 후보로 쓸지 정하는 함수 (없으면 모두)
+
+        Returns:
+            [Match(id, score, name), ...] 점수 높은 순
+        """
+        grams = ngrams(query, self.n, self.jamo)
+        if not grams or not self._entries:
+            return []
+        postings, sizes = self._compiled()
+        hits = [postings[gram] for gram in grams if gram in postings]
+        if not hits:
+            return []
+
+        overlaps = np.bincount(np.concatenate(hits), minlength=len(sizes))
+        candidates = np.flatnonzero(overlaps)
+        scores = 2.0 * overlaps[candidates] / (len(grams) + sizes[candidates])
+        passed = scores >= min_score
+        candidates, scores = candidates[passed], scores[passed]
+
+        matches: List[Match] = []
+        seen: Set[Hashable] = set()
+        for i in np.argsort(-scores, kind="stable"):
+            doc_id, name = self._entries[candidates[i]]
+            if doc_id in seen:
+                continue
+            seen.add(doc_id)
+            if accept is None or accept(doc_id):
+                matches.append(Match(doc_id, float(scores[i]), name))
+                if len(matches) >= k:
+                    break
+        return matches
+
+
+def build_gallery_index(registry: GalleryRegistry = REGISTRY) -> NgramIndex:
+    """레지스트리의 정식 이름, 영문명, 별칭으로 색인 생성"""
+    index = NgramIndex()
+    for gallery in registry.galleries(include_areas=True):
+        index.add(gallery.id, (gallery.id, gallery.name_en) + gallery.aliases)
+    return index
+
+
+# 임포트할 때 한 번 생성
+GALLERY_INDEX = build_gallery_index()
+
+
+def search_galleries(query: str, k: int = 5, min_score: float = 0.0,
+                     include_areas: bool = True) -> List[Match]:
+    """
+    갤러리 퍼지 검색
+
+    Args:
+        query: 검색어
+        k: 개수
+        min_score: 최소 점수 (0~1)
+        include_areas: 지역(동네) 항목도 포함할지
+
+    Returns:
+        [Match(갤러리 정식 이름, 점수, 비슷한 이름), ...]
+    """
+    accept = None if include_areas else (lambda gallery_id: not REGISTRY.get(gallery_id).is_area)
+    return GALLERY_INDEX.search(query, k, min_score, accept)
+
+
+def fuzzy_min_score(query: str, min_score: float = FUZZY_MIN_SCORE) -> Optional[float]:
+    """
+    검색어에 적용할 퍼지 검색 최소 점수
+
+    "갤러리", "갤러리 수"처럼 일반 단어를 빼면 거의 남지 않는 검색어는 다른 갤러리와
+    "갤러리" n-gram만으로 높은 점수가 나오므로 퍼지 검색하지 않거나 기준을 높인다.
+
+    Returns:
+        최소 점수 (퍼지 검색하면 안 되는 검색어는 None)
+    """
+    distinctive = distinctive_key(query)
+    if len(distinctive) < MIN_DISTINCTIVE_LENGTH:
+        return None
+    if len(distinctive) <= SHORT_DISTINCTIVE_LENGTH and distinctive != name_key(query):
+        return max(min_score, GENERIC_FUZZY_MIN_SCORE)
+    return min_score
+
+
+def find_gallery(query: Optional[str], min_score: float = FUZZY_MIN_SCORE,
+                 include_areas: bool = True, fuzzy: bool = True) -> Optional[Gallery]:
+    """
+    이름으로 갤러리 하나 찾기 (정확한 이름/별칭이 먼저, 없으면 가장 비슷한 것)
+
+    Args:
+        query: 검색어
+        min_score: 퍼지 검색 최소 점수 (짧거나 일반적인 검색어는 fuzzy_min_score로 더 엄격하게)
+        include_areas: 지역(동네) 항목도 포함할지
+        fuzzy: False면 정확한 이름/별칭만
+
+    Returns:
+        Gallery (min_score 이상인 후보가 없으면 None)
+    """
+    if not query:
+        return None
+    gallery = REGISTRY.resolve(query)
+    if gallery is None and fuzzy:
+        score = fuzzy_min_score(query, min_score)
+        matches = search_galleries(query, 1, score, include_areas) if score is not None else []
+        gallery = REGISTRY.get(matches[0].id) if matches else None
+    if gallery is not None and gallery.is_area and not include_areas:
+        return None
+    return gallery
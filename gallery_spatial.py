@@ -0,0 +1,141 @@
+"""
+갤러리 공간 색인
+레지스트리 좌표를 격자 칸으로 나눠 칸 키 순으로 정렬해 두고, 좌표가 주어지면
+주변 칸만 이진 탐색(O(log n))으로 찾아 반경 안의 가장 가까운 갤러리를 반환
+(여러 좌표는 NumPy로 한 번에 처리)
+"""
+
+import math
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from geodesic import EARTH_RADIUS_KM, as_coordinates, nearest_each, paired_distances
+from gallery_registry import REGISTRY, Gallery
+
+KM_PER_DEG_LAT = math.radians(1) * EARTH_RADIUS_KM     # Haversine 거리와 같은 구 반지름 (≈111.19km)
+CELL_PAD = 1.0001           # 부동소수점 오차로 반경 경계의 점이 옆 칸 밖으로 밀리지 않도록 칸을 약간 넓힘
+SNAP_RADIUS_KM = 0.15       # 이 거리 안에 등록된 갤러리가 있으면 그 갤러리로 봄
+MAX_RINGS = 8               # 반경이 칸보다 이만큼 넘게 크면 격자 대신 전체 비교
+
+_OFFSET = 1 << 24           # 칸 번호를 음수가 아니게
+_SPAN = 1 << 25
+
+
+class GridIndex:
+    """
+    격자 공간 색인
+
+    - 칸 크기(cell_km)는 보통 스냅 반경과 같게 두어 주변 3×3 칸만 보면 되도록 함
+    - 칸 키를 정렬한 배열에서 np.searchsorted로 칸을 찾으므로 조회는 O(log n)
+    - nearest_each()는 모든 좌표의 주변 칸을 한 번에 찾아 거리도 한 번에 계산
+    """
+
+    def __init__(self, lats: Iterable, lons: Iterable, cell_km: float = SNAP_RADIUS_KM):
+        self.cell_km = cell_km
+        self._lat, self._lon = as_coordinates(lats, lons)
+        valid = np.flatnonzero(np.isfinite(self._lat) & np.isfinite(self._lon))
+
+        # 경도 방향 칸 너비는 가장 높은 위도(+1도 여유)에서도 cell_km 이상이 되도록
+        max_lat = min(float(np.abs(self._lat[valid]).max()) + 1.0, 89.0) if len(valid) else 0.0
+        self._deg_lat = cell_km * CELL_PAD / KM_PER_DEG_LAT
+        self._deg_lon = cell_km * CELL_PAD / (KM_PER_DEG_LAT * math.cos(math.radians(max_lat)))
+
+        keys = self._keys_for(*self._cells(self._lat[valid], self._lon[valid]))
+        order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[order]
+        self._points = valid[order]                 # 정렬 순서 → 원래 인덱스
+        _, counts = np.unique(self._sorted_keys, return_counts=True)
+        self._max_bucket = int(counts.max()) if len(counts) else 0
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cells(self, lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return (np.floor(lats / self._deg_lat).astype(np.int64),
+                np.floor(lons / self._deg_lon).astype(np.int64))
+
+    @staticmethod
+    def _keys_for(rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return (rows + _OFFSET) * _SPAN + (cols + _OFFSET)
+
+    def nearest_each(self, lats: Iterable, lons: Iterable,
+                     max_km: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 좌표 각각에 대해 반경 안의 가장 가까운 점
+
+        Args:
+            lats, lons: 찾을 좌표 목록 (N개)
+            max_km: 반경 (기본값은 칸 크기)
+
+        Returns:
+            (점 인덱스 배열, 거리 배열) - 반경 안에 없거나 좌표가 잘못된 항목은 인덱스 -1, 거리 NaN
+        """
+        lat, lon = as_coordinates(lats, lons)
+        max_km = self.cell_km if max_km is None else max_km
+        rings = max(1, math.ceil(max_km / self.cell_km))
+        if rings > MAX_RINGS:
+            return nearest_each(lat, lon, self._lat, self._lon, max_km=max_km)
+
+        best_index = np.full(len(lat), -1, dtype=np.intp)
+        best_distance = np.full(len(lat), np.inf)
+        queries = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+        if len(queries) and len(self._points):
+            rows, cols = self._cells(lat[queries], lon[queries])
+            for d_row in range(-rings, rings + 1):
+                for d_col in range(-rings, rings + 1):
+                    keys = self._keys_for(rows + d_row, cols + d_col)
+                    lo = np.searchsorted(self._sorted_keys, keys, side="left")
+                    hi = np.searchsorted(self._sorted_keys, keys, side="right")
+                    # 칸마다 점 수가 다르므로 j번째 점을 가진 칸끼리 묶어 계산
+                    for j in range(self._max_bucket):
+                        has = lo + j < hi
+                        if not has.any():
+                            break
+                        query = queries[has]
+                        point = self._points[lo[has] + j]
+                        distance = paired_distances(lat[query], lon[query], self._lat[point], self._lon[point])
+                        closer = distance < best_distance[query]
+                        best_distance[query[closer]] = distance[closer]
+                        best_index[query[closer]] = point[closer]
+
+        unmatched = best_distance > max_km
+        best_index[unmatched] = -1
+        best_distance[unmatched] = np.nan
+        return best_index, best_distance
+
+    def nearest(self, lat: float, lon: float, max_km: Optional[float] = None) -> Tuple[int, float]:
+        """
+        한 좌표에서 반경 안의 가장 가까운 점
+
+        Returns:
+            (점 인덱스, 거리 km) - 없으면 (-1, NaN)
+        """
+        index, distance = self.nearest_each([lat], [lon], max_km)
+        return int(index[0]), float(distance[0])
+
+
+# 임포트할 때 한 번 생성 (지역 항목은 스냅 대상에서 제외)
+_SNAP_GALLERIES: List[Gallery] = REGISTRY.galleries()
+GALLERY_GRID = GridIndex([gallery.lat for gallery in _SNAP_GALLERIES],
+                         [gallery.lng for gallery in _SNAP_GALLERIES])
+
+
+def nearest_gallery(lat: Optional[float], lng: Optional[float],
+                    max_km: float = SNAP_RADIUS_KM) -> Optional[Gallery]:
+    """좌표에서 반경 안의 가장 가까운 등록 갤러리 (없으면 None)"""
+    if lat is None or lng is None:
+        return None
+    index, _ = GALLERY_GRID.nearest(lat, lng, max_km)
+    return _SNAP_GALLERIES[index] if index >= 0 else None
+
+
+def snap_to_galleries(lats: Iterable, lngs: Iterable, max_km: float = SNAP_RADIUS_KM) -> List[Optional[str]]:
+    """
+    좌표 목록을 한 번에 가장 가까운 등록 갤러리 이름으로 변환
+
+    Returns:
+        갤러리 정식 이름 리스트 (반경 안에 없으면 None)
+    """
+    index, _ = GALLERY_GRID.nearest_each(lats, lngs, max_km)
+    return [_SNAP_GALLERIES[i].id if i >= 0 else None for i in index]
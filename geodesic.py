@@ -0,0 +1,179 @@
+"""
+거리 계산 도구
+NumPy 배열로 한 점→여러 점 거리, 쌍별 거리 행렬, k-최근접 검색을 한 번에 계산 (Haversine)
+"""
+
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def as_coordinates(lats: Iterable, lons: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    위도/경도 목록을 float 배열로 변환
+
+    숫자로 바꿀 수 없는 값(None, 빈 문자열 등)은 NaN이 되어 거리도 NaN으로 나온다.
+
+    Args:
+        lats: 위도 목록
+        lons: 경도 목록
+
+    Returns:
+        (위도 배열, 경도 배열)
+    """
+    def convert(values):
+        result = []
+        for value in values:
+            try:
+                result.append(float(value))
+            except (TypeError, ValueError):
+                result.append(np.nan)
+        return np.asarray(result, dtype=np.float64)
+
+    if isinstance(lats, np.ndarray) and lats.dtype.kind == "f":
+        lat_array = lats.astype(np.float64, copy=False)
+    else:
+        lat_array = convert(lats)
+    if isinstance(lons, np.ndarray) and lons.dtype.kind == "f":
+        lon_array = lons.astype(np.float64, copy=False)
+    else:
+        lon_array = convert(lons)
+    if lat_array.shape != lon_array.shape:
+        raise ValueError("lats and lons must have the same length")
+    return lat_array, lon_array
+
+
+def _haversine(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """라디안 좌표 배열(브로드캐스트 가능) 사이의 거리 (km)"""
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 좌표 사이의 거리 (km)"""
+    return float(_haversine(np.radians(lat1), np.radians(lon1), np.radians(lat2), np.radians(lon2)))
+
+
+def distances_from(lat: float, lon: float, lats: Iterable, lons: Iterable) -> np.ndarray:
+    """
+    한 점에서 여러 점까지의 거리
+
+    Args:
+        lat, lon: 기준점
+        lats, lons: 대상 좌표 목록
+
+    Returns:
+        거리 배열 (km, 좌표가 잘못된 항목은 NaN)
+    """
+    lat_array, lon_array = as_coordinates(lats, lons)
+    return _haversine(np.radians(lat), np.radians(lon), np.radians(lat_array), np.radians(lon_array))
+
+
+def paired_distances(lats_a: Iterable, lons_a: Iterable,
+                     lats_b: Iterable, lons_b: Iterable) -> np.ndarray:
+    """
+    같은 위치끼리 짝지은 거리 (a[i] ↔ b[i])
+
+    Returns:
+        거리 배열 (km, 좌표가 잘못된 항목은 NaN)
+    """
+    lat_a, lon_a = as_coordinates(lats_a, lons_a)
+    lat_b, lon_b = as_coordinates(lats_b, lons_b)
+    return _haversine(np.radians(lat_a), np.radians(lon_a), np.radians(lat_b), np.radians(lon_b))
+
+
+def pairwise_distances(lats_a: Iterable, lons_a: Iterable,
+                       lats_b: Optional[Iterable] = None,
+                       lons_b: Optional[Iterable] = None) -> np.ndarray:
+    """
+    두 좌표 집합 사이의 거리 행렬
+
+    Args:
+        lats_a, lons_a: 행 좌표 (N개)
+        lats_b, lons_b: 열 좌표 (M개, 생략하면 a와 같은 집합)
+
+    Returns:
+        (N, M) 거리 행렬 (km)
+    """
+    lat_a, lon_a = as_coordinates(lats_a, lons_a)
+    if lats_b is None or lons_b is None:
+        lat_b, lon_b = lat_a, lon_a
+    else:
+        lat_b, lon_b = as_coordinates(lats_b, lons_b)
+    lat_a, lon_a = np.radians(lat_a)[:, None], np.radians(lon_a)[:, None]
+    lat_b, lon_b = np.radians(lat_b)[None, :], np.radians(lon_b)[None, :]
+    return _haversine(lat_a, lon_a, lat_b, lon_b)
+
+
+def k_nearest(lat: float, lon: float, lats: Iterable, lons: Iterable,
+              k: int = 1, max_km: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    한 점에서 가까운 k개 좌표
+
+    Args:
+        lat, lon: 기준점
+        lats, lons: 후보 좌표 목록
+        k: 반환할 개수
+        max_km: 이 거리보다 먼 후보는 제외
+
+    Returns:
+        (후보 인덱스 배열, 거리 배열) - 가까운 순, 좌표가 잘못된 후보는 제외
+    """
+    distances = distances_from(lat, lon, lats, lons)
+    valid = np.flatnonzero(~np.isnan(distances))
+    if max_km is not None:
+        valid = valid[distances[valid] <= max_km]
+    if k < len(valid):
+        valid = valid[np.argpartition(distances[valid], k)[:k]]
+    order = valid[np.argsort(distances[valid], kind="stable")]
+    return order, distances[order]
+
+
+def nearest_each(lats: Iterable, lons: Iterable,
+                 ref_lats: Sequence[float], ref_lons: Sequence[float],
+                 max_km: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 점 각각에 대해 가장 가까운 기준 좌표 (갤러리 스냅 등)
+
+    Args:
+        lats, lons: 찾을 좌표 목록 (N개)
+        ref_lats, ref_lons: 기준 좌표 목록 (M개)
+        max_km: 이 거리보다 멀면 매칭하지 않음
+
+    Returns:
+        (기준 인덱스 배열, 거리 배열) - 매칭되지 않은 항목은 인덱스 -1, 거리 NaN
+    """
+    lat_array, lon_array = as_coordinates(lats, lons)
+    if len(lat_array) == 0 or len(ref_lats) == 0:
+        return np.full(len(lat_array), -1, dtype=np.intp), np.full(len(lat_array), np.nan)
+
+    matrix = pairwise_distances(lat_array, lon_array, ref_lats, ref_lons)
+    matrix = np.where(np.isnan(matrix), np.inf, matrix)
+    index = np.argmin(matrix, axis=1)
+    distances = matrix[np.arange(len(index)), index]
+
+    unmatched = ~np.isfinite(distances)
+    if max_km is not None:
+        unmatched |= distances > max_km
+    index = np.where(unmatched, -1, index)
+    distances = np.where(unmatched, np.nan, distances)
+    return index, distances
+
+
+def farthest_from(lat: float, lon: float, lats: Iterable, lons: Iterable) -> Tuple[int, float]:
+    """
+    한 점에서 가장 먼 좌표
+
+    Returns:
+        (인덱스, 거리 km) - 유효한 좌표가 없으면 (-1, 0.0)
+        거리가 같으면 앞의 항목이 선택된다.
+    """
+    distances = distances_from(lat, lon, lats, lons)
+    if not len(distances) or np.isnan(distances).all():
+        return -1, 0.0
+    index = int(np.nanargmax(distances))
+    return index, float(distances[index])
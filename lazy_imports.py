@@ -0,0 +1,76 @@
+"""
+지연 임포트
+무거운 모듈(plotly, pandas, supabase 등)은 처음 사용할 때 불러오고 걸린 시간을 기록
+"""
+
+import importlib
+import sys
+import threading
+import time
+import types
+from typing import Dict
+
+_lock = threading.Lock()
+_load_times: Dict[str, float] = {}      # 모듈 이름 → 처음 사용할 때 불러오는 데 걸린 시간 (ms)
+
+
+class LazyModule(types.ModuleType):
+    """
+    속성에 처음 접근할 때 실제 모듈을 불러오는 프록시
+
+    go = lazy_import("plotly.graph_objects") 처럼 만들어 두면
+    go.Figure를 처음 쓰는 순간에만 plotly를 임포트한다.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with _lock:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                name = self.__name__
+                already_loaded = name in sys.modules
+                started = time.perf_counter()
+                module = importlib.import_module(name)
+                _load_times[name] = 0.0 if already_loaded else (time.perf_counter() - started) * 1000
+                self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    지연 임포트 프록시 생성
+
+    Args:
+        name: 모듈 이름 (예: "pandas", "plotly.graph_objects")
+
+    Returns:
+        LazyModule (이미 임포트된 모듈이어도 프록시를 반환)
+    """
+    return LazyModule(name)
+
+
+def load_times() -> Dict[str, float]:
+    """
+    지금까지 프록시로 불러온 모듈과 걸린 시간
+
+    Returns:
+        모듈 이름 → ms (다른 곳에서 이미 임포트되어 있었으면 0)
+    """
+    with _lock:
+        return dict(_load_times)
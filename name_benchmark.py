@@ -0,0 +1,91 @@
+"""
+갤러리 이름 정규화 벤치마크
+포스트 10만 개 분량의 갤러리 이름(띄어쓰기/대소문자/괄호/NFD 변형)을 정규화해
+레지스트리에서 찾는 시간을 재고, 예산(ms)을 넘으면 실패로 종료
+"""
+
+import os
+import sys
+import time
+import unicodedata
+from typing import Dict, List, Optional
+
+import gallery_names
+from gallery_registry import REGISTRY
+
+BENCHMARK_POSTS = 100_000
+NAME_BUDGET_MS = float(os.getenv("NAME_RESOLVE_BUDGET_MS", "1000"))
+
+
+def spellings(names: List[str]) -> List[str]:
+    """이름마다 포스트에서 볼 법한 변형 (띄어쓰기, 대소문자, 괄호, NFD 한글)"""
+    variants = []
+    for name in names:
+        variants.extend([
+            name,
+            f" {name.upper()} ",
+            " ".join(name),
+            f"{name} (서울)",
+            unicodedata.normalize("NFD", name),
+        ])
+    return variants
+
+
+def run_benchmark(posts: int = BENCHMARK_POSTS, names: Optional[List[str]] = None) -> Dict[str, float]:
+    """
+    포스트 posts개의 갤러리 이름을 정규화하고 레지스트리에서 찾는 시간 측정
+
+    Args:
+        posts: 포스트 수
+        names: 이름 목록 (없으면 레지스트리의 모든 정식 이름/영문명/별칭)
+
+    Returns:
+        resolve_ms: 캐시를 비운 상태에서 posts개를 모두 resolve한 시간
+        uncached_ms: 캐시 없이 name_key만 posts번 계산한 시간 (모든 이름이 다른 최악의 경우)
+        per_post_us: resolve 포스트당 마이크로초
+        distinct: 서로 다른 이름 수
+        resolved: 레지스트리에서 찾은 비율
+    """
+    if names is None:
+        names = [name for gallery in REGISTRY
+                 for name in (gallery.id, gallery.name_en) + gallery.aliases if name]
+    variants = spellings(names)
+    sample = [variants[i % len(variants)] for i in range(posts)]
+
+    gallery_names.clear_cache()
+    started = time.perf_counter()
+    found = sum(1 for name in sample if REGISTRY.resolve(name) is not None)
+    resolve_ms = (time.perf_counter() - started) * 1000
+
+    uncached = gallery_names.name_key.__wrapped__
+    started = time.perf_counter()
+    for name in sample:
+        uncached(name)
+    uncached_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "resolve_ms": resolve_ms,
+        "uncached_ms": uncached_ms,
+        "per_post_us": resolve_ms * 1000 / max(1, posts),
+        "distinct": len(set(variants)),
+        "resolved": found / max(1, posts),
+    }
+
+
+def main():
+    posts = int(sys.argv[1]) if len(sys.argv) > 1 else BENCHMARK_POSTS
+    result = run_benchmark(posts)
+    print(f"🔤 갤러리 이름 정규화 벤치마크: 포스트 {posts:,}개, 서로 다른 이름 {result['distinct']:,}개")
+    print(f"  resolve (LRU 캐시): {result['resolve_ms']:.0f}ms "
+          f"({result['per_post_us']:.2f}µs/포스트, 찾음 {result['resolved']:.0%})")
+    print(f"  name_key (캐시 없음): {result['uncached_ms']:.0f}ms")
+    print(f"  캐시: {gallery_names.cache_info()}")
+
+    passed = result["resolve_ms"] <= NAME_BUDGET_MS
+    status = "✅ 통과" if passed else "❌ 예산 초과"
+    print(f"{status}: {result['resolve_ms']:.0f}ms / 예산 {NAME_BUDGET_MS:.0f}ms")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
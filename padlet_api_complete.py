@@ -2,7 +2,10 @@ import requests
 import json
 import os
 from dotenv import load_dotenv
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator
+import padlet_http
+from padlet_cache import BoardCache, get_board_cache, CHUNK_SIZE
+from padlet_stream import iter_array_items
 
 load_dotenv()
 
@@ -14,7 +17,7 @@ except ImportError:
     HAS_STREAMLIT = False
 
 class PadletAPI:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, board_cache: Optional[BoardCache] = None):
         """Initialize Padlet API client with API key"""
         # 1. 직접 전달된 API 키
         # 2. Streamlit secrets
@@ -41,8 +44,38 @@ class PadletAPI:
             "X-API-KEY": self.api_key,
             "Content-Type": "application/vnd.api+json"
         }
+        
+        # 보드 응답 조건부 요청 캐시 (ETag / If-Modified-Since)
+        self.board_cache = board_cache if board_cache is not None else get_board_cache()
     
-    def get_board(self, board_id: str, include_posts: bool = True, include_sections: bool = True) -> Dict[str, Any]:
+    def _board_request(self, board_id: str, include_posts: bool, include_sections: bool):
+        """Build the board endpoint and include params"""
+        includes = []
+        if include_posts:
+            includes.append("posts")
+        if include_sections:
+            includes.append("sections")
+        
+        params = {"include": ",".join(includes)} if includes else {}
+        endpoint = f"{self.base_url}/boards/{board_id}"
+        return endpoint, params
+    
+    def board_cache_path(self, board_id: str, include_posts: bool = True,
+                         include_sections: bool = True) -> Optional[str]:
+        """
+        Path of the cached raw board body, if one exists
+        
+        Returns:
+            File path of the last 200 response body, or None
+        """
+        endpoint, params = self._board_request(board_id, include_posts, include_sections)
+        cache_key = self.board_cache.key_for(endpoint, params)
+        if self.board_cache.get_meta(cache_key) is None:
+            return None
+        return self.board_cache.body_path(cache_key)
+    
+    def get_board(self, board_id: str, include_posts: bool = True, include_sections: bool = True,
+                  use_cache: bool = True) -> Dict[str, Any]:
         """
         Get board information by ID
         
@@ -50,26 +83,94 @@ class PadletAPI:
             board_id: 16-character board ID from Padlet URL
             include_posts: Include all posts data
             include_sections: Include all sections data
+            use_cache: Send a conditional request and reuse the cached body on 304
         
         Returns:
             Board object with optional posts and sections
         """
-        includes = []
-        if include_posts:
-            includes.append("posts")
-        if include_sections:
-            includes.append("sections")
+        endpoint, params = self._board_request(board_id, include_posts, include_sections)
         
-        params = {"include": ",".join(includes)} if includes else {}
-        endpoint = f"{self.base_url}/boards/{board_id}"
+        cache = self.board_cache if use_cache else None
+        headers = self.headers
+        if cache:
+            cache_key = cache.key_for(endpoint, params)
+            headers = {**self.headers, **cache.conditional_headers(cache_key)}
         
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params)
+            response = padlet_http.request("GET", endpoint, headers=headers, params=params)
+            
+            if cache and response.status_code == 304:
+                cached = cache.load(cache_key)
+                if cached is not None:
+                    cache.record_hit(cache_key)
+                    return cached
+                # 캐시 파일이 손상된 경우 조건 없이 다시 요청
+                response = padlet_http.request("GET", endpoint, headers=self.headers, params=params)
+            
             response.raise_for_status()
+            if cache:
+                cache.store(cache_key, response.content, response.headers)
             return response.json()
         except requests.exceptions.RequestException as e:
             return {"error": str(e), "status_code": getattr(e.response, 'status_code', None)}
     
+    def iter_board_items(self, board_id: str, include_posts: bool = True, include_sections: bool = True,
+                         types: Optional[Iterable[str]] = None, use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the board's "included" objects (posts, sections) one at a time
+        
+        The response body is decoded incrementally, so memory use stays flat
+        regardless of board size. Unlike get_board, errors are raised.
+        
+        Args:
+            board_id: 16-character board ID from Padlet URL
+            include_posts: Include all posts data
+            include_sections: Include all sections data
+            types: Only yield objects of these types (e.g. {"post"})
+            use_cache: Send a conditional request and stream the cached body on 304
+        
+        Yields:
+            Included JSON:API objects
+        
+        Raises:
+            requests.exceptions.RequestException: on network or HTTP errors
+        """
+        endpoint, params = self._board_request(board_id, include_posts, include_sections)
+        wanted = set(types) if types else None
+        
+        cache = self.board_cache if use_cache else None
+        headers = self.headers
+        if cache:
+            cache_key = cache.key_for(endpoint, params)
+            headers = {**self.headers, **cache.conditional_headers(cache_key)}
+        
+        response = padlet_http.request("GET", endpoint, headers=headers, params=params, stream=True)
+        try:
+            if cache and response.status_code == 304 and cache.get_meta(cache_key):
+                cache.record_hit(cache_key)
+                chunks = cache.iter_body(cache_key)
+            else:
+                if response.status_code == 304:
+                    # 캐시 파일이 사라진 경우 조건 없이 다시 요청
+                    response.close()
+                    response = padlet_http.request("GET", endpoint, headers=self.headers,
+                                                   params=params, stream=True)
+                response.raise_for_status()
+                chunks = response.iter_content(chunk_size=CHUNK_SIZE)
+                if cache:
+                    chunks = cache.tee(cache_key, chunks, response.headers)
+            
+            chunks = iter(chunks)
+            for item in iter_array_items(chunks, "included"):
+                if wanted is None or item.get("type") in wanted:
+                    yield item
+            
+            # 캐시 파일이 완성되도록 남은 본문(meta 등)까지 읽는다
+            for _ in chunks:
+                pass
+        finally:
+            response.close()
+    
     def create_post(self, board_id: str, subject: str = "", body: str = "", 
                    attachment_url: str = None, color: str = None,
                    section_id: str = None, map_props: Dict = None, 
@@ -127,7 +228,7 @@ class PadletAPI:
             }
         
         try:
-            response = requests.post(endpoint, headers=self.headers, json=data)
+            response = padlet_http.request("POST", endpoint, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -162,7 +263,7 @@ class PadletAPI:
         }
         
         try:
-            response = requests.post(endpoint, headers=self.headers, json=data)
+            response = padlet_http.request("POST", endpoint, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -190,7 +291,7 @@ class PadletAPI:
         endpoint = f"{self.base_url}/me"
         
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params)
+            response = padlet_http.request("GET", endpoint, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -226,7 +327,7 @@ class PadletAPI:
         }
         
         try:
-            response = requests.post(endpoint, headers=self.headers, json=data)
+            response = padlet_http.request("POST", endpoint, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -245,7 +346,7 @@ class PadletAPI:
         endpoint = f"{self.base_url}/ai-recipe-boards/status/{status_key}"
         
         try:
-            response = requests.get(endpoint, headers=self.headers)
+            response = padlet_http.request("GET", endpoint, headers=self.headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,223 @@
+"""
+asyncio 기반 Padlet API 클라이언트
+동시 요청 수를 세마포어로 제한하면서 여러 요청을 병렬로 처리
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from padlet_api_complete import PadletAPI
+
+# 기본 동시 요청 수 (padlet_http.POOL_MAXSIZE 이하로 유지)
+DEFAULT_CONCURRENCY = 8
+
+# AI 보드 생성이 아직 진행 중임을 나타내는 상태값
+AI_BOARD_PENDING_STATES = {"pending", "queued", "processing", "in_progress", "running"}
+
+
+class Fanout:
+    """
+    동시성 제한 병렬 실행기 (API 객체와 무관)
+
+    동기 함수를 워커 스레드에서 실행하고, 세마포어로 동시에 실행되는 수를 제한한다.
+    삭제/게시처럼 PadletAPI가 아닌 객체의 메서드를 병렬로 돌릴 때 그대로 사용한다.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프에 묶인 세마포어 반환 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        동기 함수를 동시성 제한 안에서 실행
+
+        Args:
+            func: 실행할 동기 함수
+
+        Returns:
+            func의 반환값
+        """
+        async with self._get_semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def gather(self, calls: Iterable[Awaitable[Any]]) -> List[Any]:
+        """
+        여러 요청을 병렬로 실행하고 입력 순서대로 결과 반환
+
+        예외는 {"error": ...} 딕셔너리로 바꿔서 돌려준다 (PadletAPI와 동일한 규약).
+        """
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        return [
+            {"error": str(r), "status_code": None} if isinstance(r, Exception) else r
+            for r in results
+        ]
+
+    def map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        동기 코드에서 사용하는 병렬 map (sync facade)
+
+        Args:
+            func: 각 항목에 적용할 동기 함수
+            items: 입력 항목들
+
+        Returns:
+            입력 순서와 같은 순서의 결과 리스트
+        """
+        items = list(items)
+
+        async def _run():
+            return await self.gather(self.call(func, item) for item in items)
+
+        return run_sync(_run())
+
+    def imap_unordered(self, func: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+        """
+        병렬 map, 끝나는 순서대로 결과를 하나씩 반환 (sync facade)
+
+        이벤트 루프는 별도 스레드에서 돌고, 결과는 큐를 통해 바로 전달된다.
+        소비를 중간에 멈춰도 이미 시작된 요청은 끝까지 실행된다.
+
+        Args:
+            func: 각 항목에 적용할 동기 함수
+            items: 입력 항목들
+
+        Yields:
+            (입력 인덱스, 결과) - 예외는 {"error": ...} 딕셔너리로 변환
+        """
+        items = list(items)
+        results: "queue.Queue" = queue.Queue()
+        finished = object()
+
+        async def _one(index: int, item: Any):
+            try:
+                value = await self.call(func, item)
+            except Exception as e:
+                value = {"error": str(e), "status_code": None}
+            results.put((index, value))
+
+        async def _run():
+            await asyncio.gather(*(_one(i, item) for i, item in enumerate(items)))
+
+        def _runner():
+            try:
+                asyncio.run(_run())
+            finally:
+                results.put(finished)
+
+        thread = threading.Thread(target=_runner, daemon=True)
+        thread.start()
+        while True:
+            entry = results.get()
+            if entry is finished:
+                break
+            yield entry
+        thread.join()
+
+
+class AsyncPadletAPI(Fanout):
+    """
+    PadletAPI의 asyncio 버전
+
+    실제 HTTP 호출은 PadletAPI(공용 커넥션 풀)를 워커 스레드에서 실행하고,
+    세마포어로 동시에 날아가는 요청 수를 제한한다.
+    """
+
+    def __init__(self, api: Optional[PadletAPI] = None, api_key: Optional[str] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        super().__init__(concurrency)
+        self.api = api or PadletAPI(api_key)
+
+    async def get_board(self, board_id: str, include_posts: bool = True,
+                        include_sections: bool = True) -> Dict[str, Any]:
+        return await self.call(self.api.get_board, board_id,
+                               include_posts=include_posts, include_sections=include_sections)
+
+    async def create_post(self, board_id: str, **kwargs) -> Dict[str, Any]:
+        return await self.call(self.api.create_post, board_id, **kwargs)
+
+    async def create_comment(self, post_id: str, html_content: str = None,
+                             attachment_url: str = None) -> Dict[str, Any]:
+        return await self.call(self.api.create_comment, post_id,
+                               html_content=html_content, attachment_url=attachment_url)
+
+    async def get_current_user(self, include_boards: bool = False,
+                               include_organizations: bool = False) -> Dict[str, Any]:
+        return await self.call(self.api.get_current_user,
+                               include_boards=include_boards,
+                               include_organizations=include_organizations)
+
+    async def create_ai_board(self, instructions: str, role: str = "teacher",
+                              workspace_id: str = None) -> Dict[str, Any]:
+        return await self.call(self.api.create_ai_board, instructions,
+                               role=role, workspace_id=workspace_id)
+
+    async def get_ai_board_status(self, status_key: str) -> Dict[str, Any]:
+        return await self.call(self.api.get_ai_board_status, status_key)
+
+    async def wait_for_ai_board(self, status_key: str, poll_interval: float = 2.0,
+                                timeout: float = 120.0) -> Dict[str, Any]:
+        """
+        AI 보드 생성이 끝날 때까지 상태를 폴링
+
+        Args:
+            status_key: create_ai_board 응답의 상태 키
+            poll_interval: 폴링 간격 (초)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            마지막 상태 응답 (시간 초과 시 error 포함)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            status = await self.get_ai_board_status(status_key)
+            if "error" in status:
+                return status
+
+            state = str(status.get("data", {}).get("attributes", {}).get("status", "")).lower()
+            if state not in AI_BOARD_PENDING_STATES:
+                return status
+
+            if time.monotonic() + poll_interval > deadline:
+                return {"error": f"AI board creation timed out after {timeout}s",
+                        "status_code": None, "last_status": status}
+            await asyncio.sleep(poll_interval)
+
+
+def run_sync(coro: Awaitable[Any]) -> Any:
+    """
+    코루틴을 동기 코드에서 실행
+
+    이미 이벤트 루프가 돌고 있는 스레드(예: Jupyter)에서 호출되면
+    별도 스레드에서 새 루프를 띄워 실행한다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result: Dict[str, Any] = {}
+
+    def _runner():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=_runner, daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
@@ -0,0 +1,222 @@
+"""
+Padlet 보드 응답 디스크 캐시
+ETag / Last-Modified 검증자를 저장해 조건부 요청(304)으로 재다운로드를 줄임
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+DEFAULT_CACHE_DIR = os.getenv('PADLET_CACHE_DIR', '.padlet_cache')
+CHUNK_SIZE = 64 * 1024
+
+
+class BoardCache:
+    """
+    보드 응답 본문과 검증자(ETag, Last-Modified)를 디스크에 보관
+
+    - {key}.json: 마지막 200 응답 본문
+    - {key}.meta.json: 검증자, 본문 크기, 저장 시각
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "bytes_saved": 0,
+            "bytes_downloaded": 0,
+        }
+
+    @staticmethod
+    def key_for(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """URL과 쿼리 파라미터로 캐시 키 생성"""
+        query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return hashlib.sha1(f"{url}?{query}".encode("utf-8")).hexdigest()[:20]
+
+    def body_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.meta.json")
+
+    def get_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        """저장된 메타데이터 반환 (본문 파일이 없으면 None)"""
+        if not os.path.exists(self.body_path(key)):
+            return None
+        try:
+            with open(self.meta_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """
+        조건부 요청 헤더 생성
+
+        Returns:
+            If-None-Match / If-Modified-Since 헤더 (캐시가 없으면 빈 딕셔너리)
+        """
+        meta = self.get_meta(key)
+        if not meta:
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 본문을 JSON으로 로드 (없거나 손상되면 None)"""
+        try:
+            with open(self.body_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, body: bytes, headers: Dict[str, str]):
+        """
+        200 응답 본문과 검증자 저장
+
+        검증자가 하나도 없으면 조건부 요청이 불가능하므로 저장하지 않는다.
+        """
+        self.record_miss(len(body))
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        meta = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "size": len(body),
+            "stored_at": datetime.now().isoformat(),
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._atomic_write(self.body_path(key), body)
+            self._atomic_write(self.meta_path(key),
+                               json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            # 읽기 전용 파일시스템 등에서는 캐시 없이 동작
+            print(f"Board cache write error: {e}")
+
+    def iter_body(self, key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """캐시된 본문을 청크 단위로 읽기 (스트리밍 디코더용)"""
+        with open(self.body_path(key), 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def tee(self, key: str, chunks: Iterable[bytes], headers: Dict[str, str]) -> Iterator[bytes]:
+        """
+        스트리밍 응답 청크를 그대로 넘기면서 캐시 파일에 기록
+
+        끝까지 읽힌 경우에만 본문과 메타데이터를 교체하고,
+        중간에 중단되면 임시 파일을 버린다.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        tmp_file = None
+        tmp_path = None
+        if etag or last_modified:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                tmp_file = os.fdopen(fd, 'wb')
+            except OSError as e:
+                print(f"Board cache write error: {e}")
+
+        size = 0
+        completed = False
+        try:
+            for chunk in chunks:
+                size += len(chunk)
+                if tmp_file:
+                    tmp_file.write(chunk)
+                yield chunk
+            completed = True
+        finally:
+            if tmp_file:
+                tmp_file.close()
+            if completed:
+                self.record_miss(size)
+            if tmp_path:
+                try:
+                    if completed:
+                        os.replace(tmp_path, self.body_path(key))
+                        meta = {
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "size": size,
+                            "stored_at": datetime.now().isoformat(),
+                        }
+                        self._atomic_write(self.meta_path(key),
+                                           json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+                    else:
+                        os.remove(tmp_path)
+                except OSError as e:
+                    print(f"Board cache write error: {e}")
+
+    def _atomic_write(self, path: str, data: bytes):
+        """임시 파일에 쓴 뒤 rename해서 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 함"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def record_hit(self, key: str):
+        """304 응답으로 캐시 본문을 재사용했을 때 호출"""
+        meta = self.get_meta(key) or {}
+        with self._lock:
+            self._stats["hits"] += 1
+            self._stats["bytes_saved"] += meta.get("size", 0)
+
+    def record_miss(self, nbytes: int):
+        """본문을 새로 내려받았을 때 호출"""
+        with self._lock:
+            self._stats["misses"] += 1
+            self._stats["bytes_downloaded"] += nbytes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            hits, misses, hit_rate, bytes_saved, bytes_downloaded
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 3) if total else 0.0
+        return stats
+
+
+_board_cache: Optional[BoardCache] = None
+_board_cache_lock = threading.Lock()
+
+
+def get_board_cache() -> BoardCache:
+    """프로세스 전역 BoardCache 반환"""
+    global _board_cache
+    if _board_cache is None:
+        with _board_cache_lock:
+            if _board_cache is None:
+                _board_cache = BoardCache()
+    return _board_cache
@@ -0,0 +1,229 @@
+"""
+Padlet API 공용 HTTP 전송 계층
+모든 Padlet 클라이언트가 하나의 커넥션 풀(keep-alive)을 공유하도록 관리
+"""
+
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from padlet_ratelimit import get_rate_limiter
+
+# 호스트별 커넥션 풀 설정 (환경변수로 조정 가능)
+POOL_CONNECTIONS = int(os.getenv('PADLET_POOL_CONNECTIONS', '4'))   # 캐시할 호스트 풀 개수
+POOL_MAXSIZE = int(os.getenv('PADLET_POOL_MAXSIZE', '16'))          # 호스트당 최대 커넥션 수
+
+# (connect, read) 타임아웃 - 초 단위
+DEFAULT_TIMEOUT: Tuple[float, float] = (
+    float(os.getenv('PADLET_CONNECT_TIMEOUT', '3.05')),
+    float(os.getenv('PADLET_READ_TIMEOUT', '20')),
+)
+
+# 재시도 설정 (지수 백오프 + full jitter)
+MAX_RETRIES = int(os.getenv('PADLET_MAX_RETRIES', '4'))
+BACKOFF_BASE = 0.5       # 첫 재시도 최대 대기 (초)
+BACKOFF_CAP = 30.0       # 재시도 대기 상한 (초)
+RETRY_AFTER_CAP = 120.0  # 서버가 지정한 Retry-After 상한 (초)
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# 429는 서버가 요청을 처리하지 않았으므로 POST도 안전하게 재시도
+RETRY_ANY_METHOD_STATUSES = {429}
+RETRY_IDEMPOTENT_STATUSES = {502, 503, 504}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_stats = {
+    "requests": 0,
+    "errors": 0,
+    "retries": 0,
+    "rate_limited": 0,
+    "throttle_wait_ms": 0,
+}
+
+
+def _build_session() -> requests.Session:
+    """keep-alive 커넥션 풀이 설정된 Session 생성"""
+    session = requests.Session()
+    # 재시도는 상위 계층에서 처리하므로 urllib3 재시도는 끈다
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=True,  # 호스트당 커넥션 수를 POOL_MAXSIZE로 제한
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    프로세스 전역 Session 반환 (최초 호출 시 생성)
+
+    Returns:
+        모든 Padlet 클라이언트가 공유하는 requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 파싱
+
+    Args:
+        value: 초 단위 숫자 또는 HTTP-date
+
+    Returns:
+        대기 시간 (초), 파싱 실패 시 None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int) -> float:
+    """attempt번째 재시도 대기 시간 (full jitter)"""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+def _should_retry(method: str, status_code: int) -> bool:
+    if status_code in RETRY_ANY_METHOD_STATUSES:
+        return True
+    return status_code in RETRY_IDEMPOTENT_STATUSES and method in IDEMPOTENT_METHODS
+
+
+def _add_stat(name: str, value: int = 1):
+    with _stats_lock:
+        _stats[name] += value
+
+
+def request(method: str, url: str, max_retries: Optional[int] = None, **kwargs) -> requests.Response:
+    """
+    공용 Session으로 HTTP 요청 전송
+
+    요청마다 공용 토큰 버킷에서 토큰을 얻고, 429/5xx 응답이나 연결 오류는
+    지수 백오프로 재시도한다. 서버가 Retry-After를 주면 그 시간을 따른다.
+
+    Args:
+        method: HTTP 메서드 (GET, POST, ...)
+        url: 요청 URL
+        max_retries: 최대 재시도 횟수 (None이면 MAX_RETRIES)
+        **kwargs: requests에 그대로 전달 (timeout 미지정 시 DEFAULT_TIMEOUT 적용)
+
+    Returns:
+        requests.Response (재시도를 모두 소진하면 마지막 응답)
+    """
+    method = method.upper()
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    retries = MAX_RETRIES if max_retries is None else max_retries
+    limiter = get_rate_limiter()
+
+    attempt = 0
+    while True:
+        waited = limiter.acquire()
+        _add_stat("requests")
+        if waited:
+            _add_stat("throttle_wait_ms", int(waited * 1000))
+
+        try:
+            response = get_session().request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            _add_stat("errors")
+            if attempt >= retries or method not in IDEMPOTENT_METHODS:
+                raise
+            delay = backoff_delay(attempt)
+        except requests.exceptions.RequestException:
+            _add_stat("errors")
+            raise
+        else:
+            if attempt >= retries or not _should_retry(method, response.status_code):
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = min(retry_after, RETRY_AFTER_CAP) + random.uniform(0, BACKOFF_BASE)
+            else:
+                delay = backoff_delay(attempt)
+
+            if response.status_code == 429:
+                _add_stat("rate_limited")
+                # 다른 스레드/프로세스도 같은 시간 동안 대기하도록 버킷을 막는다
+                # (다음 acquire()가 그만큼 기다리므로 여기서는 따로 sleep하지 않음)
+                limiter.penalize(delay)
+                delay = 0.0
+            response.close()
+
+        _add_stat("retries")
+        if delay:
+            time.sleep(delay)
+        attempt += 1
+
+
+def transport_stats() -> Dict[str, int]:
+    """
+    커넥션 풀 사용 통계
+
+    Returns:
+        requests: 전송한 요청 수 (재시도 포함)
+        errors: 네트워크 오류 수
+        retries: 재시도 횟수
+        rate_limited: 429 응답 수
+        throttle_wait_ms: 토큰 버킷 대기 누적 시간 (ms)
+        connections_opened: 새로 연 커넥션 수 (TCP+TLS 핸드셰이크 횟수)
+        pool_hits: 기존 커넥션을 재사용한 요청 수
+        handshakes_avoided: pool_hits와 동일 (가독성용)
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+
+    connections = 0
+    pooled_requests = 0
+    if _session is not None:
+        # https/http가 같은 어댑터를 공유하므로 중복 집계 방지
+        adapters = {id(a): a for a in _session.adapters.values()}
+        for adapter in adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += pool.num_connections
+                pooled_requests += pool.num_requests
+
+    pool_hits = max(pooled_requests - connections, 0)
+    stats["connections_opened"] = connections
+    stats["pool_hits"] = pool_hits
+    stats["handshakes_avoided"] = pool_hits
+    return stats
+
+
+def close_session():
+    """공용 Session 종료 (테스트/종료 시 사용)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,101 @@
+"""
+Padlet 포스트 데이터 모델
+JSON:API 포스트 객체를 한 번만 파싱해 모든 모듈이 같은 Post 타입을 사용
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+@dataclass(slots=True)
+class Post:
+    """Padlet 포스트 (__slots__로 포스트당 메모리 최소화)"""
+    id: str
+    subject: str = ""
+    body: str = ""                        # bodyHtml (없으면 body)
+    location_name: str = ""               # sys.intern된 장소명
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    color: Optional[str] = None
+    attachment_url: Optional[str] = None
+    section_id: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """제목 + 본문 (검색/분석용)"""
+        return f"{self.subject} {self.body}"
+
+    @property
+    def has_location(self) -> bool:
+        return bool(self.latitude and self.longitude)
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    ISO 8601 문자열을 datetime으로 변환 ('Z' 접미사 지원)
+
+    같은 타임스탬프가 반복되는 경우가 많아 결과를 캐시한다.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_post(item: Dict[str, Any]) -> Optional[Post]:
+    """
+    JSON:API 포스트 객체를 Post로 변환
+
+    Args:
+        item: included 배열의 항목
+
+    Returns:
+        Post (포스트가 아니면 None)
+    """
+    if item.get("type") != "post":
+        return None
+
+    attributes = item.get("attributes") or {}
+    content = attributes.get("content") or {}
+    map_props = attributes.get("mapProps") or {}
+    attachment = content.get("attachment") or {}
+    section = ((item.get("relationships") or {}).get("section") or {}).get("data") or {}
+
+    return Post(
+        id=item.get("id"),
+        subject=content.get("subject") or "",
+        body=content.get("bodyHtml") or content.get("body") or "",
+        location_name=sys.intern(map_props.get("locationName") or ""),
+        latitude=_to_float(map_props.get("latitude")),
+        longitude=_to_float(map_props.get("longitude")),
+        created_at=parse_datetime(attributes.get("createdAt")),
+        updated_at=parse_datetime(attributes.get("updatedAt")),
+        color=attributes.get("color"),
+        attachment_url=attachment.get("url") if isinstance(attachment, dict) else None,
+        section_id=section.get("id"),
+    )
+
+
+def iter_posts(items: Iterable[Dict[str, Any]]) -> Iterator[Post]:
+    """included 항목 스트림에서 포스트만 Post로 변환해 반환"""
+    for item in items:
+        post = parse_post(item)
+        if post is not None:
+            yield post
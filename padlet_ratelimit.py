@@ -0,0 +1,182 @@
+"""
+Padlet API 요청 속도 제한기
+같은 호스트의 여러 프로세스(Streamlit 앱, 스케줄러, 정리 스크립트)가
+SQLite 파일 하나에 저장된 토큰 버킷을 공유해 API 쿼터를 넘지 않도록 함
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional
+
+DEFAULT_RATE = float(os.getenv('PADLET_RATE_LIMIT', '5'))     # 초당 요청 수
+DEFAULT_BURST = float(os.getenv('PADLET_RATE_BURST', '10'))   # 버킷 최대 크기
+DEFAULT_DB_PATH = os.getenv(
+    'PADLET_RATE_DB',
+    os.path.join(tempfile.gettempdir(), 'padlet_ratelimit.sqlite')
+)
+
+
+class TokenBucket:
+    """
+    SQLite 기반 토큰 버킷
+
+    - 스레드/프로세스마다 연결을 새로 열고 BEGIN IMMEDIATE로 잠가서 원자적으로 갱신
+    - 429 응답의 Retry-After는 penalize()로 기록해 모든 프로세스가 함께 대기
+    - DB를 쓸 수 없으면 프로세스 내부 버킷으로 동작
+    """
+
+    def __init__(self, name: str = "padlet", rate: float = DEFAULT_RATE,
+                 capacity: float = DEFAULT_BURST, db_path: Optional[str] = None):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.db_path = db_path or DEFAULT_DB_PATH
+
+        # SQLite를 사용할 수 없을 때의 대체 상태
+        self._local_lock = threading.Lock()
+        self._local_tokens = capacity
+        self._local_updated = time.time()
+        self._local_blocked_until = 0.0
+        self._use_db = True
+
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS buckets ("
+                    " name TEXT PRIMARY KEY,"
+                    " tokens REAL NOT NULL,"
+                    " updated REAL NOT NULL,"
+                    " blocked_until REAL NOT NULL DEFAULT 0)"
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                    (name, capacity, time.time())
+                )
+        except sqlite3.Error as e:
+            print(f"Rate limiter DB unavailable, using in-process bucket: {e}")
+            self._use_db = False
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _take(self, tokens: float, stored: float, updated: float,
+              blocked_until: float, now: float):
+        """
+        버킷 상태에서 토큰을 꺼낼 수 있는지 계산
+
+        Returns:
+            (남은 토큰, 대기해야 할 시간) - 대기 시간이 0이면 토큰 획득 성공
+        """
+        if now < blocked_until:
+            return stored, blocked_until - now
+
+        available = min(self.capacity, stored + (now - max(updated, blocked_until)) * self.rate)
+        if available >= tokens:
+            return available - tokens, 0.0
+        return available, (tokens - available) / self.rate
+
+    def _try_acquire(self, tokens: float) -> float:
+        """토큰 획득을 한 번 시도하고 필요한 대기 시간 반환 (0이면 성공)"""
+        now = time.time()
+
+        if not self._use_db:
+            with self._local_lock:
+                remaining, wait = self._take(tokens, self._local_tokens, self._local_updated,
+                                             self._local_blocked_until, now)
+                if wait == 0:
+                    self._local_tokens = remaining
+                    self._local_updated = now
+                return wait
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated, blocked_until FROM buckets WHERE name = ?",
+                (self.name,)
+            ).fetchone()
+            stored, updated, blocked_until = row if row else (self.capacity, now, 0.0)
+
+            remaining, wait = self._take(tokens, stored, updated, blocked_until, now)
+            if wait == 0:
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (name, tokens, updated, blocked_until)"
+                    " VALUES (?, ?, ?, ?)",
+                    (self.name, remaining, now, blocked_until)
+                )
+            conn.commit()
+            return wait
+        finally:
+            conn.close()
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        Args:
+            tokens: 필요한 토큰 수
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            실제로 기다린 시간 (초)
+
+        Raises:
+            TimeoutError: timeout 안에 토큰을 얻지 못한 경우
+        """
+        started = time.monotonic()
+        while True:
+            try:
+                wait = self._try_acquire(tokens)
+            except sqlite3.Error as e:
+                print(f"Rate limiter DB error, using in-process bucket: {e}")
+                self._use_db = False
+                continue
+
+            if wait == 0:
+                return time.monotonic() - started
+
+            if timeout is not None and time.monotonic() - started + wait > timeout:
+                raise TimeoutError(f"Rate limiter wait exceeded {timeout}s")
+            time.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """
+        서버가 Retry-After로 지정한 시간 동안 모든 프로세스의 요청을 막음
+
+        Args:
+            seconds: 대기 시간 (초)
+        """
+        until = time.time() + seconds
+
+        if not self._use_db:
+            with self._local_lock:
+                self._local_blocked_until = max(self._local_blocked_until, until)
+                self._local_tokens = 0
+            return
+
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "UPDATE buckets SET blocked_until = MAX(blocked_until, ?), tokens = 0"
+                    " WHERE name = ?",
+                    (until, self.name)
+                )
+        except sqlite3.Error as e:
+            print(f"Rate limiter DB error: {e}")
+
+
+_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """프로세스 전역 Padlet 토큰 버킷 반환"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = TokenBucket()
+    return _limiter
@@ -1,6 +1,7 @@
 import os
 import requests
 import json
+import padlet_http
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -45,7 +46,7 @@ class PadletAPI:
         }
         
         try:
-            response = requests.post(endpoint, headers=self.headers, json=data)
+            response = padlet_http.request("POST", endpoint, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -79,7 +80,7 @@ class PadletAPI:
         endpoint = f"{self.base_url}/padlets/{padlet_id}"
         
         try:
-            response = requests.delete(endpoint, headers=self.headers)
+            response = padlet_http.request("DELETE", endpoint, headers=self.headers)
             response.raise_for_status()
             return {"success": True, "message": "Padlet deleted successfully"}
         except requests.exceptions.RequestException as e:
@@ -90,7 +91,7 @@ class PadletAPI:
         endpoint = f"{self.base_url}/padlets/{padlet_id}"
         
         try:
-            response = requests.patch(endpoint, headers=self.headers, json=kwargs)
+            response = padlet_http.request("PATCH", endpoint, headers=self.headers, json=kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,105 @@
+"""
+JSON:API 응답 스트리밍 디코더
+보드 응답 전체를 메모리에 올리지 않고 "included" 배열의 항목을 하나씩 파싱
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, Union
+
+# 문자열 밖에서 의미 있는 문자 / 문자열 안에서 의미 있는 문자
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+def iter_array_items(chunks: Iterable[Union[bytes, str]], key: str = "included") -> Iterator[Dict[str, Any]]:
+    """
+    최상위 객체의 key 배열 항목을 하나씩 반환
+
+    버퍼에는 현재 파싱 중인 항목 하나와 읽다 만 청크만 남기므로
+    메모리 사용량이 보드 크기와 무관하게 일정하다.
+
+    Args:
+        chunks: 응답 본문 청크 (bytes는 UTF-8로 디코딩)
+        key: 스트리밍할 최상위 배열 키
+
+    Yields:
+        배열의 각 항목 (dict)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    depth = 0
+    in_string = False
+    string_start = 0
+    last_string = None      # 최상위 객체에서 마지막으로 읽은 문자열 (키 후보)
+    array_depth = None      # 대상 배열 내부의 depth
+    item_start = None       # 현재 항목의 시작 위치
+
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        buf += chunk
+
+        while True:
+            if in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if not match:
+                    pos = len(buf)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buf):
+                        # 이스케이프 문자가 청크 경계에 걸린 경우 다음 청크를 기다림
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                in_string = False
+                pos = match.end()
+                if depth == 1 and array_depth is None:
+                    last_string = buf[string_start + 1:pos - 1]
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if not match:
+                pos = len(buf)
+                break
+
+            char = match.group()
+            index = match.start()
+            pos = match.end()
+
+            if char == '"':
+                in_string = True
+                string_start = index
+            elif char in "{[":
+                if array_depth is None and depth == 1 and char == "[" and last_string == key:
+                    array_depth = depth + 1
+                elif array_depth is not None and depth == array_depth and item_start is None:
+                    item_start = index
+                depth += 1
+            else:
+                depth -= 1
+                if array_depth is not None:
+                    if depth == array_depth and item_start is not None:
+                        yield json.loads(buf[item_start:pos])
+                        item_start = None
+                    elif depth < array_depth:
+                        # 대상 배열이 끝났으면 나머지 본문은 읽지 않음
+                        return
+
+        # 더 이상 필요 없는 앞부분을 버퍼에서 제거
+        if item_start is not None:
+            keep_from = item_start
+        elif in_string:
+            keep_from = string_start
+        else:
+            keep_from = pos
+        if keep_from:
+            buf = buf[keep_from:]
+            pos -= keep_from
+            if item_start is not None:
+                item_start -= keep_from
+            if in_string:
+                string_start -= keep_from
@@ -0,0 +1,166 @@
+"""
+후기 컬럼형 데이터프레임
+Padlet 데이터와 로컬 후기를 타입이 지정된 컬럼으로 한 번 적재하고
+시계열/Top-N 집계를 벡터화된 group-by로 계산
+(분포/히트맵 집계는 review_rollups의 증분 롤업 테이블 사용)
+"""
+
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["timestamp", "gallery", "emotion", "latitude", "longitude", "rating", "stay_time", "source"]
+
+
+def _to_naive(values: pd.Series) -> pd.Series:
+    """
+    문자열/datetime 혼합 컬럼을 datetime64로 변환
+
+    타임존이 있는 값은 해당 시각의 UTC 벽시계 시간으로 맞춘다
+    (기존 코드의 timestamp.date()와 같은 날짜가 나오도록).
+    """
+    converted = pd.to_datetime(values, errors="coerce", utc=True, format="mixed")
+    return converted.dt.tz_convert(None)
+
+
+def build_review_frame(records: Iterable[Dict[str, Any]], source: str) -> pd.DataFrame:
+    """
+    reviews 형식 레코드를 컬럼형 프레임으로 변환
+
+    Args:
+        records: gallery, emotion, timestamp, latitude, longitude, rating, stay_time 키를 가진 딕셔너리
+        source: 'padlet' 또는 'local'
+
+    Returns:
+        COLUMNS 순서의 DataFrame
+    """
+    records = list(records)
+    columns = {name: [r.get(name) for r in records] for name in COLUMNS[:-1]}
+
+    frame = pd.DataFrame({
+        "timestamp": _to_naive(pd.Series(columns["timestamp"], dtype="object")),
+        "gallery": pd.Series(columns["gallery"], dtype="object").fillna("").astype("category"),
+        "emotion": pd.Series(columns["emotion"], dtype="object").fillna("").astype("category"),
+        "latitude": pd.to_numeric(pd.Series(columns["latitude"], dtype="object"), errors="coerce"),
+        "longitude": pd.to_numeric(pd.Series(columns["longitude"], dtype="object"), errors="coerce"),
+        "rating": pd.to_numeric(pd.Series(columns["rating"], dtype="object"), errors="coerce").astype("Int8"),
+        "stay_time": pd.to_numeric(pd.Series(columns["stay_time"], dtype="object"), errors="coerce"),
+    })
+    frame["source"] = pd.Categorical([source] * len(frame), categories=["padlet", "local"])
+    return frame
+
+
+def combine_frames(*frames: pd.DataFrame) -> pd.DataFrame:
+    """여러 프레임 합치기 (카테고리 컬럼은 union으로 유지)"""
+    frames = [f for f in frames if len(f)]
+    if not frames:
+        return build_review_frame([], "local")
+    if len(frames) == 1:
+        return frames[0]
+    combined = pd.concat(frames, ignore_index=True)
+    for name in ("gallery", "emotion"):
+        combined[name] = combined[name].astype("category")
+    combined["source"] = pd.Categorical(combined["source"], categories=["padlet", "local"])
+    return combined
+
+
+def daily_counts(frame: pd.DataFrame, start: date, end: date) -> pd.Series:
+    """
+    날짜별 후기 수 (빈 날짜는 0)
+
+    Returns:
+        DatetimeIndex(start..end) → 개수
+    """
+    days = frame["timestamp"].dropna().dt.normalize()
+    return days.value_counts().reindex(pd.date_range(start=start, end=end, freq="D"), fill_value=0)
+
+
+def gallery_counts(frame: pd.DataFrame, exclude: Iterable[str] = ("", "갤러리")) -> pd.Series:
+    """갤러리별 후기 수 (많은 순)"""
+    counts = frame["gallery"].value_counts(sort=True)
+    return counts[~counts.index.isin(list(exclude)) & (counts > 0)]
+
+
+def top_galleries(frame: pd.DataFrame, n: int = 5, **kwargs) -> List[tuple]:
+    """상위 n개 갤러리 [(이름, 개수), ...]"""
+    return list(gallery_counts(frame, **kwargs).head(n).items())
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크: 기존 행 단위 루프 vs 컬럼형 프레임
+# ---------------------------------------------------------------------------
+
+def _legacy_daily_counts(records: List[Dict[str, Any]], start: date, end: date) -> List[int]:
+    """기존 대시보드 코드 (포스트마다 pd.to_datetime + date_range 순회)"""
+    daily_visits = {}
+    for post in records:
+        try:
+            if isinstance(post.get('timestamp'), str):
+                post_date = pd.to_datetime(post['timestamp']).date()
+            else:
+                post_date = post.get('timestamp', datetime.now()).date()
+            daily_visits[post_date] = daily_visits.get(post_date, 0) + 1
+        except Exception:
+            continue
+    return [daily_visits.get(d.date(), 0) for d in pd.date_range(start=start, end=end, freq='D')]
+
+
+def _legacy_gallery_counts(records: List[Dict[str, Any]]) -> List[tuple]:
+    counts = {}
+    for post in records:
+        gallery = post.get('gallery', '')
+        if gallery and gallery != '갤러리':
+            counts[gallery] = counts.get(gallery, 0) + 1
+    return sorted(counts.items(), key=lambda x: x[1], reverse=True)[:5]
+
+
+def _synthetic_records(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = np.random.default_rng(seed)
+    base = datetime(2025, 9, 1)
+    galleries = [f"갤러리 {i}" for i in range(300)] + ["갤러리"]
+    offsets = rng.integers(0, 30 * 24 * 3600, size=n)
+    picks = rng.integers(0, len(galleries), size=n)
+    return [
+        {
+            "timestamp": (base + timedelta(seconds=int(offsets[i]))).isoformat() + "Z",
+            "gallery": galleries[picks[i]],
+            "emotion": "😍 감동",
+            "latitude": 37.5 + rng.random(),
+            "longitude": 127.0 + rng.random(),
+        }
+        for i in range(n)
+    ]
+
+
+def run_benchmark(sizes=(10_000, 100_000)):
+    """기존 루프와 컬럼형 집계의 소요 시간 비교"""
+    start, end = date(2025, 9, 1), date(2025, 9, 30)
+    print(f"{'posts':>8} | {'legacy':>10} | {'frame build':>11} | {'vectorized':>10} | speedup")
+    for n in sizes:
+        records = _synthetic_records(n)
+
+        t0 = time.perf_counter()
+        legacy_daily = _legacy_daily_counts(records, start, end)
+        legacy_top = _legacy_gallery_counts(records)
+        legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        frame = build_review_frame(records, "padlet")
+        build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        daily = daily_counts(frame, start, end)
+        top = top_galleries(frame)
+        query = time.perf_counter() - t0
+
+        assert list(daily.values) == legacy_daily
+        assert [c for _, c in top] == [c for _, c in legacy_top]
+        print(f"{n:>8} | {legacy:>9.3f}s | {build:>10.3f}s | {query:>9.4f}s | "
+              f"{legacy / (build + query):.0f}x (rerun {legacy / query:.0f}x)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,301 @@
+"""
+후기 롤업 테이블
+요일×시간 방문 수, 갤러리별 별점/체류 시간 합계, 감정 수를 후기가 들어올 때마다 증분 갱신하고
+로컬 파일에 저장해 분석 탭이 버킷 수만큼의 비용으로 바로 읽도록 함
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+
+FORMAT_VERSION = 2           # 2: 호스트 타임존 변환, 감정 이름 통일
+
+KST = timezone(timedelta(hours=9))
+WEEKDAY_LABELS = ["월", "화", "수", "목", "금", "토", "일"]
+
+# 히트맵 시간대 구분 (시작 시각 포함, 끝 시각 제외)
+DAY_PERIODS = [("오전", 0, 12), ("오후", 12, 18), ("저녁", 18, 24)]
+
+# 감정 이모지 → 집계용 이름 (후기 양식 "😍 감동적이었어요"와 Padlet 본문 "😍 감동"을 같은 칸으로)
+EMOTION_LABELS = {
+    "😍": "😍 감동",
+    "👍": "👍 추천",
+    "😊": "😊 좋음",
+    "🤔": "🤔 보통",
+    "😴": "😴 아쉬움",
+    "💸": "💸 가격",
+}
+
+# 레코드 하나의 기여분: (요일, 시각, 갤러리, 별점, 체류 시간, 감정)
+Contribution = Tuple[Optional[int], Optional[int], str, Optional[int], Optional[float], str]
+
+
+def _to_local(value: Any) -> Optional[datetime]:
+    """
+    문자열/datetime을 한국 시간 datetime으로
+
+    타임존 없는 값(로컬 후기의 datetime.now())은 이 서버의 로컬 시각으로 보고 변환한다.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    try:
+        return value.astimezone(KST)    # naive 값은 호스트 타임존 기준
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def normalize_emotion(label: Any) -> str:
+    """감정 이름 통일 (앞의 이모지 기준, 모르는 이모지는 그대로)"""
+    label = str(label or '').strip()
+    if not label:
+        return ''
+    return EMOTION_LABELS.get(label.split()[0], label)
+
+
+def _number(value: Any, cast):
+    try:
+        return cast(value) if value not in (None, '') else None
+    except (TypeError, ValueError):
+        return None
+
+
+def contribution(record: Dict[str, Any]) -> Contribution:
+    """
+    reviews 형식 레코드가 각 롤업에 더하는 값
+
+    timestamp가 없는 레코드는 요일×시각 표에 넣지 않는다.
+    """
+    stamp = _to_local(record.get('timestamp'))
+    rating = _number(record.get('rating'), int)
+    if rating is not None and not 1 <= rating <= 5:
+        rating = None
+    return (
+        stamp.weekday() if stamp else None,
+        stamp.hour if stamp else None,
+        record.get('gallery') or '',
+        rating,
+        _number(record.get('stay_time'), float),
+        normalize_emotion(record.get('emotion')),
+    )
+
+
+class ReviewRollups:
+    """
+    증분 후기 롤업
+
+    - add()/remove()/sync(): 레코드 id별 기여분을 기억해 바뀐 레코드만 더하고 뺌
+    - 읽기 함수는 레코드 수와 관계없이 버킷(요일×시간, 갤러리, 감정) 수만큼만 순회
+    - path를 주면 save()로 JSON 파일에 저장하고 다음 실행에서 이어서 사용
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+
+        self._lock = threading.RLock()
+        self._records: Dict[str, Contribution] = {}
+        self._reset_tables()
+        self._dirty = False
+
+        if path:
+            self.load()
+
+    def _reset_tables(self):
+        self.weekday_hour = [[0] * 24 for _ in range(7)]
+        self.ratings = [0] * 5                                  # 별점 1~5
+        self.galleries: Dict[str, List[float]] = {}             # 이름 → [후기 수, 별점 합, 별점 수, 체류 합, 체류 수]
+        self.emotions: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record_id: Hashable, record: Dict[str, Any]) -> bool:
+        """
+        레코드 추가/갱신
+
+        Returns:
+            롤업이 바뀌었으면 True (기여분이 같으면 False)
+        """
+        record_id = str(record_id)
+        value = contribution(record)
+        with self._lock:
+            previous = self._records.get(record_id)
+            if previous == value:
+                return False
+            if previous is not None:
+                self._apply(previous, -1)
+            self._apply(value, 1)
+            self._records[record_id] = value
+            self._dirty = True
+            return True
+
+    update = add
+
+    def remove(self, record_id: Hashable) -> bool:
+        with self._lock:
+            previous = self._records.pop(str(record_id), None)
+            if previous is None:
+                return False
+            self._apply(previous, -1)
+            self._dirty = True
+            return True
+
+    def sync(self, records: Mapping[Hashable, Dict[str, Any]]) -> Dict[str, int]:
+        """
+        롤업을 주어진 레코드 집합과 같게 맞춤
+
+        Args:
+            records: 레코드 id → reviews 형식 레코드 (여기 없는 레코드는 제거)
+
+        Returns:
+            changed: 추가/수정된 레코드 수
+            removed: 제거된 레코드 수
+        """
+        with self._lock:
+            changed = sum(1 for record_id, record in records.items() if self.add(record_id, record))
+            keep = {str(record_id) for record_id in records}
+            stale = [record_id for record_id in self._records if record_id not in keep]
+            for record_id in stale:
+                self.remove(record_id)
+        return {"changed": changed, "removed": len(stale)}
+
+    def _apply(self, value: Contribution, sign: int):
+        weekday, hour, gallery, rating, stay_time, emotion = value
+        if weekday is not None:
+            self.weekday_hour[weekday][hour] += sign
+        if rating is not None:
+            self.ratings[rating - 1] += sign
+        if gallery:
+            sums = self.galleries.setdefault(gallery, [0, 0, 0, 0.0, 0])
+            sums[0] += sign
+            if rating is not None:
+                sums[1] += sign * rating
+                sums[2] += sign
+            if stay_time is not None:
+                sums[3] += sign * stay_time
+                sums[4] += sign
+            if sums[0] <= 0:
+                del self.galleries[gallery]
+        if emotion:
+            self.emotions[emotion] += sign
+            if self.emotions[emotion] <= 0:
+                del self.emotions[emotion]
+
+    # ------------------------------------------------------------------
+    # 읽기 (버킷 수만큼만 순회)
+    # ------------------------------------------------------------------
+
+    def rating_distribution(self) -> Dict[int, int]:
+        """별점(1~5)별 후기 수"""
+        with self._lock:
+            return {rating: self.ratings[rating - 1] for rating in range(1, 6)}
+
+    def emotion_counts(self) -> List[Tuple[str, int]]:
+        """감정별 후기 수 (많은 순)"""
+        with self._lock:
+            return self.emotions.most_common()
+
+    def hourly_counts(self) -> List[int]:
+        """시각(0~23)별 후기 수"""
+        with self._lock:
+            return [sum(row[hour] for row in self.weekday_hour) for hour in range(24)]
+
+    def weekday_period_matrix(self, periods=DAY_PERIODS) -> List[List[int]]:
+        """요일(행, 월~일) × 시간대(열) 후기 수"""
+        with self._lock:
+            return [[sum(row[start:end]) for _, start, end in periods] for row in self.weekday_hour]
+
+    def stay_time_by_gallery(self, n: Optional[int] = None) -> List[Tuple[str, float]]:
+        """갤러리별 평균 체류 시간 (긴 순, 체류 시간이 기록된 갤러리만)"""
+        with self._lock:
+            averages = [(name, sums[3] / sums[4]) for name, sums in self.galleries.items() if sums[4] > 0]
+        averages.sort(key=lambda item: item[1], reverse=True)
+        return averages[:n] if n is not None else averages
+
+    def combined(self, *others: "ReviewRollups") -> "ReviewRollups":
+        """
+        다른 롤업과 테이블을 합친 새 롤업 (메모리 전용, 레코드 목록은 합치지 않음)
+
+        세션 로컬 후기처럼 파일에 넣지 않는 데이터를 화면에서만 더할 때 사용한다.
+        """
+        merged = ReviewRollups()
+        for rollups in (self,) + others:
+            with rollups._lock:
+                for weekday in range(7):
+                    for hour in range(24):
+                        merged.weekday_hour[weekday][hour] += rollups.weekday_hour[weekday][hour]
+                for i in range(5):
+                    merged.ratings[i] += rollups.ratings[i]
+                for name, sums in rollups.galleries.items():
+                    target = merged.galleries.setdefault(name, [0, 0, 0, 0.0, 0])
+                    for i, value in enumerate(sums):
+                        target[i] += value
+                merged.emotions.update(rollups.emotions)
+        return merged
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def load(self) -> bool:
+        """저장된 롤업 불러오기 (없거나 형식이 다르면 빈 롤업으로 시작)"""
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Rollup load error: {e}")
+            return False
+        if data.get("format") != FORMAT_VERSION:
+            return False
+
+        with self._lock:
+            self._records = {record_id: tuple(value) for record_id, value in data["records"].items()}
+            self.weekday_hour = data["weekday_hour"]
+            self.ratings = data["ratings"]
+            self.galleries = data["galleries"]
+            self.emotions = Counter(data["emotions"])
+            self._dirty = False
+        return True
+
+    def save(self) -> bool:
+        """바뀐 내용이 있으면 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = {
+                "format": FORMAT_VERSION,
+                "records": self._records,
+                "weekday_hour": self.weekday_hour,
+                "ratings": self.ratings,
+                "galleries": self.galleries,
+                "emotions": dict(self.emotions),
+            }
+            payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            self._dirty = False
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with self._lock:
+                self._dirty = True
+            raise
+        return True
@@ -0,0 +1,176 @@
+"""
+시작 시간 벤치마크
+Streamlit 진입 파일이 그리기 전에 임포트하는 모듈을 새 인터프리터에서 측정해
+모듈별/누적 임포트 시간을 보고하고, 예산(ms)을 넘으면 실패로 종료
+"""
+
+import ast
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+ENTRY_POINT = "streamlit_app.py"
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "1500"))
+DEFAULT_RUNS = 3
+
+_MISSING = "startup-benchmark-missing:"
+_TOTAL = "startup-benchmark-total-us:"
+
+# importlib.import_module은 -X importtime에 기록되지 않으므로 __import__ 사용
+_SCRIPT = """
+import sys, time
+started = time.perf_counter()
+for name in {modules!r}:
+    try:
+        __import__(name)
+    except Exception as e:
+        print({missing!r}, name, type(e).__name__, e, file=sys.stderr)
+print({total!r}, int((time.perf_counter() - started) * 1e6))
+"""
+
+
+def entry_imports(path: str = ENTRY_POINT) -> Tuple[List[str], List[str]]:
+    """
+    진입 파일의 최상위 임포트와 지연 임포트 목록
+
+    Args:
+        path: Streamlit 진입 파일
+
+    Returns:
+        (시작 시 바로 임포트하는 모듈, lazy_import()로 미뤄 둔 모듈)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    eager, deferred = [], []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            eager.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            eager.append(node.module)
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+            func = node.value.func
+            if (isinstance(func, ast.Name) and func.id == "lazy_import"
+                    and node.value.args and isinstance(node.value.args[0], ast.Constant)):
+                deferred.append(node.value.args[0].value)
+    return list(dict.fromkeys(eager)), list(dict.fromkeys(deferred))
+
+
+def measure_imports(modules: List[str], cwd: Optional[str] = None) -> Dict:
+    """
+    새 인터프리터에서 modules를 순서대로 임포트하며 시간 측정 (python -X importtime)
+
+    Returns:
+        total_ms: 전체 임포트 시간
+        rows: [(모듈, 자체 ms, 누적 ms, 깊이), ...] (importtime 출력 순서)
+        missing: {모듈: 오류 메시지} 임포트에 실패한 모듈
+    """
+    script = _SCRIPT.format(modules=modules, missing=_MISSING, total=_TOTAL)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=cwd or os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+
+    rows, missing, total_ms = [], {}, 0.0
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            parts = line[len("import time:"):].split("|")
+            if len(parts) != 3 or not parts[0].strip().isdigit():
+                continue  # 머리글 줄
+            name = parts[2].rstrip()
+            depth = (len(name) - len(name.lstrip())) // 2
+            rows.append((name.strip(), int(parts[0]) / 1000, int(parts[1]) / 1000, depth))
+        elif line.startswith(_MISSING):
+            _, name, error = line.split(" ", 2)
+            missing[name] = error
+    for line in result.stdout.splitlines():
+        if line.startswith(_TOTAL):
+            total_ms = int(line.split()[-1]) / 1000
+    return {"total_ms": total_ms, "rows": rows, "missing": missing}
+
+
+def import_report(modules: List[str], runs: int = DEFAULT_RUNS, top: int = 10) -> Dict:
+    """
+    여러 번 측정한 임포트 시간 보고서
+
+    Returns:
+        median_ms: 전체 임포트 시간 중앙값
+        modules: [(모듈, 누적 ms), ...] 요청한 모듈별 (마지막 측정, 앞에서 이미 불러온 의존성은 제외)
+        heaviest: [(패키지, 누적 ms), ...] 가장 오래 걸린 최상위 패키지
+        missing: 임포트에 실패한 모듈
+    """
+    measurements = [measure_imports(modules) for _ in range(max(1, runs))]
+    last = measurements[-1]
+
+    requested = set(modules)
+    by_module = {}
+    for name, _, cumulative, _ in last["rows"]:
+        if name in requested and name not in by_module:
+            by_module[name] = cumulative
+    heaviest = sorted(((name, cumulative) for name, _, cumulative, depth in last["rows"] if depth == 0),
+                      key=lambda item: item[1], reverse=True)[:top]
+
+    return {
+        "median_ms": statistics.median(m["total_ms"] for m in measurements),
+        "modules": [(name, by_module.get(name, 0.0)) for name in modules if name not in last["missing"]],
+        "heaviest": heaviest,
+        "missing": last["missing"],
+    }
+
+
+def _print_report(title: str, report: Dict):
+    print(f"\n[{title}] 중앙값 {report['median_ms']:.0f}ms")
+    cumulative = 0.0
+    print(f"  {'module':<32} {'ms':>8} {'cumulative':>11}")
+    for name, ms in report["modules"]:
+        cumulative += ms
+        print(f"  {name:<32} {ms:>8.1f} {cumulative:>11.1f}")
+    print("  가장 무거운 패키지:")
+    for name, ms in report["heaviest"]:
+        print(f"    - {name}: {ms:.1f}ms")
+    for name, error in report["missing"].items():
+        print(f"  ⚠️ {name} 임포트 실패: {error}")
+
+
+def run_benchmark(entry: str = ENTRY_POINT, runs: int = DEFAULT_RUNS,
+                  budget_ms: float = STARTUP_BUDGET_MS, compare_eager: bool = False) -> bool:
+    """
+    진입 파일의 시작 임포트 시간을 측정해 예산과 비교
+
+    Args:
+        entry: Streamlit 진입 파일
+        runs: 측정 횟수 (중앙값 사용)
+        budget_ms: 허용 시간 (ms)
+        compare_eager: 지연 임포트 모듈까지 모두 바로 불러올 때와 비교
+
+    Returns:
+        예산 안이면 True
+    """
+    eager, deferred = entry_imports(entry)
+    print(f"🚀 시작 임포트 벤치마크: {entry} (바로 {len(eager)}개, 지연 {len(deferred)}개, {runs}회)")
+
+    report = import_report(eager, runs)
+    _print_report("시작 시 임포트", report)
+
+    if compare_eager and deferred:
+        everything = import_report(eager + deferred, runs)
+        _print_report("지연 없이 모두 임포트", everything)
+        print(f"\n지연 임포트로 줄어든 시작 시간: {everything['median_ms'] - report['median_ms']:.0f}ms")
+
+    passed = report["median_ms"] <= budget_ms
+    status = "✅ 통과" if passed else "❌ 예산 초과"
+    print(f"\n{status}: {report['median_ms']:.0f}ms / 예산 {budget_ms:.0f}ms")
+    return passed
+
+
+def main():
+    compare_eager = "--eager" in sys.argv[1:]
+    sys.exit(0 if run_benchmark(compare_eager=compare_eager) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,29 @@ Professional UI/UX 개선된 Streamlit 앱
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta, date
-import folium
-from streamlit_folium import st_folium
-import json
 import os
+import re
+import time
 from dotenv import load_dotenv
-import pandas as pd
-import numpy as np
-from padlet_api_complete import PadletAPI
-from supabase_storage import SupabaseStorage
-from updated_locations import COMPLETE_GALLERY_LOCATIONS
+from lazy_imports import lazy_import, load_times
+from gallery_registry import REGISTRY
 from gallery_coordinates import get_gallery_coordinates
+from term_index import TermIndex
+from figure_cache import FigureCache, data_fingerprint
+from review_rollups import ReviewRollups, DAY_PERIODS, WEEKDAY_LABELS
+
+# 무거운 모듈은 해당 화면에서 처음 사용할 때 임포트 (startup_benchmark.py로 측정)
+go = lazy_import("plotly.graph_objects")
+pd = lazy_import("pandas")
+padlet_api = lazy_import("padlet_api_complete")
+board_snapshot = lazy_import("board_snapshot")
+aggregates = lazy_import("dashboard_aggregates")
+review_frames = lazy_import("review_frame")
+supabase_storage = lazy_import("supabase_storage")
+submissions = lazy_import("submission_queue")
+spatial = lazy_import("gallery_spatial")
+mentions = lazy_import("gallery_mentions")
 
 # .env 파일 로드
 load_dotenv()
@@ -200,8 +209,8 @@ st.markdown("""
         border-bottom: 2px solid rgba(102, 126, 234, 0.2);
     }
     
-    /* 탭 스타일 */
-    .stTabs [data-baseweb="tab-list"] {
+    /* 화면 전환 (탭 모양 라디오) */
+    .stRadio [role="radiogroup"] {
         gap: 1rem;
         background: white;
         padding: 0.5rem;
@@ -209,20 +218,24 @@ st.markdown("""
         box-shadow: 0 2px 10px rgba(0, 0, 0, 0.05);
     }
     
-    .stTabs [data-baseweb="tab"] {
+    .stRadio [data-baseweb="radio"] {
         border-radius: 8px;
         padding: 0.75rem 1.5rem;
         font-weight: 600;
         transition: all 0.3s ease;
     }
     
-    .stTabs [aria-selected="true"] {
+    .stRadio [data-baseweb="radio"] > div:first-child {
+        display: none;
+    }
+    
+    .stRadio [data-baseweb="radio"]:has(input:checked) {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
     }
     
-    /* 첫 번째 탭 특별 스타일 */
-    .stTabs [data-baseweb="tab"]:first-child[aria-selected="true"] {
+    /* 첫 번째 화면 특별 스타일 */
+    .stRadio [data-baseweb="radio"]:first-child:has(input:checked) {
         background: linear-gradient(135deg, #ec4899 0%, #f43f5e 100%) !important;
     }
     
@@ -284,79 +297,11 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# 갤러리 이름을 정규화하는 함수
-def normalize_gallery_name(gallery_name):
-    """갤러리 이름을 정규화하여 COMPLETE_GALLERY_LOCATIONS와 매칭"""
-    # 괄호 안 내용 제거 (예: "프리즈 서울 (COEX)" -> "프리즈 서울")
-    normalized = gallery_name.split('(')[0].strip()
-    
-    # 매핑 테이블
-    name_mapping = {
-        "프리즈 서울": "코엑스",
-        "키아프": "코엑스",
-        "국제갤러리": "국제갤러리",
-        "갤러리 진선": "갤러리진선",
-        "예화랑": "예화랑",
-        "우손갤러리 서울": "우손갤러리",
-        "이화익갤러리": "이화익갤러리",
-        "초이앤초이 갤러리": "초이앤초이갤러리",
-        "갤러리현대": "갤러리현대",
-        "학고재": "학고재",
-        "바라캇 컨템포러리": "바라캇컨템포러리",
-        "BAIK ART Seoul": "백아트",
-        "갤러리 조선": "갤러리조선",
-        "아라리오갤러리 서울": "아라리오갤러리",
-        "아트선재센터": "아트선재센터",
-        "재단법인 예울": "여재단",
-        "전혁림 (포즈뮤지엄사진)": "전혁림",
-        "(ICA) 우양미술관·더성북도원미술관": "우양미술관",
-        "(삼청) PKM갤러리": "PKM갤러리",
-        "갤러리 가이아": "갤러리가이아",
-        "갤러리 그라프": "갤러리그라프",
-        "김리아갤러리": "김리아갤러리",
-        "갤러리 피치": "갤러리피치",
-        "갤러리 플래닛": "갤러리플래닛",
-        "갤러리위 청담": "갤러리위청담",
-        "Gladstone Gallery Seoul": "글래드스톤갤러리",
-        "White Cube Seoul": "화이트큐브서울",
-        "페로탕": "페로탕",
-        "G Gallery 지갤러리": "G갤러리",
-        "LEE EUGEAN GALLERY 이유진갤러리": "이유진갤러리",
-        "송은": "송은아트스페이스",
-        "아뜰리에 에르메스": "아뜰리에에르메스",
-        "BHAK": "바크",
-        "갤러리 SP": "갤러리SP",
-        "갤러리조은": "갤러리조은",
-        "가나아트 한남": "가나아트한남",
-        "리만머핀": "리만머핀",
-        "에스더쉬퍼": "에스더쉬퍼",
-        "타데우스 로팍 서울": "타데우스로팍",
-        "갤러리바톤": "갤러리바톤",
-        "디스위켄드룸": "디스위켄드룸",
-        "ThisWeekendRoom": "디스위켄드룸",
-        "조현화랑 서울": "조현화랑",
-        "P21": "P21",
-        "실린더2": "실린더2",
-        "두아르트 스퀘이라 서울": "두아르트",
-        "양혜규스튜디오": "양혜규스튜디오",
-        "리움미술관": "리움미술관",
-        "PKM갤러리": "PKM갤러리",
-        "페이스갤러리": "페이스갤러리",
-        "가나아트센터": "가나아트센터",
-        "대림미술관": "대림미술관",
-        "삼성미술관": "리움미술관"
-    }
-    
-    return name_mapping.get(normalized, normalized)
-
 def get_gallery_location(gallery_name):
-    """갤러리 이름으로 실제 위치 정보 가져오기"""
-    normalized_name = normalize_gallery_name(gallery_name)
-    
-    # COMPLETE_GALLERY_LOCATIONS에서 위치 정보 찾기
-    if normalized_name in COMPLETE_GALLERY_LOCATIONS:
-        location = COMPLETE_GALLERY_LOCATIONS[normalized_name]
-        return location["lat"], location["lng"]
+    """갤러리 이름으로 실제 위치 정보 가져오기 (gallery_names로 정규화해 레지스트리에서 조회)"""
+    gallery = REGISTRY.resolve(gallery_name)
+    if gallery and not gallery.is_area:
+        return gallery.lat, gallery.lng
     
     # 못 찾으면 삼청동 중심 좌표 반환 (폴백)
     return 37.5789, 126.9770
@@ -378,86 +323,291 @@ if 'submission_in_progress' not in st.session_state:
     st.session_state.submission_in_progress = False
 if 'last_submission_time' not in st.session_state:
     st.session_state.last_submission_time = None
+if 'my_submissions' not in st.session_state:
+    st.session_state.my_submissions = []
 
-# Padlet 데이터 가져오기 함수
-def fetch_padlet_data():
-    """Padlet에서 데이터를 가져와서 로컬 데이터와 동기화"""
+# 후기 제출 대기열 워커
+@st.cache_resource
+def get_submission_worker():
+    """
+    후기 제출 대기열 워커 (프로세스 전역, 모든 세션이 공유)
+    
+    Returns:
+        시작된 SubmissionWorker
+    """
+    worker = submissions.SubmissionWorker(submissions.SubmissionQueue(), padlet_api.PadletAPI(), supabase_storage.SupabaseStorage())
+    worker.start()
+    return worker
+
+# Padlet 보드 스냅샷 (프로세스 전역, 모든 세션이 공유)
+PADLET_BOARD_ID = "blwpq840o1u57awd"
+PADLET_SNAPSHOT_TTL = 900  # 15분
+PADLET_REFRESH_INTERVAL = float(os.getenv('PADLET_REFRESH_INTERVAL', '60'))  # 백그라운드 갱신 주기 (초)
+
+@st.cache_resource
+def get_board_snapshots():
+    """
+    모든 세션이 공유하는 보드 스냅샷 제공자
+    
+    TTL 안에서는 세션 수와 관계없이 보드를 한 번만 받고,
+    만료 시 동시에 들어온 요청들도 한 번의 fetch 결과를 함께 사용한다.
+    """
+    return board_snapshot.BoardSnapshotProvider(padlet_api.PadletAPI(), PADLET_BOARD_ID, ttl=PADLET_SNAPSHOT_TTL)
+
+@st.cache_resource
+def get_board_refresher():
+    """
+    스냅샷을 백그라운드에서 계속 갱신하는 스레드 (프로세스당 하나)
+    
+    렌더링 경로에서는 네트워크 요청 없이 마지막 정상 스냅샷만 읽는다.
+    """
+    refresher = board_snapshot.SnapshotRefresher(get_board_snapshots(), interval=PADLET_REFRESH_INTERVAL)
+    refresher.start()
+    return refresher
+
+@st.cache_resource
+def get_padlet_term_index():
+    """
+    Padlet 후기 단어 색인 (프로세스 전역, 파일에 저장되어 재시작 후에도 유지)
+    
+    스냅샷 버전이 바뀌면 추가/수정/삭제된 포스트만 다시 토큰화한다.
+    """
+    return TermIndex(os.path.join("css_art_map_data", "dashboard_terms.json"),
+                     tokenizer=aggregates.review_terms, tokenizer_version=aggregates.REVIEW_TERMS_VERSION)
+
+def sync_padlet_terms(padlet_data):
+    """공유 단어 색인을 Padlet 데이터와 맞추고 저장 (스냅샷 버전마다 한 번만 실행)"""
+    index = get_padlet_term_index()
+    index.sync({r['padlet_id']: r['review'] for r in padlet_data if r.get('review')})
+    try:
+        index.save()
+    except OSError as e:
+        print(f"Term index save error: {e}")
+    return index
+
+@st.cache_resource
+def get_padlet_rollups():
+    """
+    Padlet 후기 롤업 (프로세스 전역, 파일에 저장되어 재시작 후에도 유지)
+    
+    스냅샷 버전이 바뀌면 추가/수정/삭제된 포스트의 기여분만 더하고 뺀다.
+    """
+    return ReviewRollups(os.path.join("css_art_map_data", "review_rollups.json"))
+
+def sync_padlet_rollups(padlet_data):
+    """공유 롤업을 Padlet 데이터와 맞추고 저장 (스냅샷 버전마다 한 번만 실행)"""
+    rollups = get_padlet_rollups()
+    rollups.sync({r['padlet_id']: r for r in padlet_data})
     try:
-        # 마지막 fetch로부터 15분이 지났는지 체크
-        if st.session_state.last_padlet_fetch:
-            time_diff = (datetime.now() - st.session_state.last_padlet_fetch).total_seconds()
-            if time_diff < 900:
-                return  # 15분 이내면 다시 가져오지 않음
+        rollups.save()
+    except OSError as e:
+        print(f"Rollup save error: {e}")
+    return rollups
+
+def get_local_term_index():
+    """이 세션의 로컬 후기 단어 색인 (후기는 추가만 되므로 새 후기만 색인)"""
+    if 'local_terms' not in st.session_state:
+        st.session_state.local_terms = TermIndex(tokenizer=aggregates.review_terms)
+    index = st.session_state.local_terms
+    reviews = st.session_state.reviews
+    for position in range(len(index), len(reviews)):
+        index.add(position, reviews[position].get('review') or '')
+    return index
+
+# 후기 제출 양식의 별점/체류시간 줄 ("⭐ ⭐⭐⭐⭐", "⏱️ 체류시간: 1.5시간")
+_RATING_LINE = re.compile(r'⭐\s+(⭐{1,5})')
+_STAY_LINE = re.compile(r'체류시간:\s*(\d+(?:\.\d+)?)')
+
+def build_padlet_data(snapshot):
+    """스냅샷의 포스트를 reviews 형식으로 변환 (스냅샷 버전마다 한 번만 실행)"""
+    padlet_data = []
+    for post in snapshot.posts:
+        name = post.location_name or post.subject  # 장소명 또는 제목 사용
+        
+        # 정식 이름으로 (예: "관람객의 밤 - 코엑스"처럼 이름 안에 갤러리가 있으면 그 갤러리)
+        gallery = REGISTRY.resolve(name) or (mentions.mentioned_gallery(name) if name else None)
         
-        padlet_api = PadletAPI()
-        board_id = "blwpq840o1u57awd"
+        latitude, longitude, location_source = post.latitude, post.longitude, 'padlet'
+        if not post.has_location:
+            # 위치 정보가 없으면 제목/본문에 적힌 갤러리 좌표 사용 (갤러리가 없으면 제외)
+            if gallery is None or gallery.is_area:
+                gallery = mentions.mentioned_gallery(post.text)
+            if gallery is None:
+                continue
+            latitude, longitude, location_source = gallery.lat, gallery.lng, 'mention'
         
-        # Padlet 보드 데이터 가져오기
-        board_data = padlet_api.get_board(board_id, include_posts=True)
+        body = post.body  # HTML을 텍스트로 처리 필요
         
-        if 'data' in board_data and 'included' in board_data:
-            posts = board_data['included']
-            
-            # 기존 데이터 초기화 후 새로 로드
-            st.session_state.padlet_data = []
-            
-            # Padlet 포스트를 reviews 형식으로 변환
-            for post in posts:
-                if post.get('type') == 'post':
-                    attributes = post.get('attributes', {})
-                    content = attributes.get('content', {})
-                    
-                    # 위치 정보 파싱 (mapProps에서)
-                    map_props = attributes.get('mapProps', {})
-                    lat = map_props.get('latitude')
-                    lng = map_props.get('longitude')
-                    location_name = map_props.get('locationName', '')
-                    
-                    # 콘텐츠에서 제목과 본문 추출
-                    subject = content.get('subject', '')
-                    body_html = content.get('bodyHtml', '')
-                    body = body_html if body_html else ''  # HTML을 텍스트로 처리 필요
-                    
-                    # 감정 이모지 파싱 (본문에서 추출)
-                    emotion = '👍 만족'
-                    if '😍' in body:
-                        emotion = '😍 감동'
-                    elif '😴' in body:
-                        emotion = '😴 지루'
-                    elif '💸' in body:
-                        emotion = '💸 가격'
-                    elif '🤔' in body:
-                        emotion = '🤔 고민'
-                    
-                    # 위치 정보가 있는 경우만 추가
-                    if lat and lng:
-                        padlet_review = {
-                            'padlet_id': post.get('id'),
-                            'gallery': location_name if location_name else subject,  # 장소명 또는 제목 사용
-                            'review': body,
-                            'timestamp': attributes.get('createdAt', datetime.now().isoformat()),
-                            'emotion': emotion,
-                            'latitude': lat,
-                            'longitude': lng,
-                            'from_padlet': True
-                        }
-                        st.session_state.padlet_data.append(padlet_review)
+        # 감정 이모지 파싱 (본문에서 추출)
+        emotion = '👍 만족'
+        if '😍' in body:
+            emotion = '😍 감동'
+        elif '😴' in body:
+            emotion = '😴 지루'
+        elif '💸' in body:
+            emotion = '💸 가격'
+        elif '🤔' in body:
+            emotion = '🤔 고민'
+        elif '😊' in body:
+            emotion = '😊 좋음'
         
-        st.session_state.last_padlet_fetch = datetime.now()
+        rating = _RATING_LINE.search(body)
+        stay_time = _STAY_LINE.search(body)
+        
+        padlet_data.append({
+            'padlet_id': post.id,
+            'gallery': gallery.id if gallery else name,
+            'review': body,
+            'timestamp': post.created_at,  # 생성 시각이 없으면 시간대 집계에서 제외
+            'emotion': emotion,
+            'latitude': latitude,
+            'longitude': longitude,
+            'location_source': location_source,  # 'padlet' (지도 위치) 또는 'mention' (본문에 적힌 갤러리)
+            'rating': len(rating.group(1)) if rating else None,
+            'stay_time': float(stay_time.group(1)) if stay_time else None,
+            'from_padlet': True
+        })
+    
+    # 갤러리 정식 이름이 아닌 장소명(빈 값, 기본값, 주소, 동네 이름)은 좌표로 가까운 갤러리에 한 번에 스냅
+    unnamed = [r for r in padlet_data if not REGISTRY.is_gallery(r['gallery'])]
+    if unnamed:
+        names = spatial.snap_to_galleries([r['latitude'] for r in unnamed], [r['longitude'] for r in unnamed])
+        for record, name in zip(unnamed, names):
+            if name:
+                record['gallery'] = name
+    return padlet_data
+
+# Padlet 데이터 가져오기 함수
+def fetch_padlet_data():
+    """공유 스냅샷에서 Padlet 데이터를 가져와 세션에 연결 (복사하지 않음, 네트워크 요청 없음)"""
+    try:
+        snapshot = get_board_refresher().snapshot()
+        if snapshot is None:
+            return False  # 첫 갱신이 아직 끝나지 않음
+        if st.session_state.last_padlet_fetch == snapshot.fetched_at:
+            return True  # 이 세션이 이미 최신 스냅샷을 보고 있음
+        
+        # 같은 버전이면 모든 세션이 같은 리스트를 참조
+        st.session_state.padlet_data = snapshot.derive("padlet_data", build_padlet_data)
+        st.session_state.last_padlet_fetch = snapshot.fetched_at
         
         # 디버깅을 위한 로그 (성공 시만 표시)
         return True
         
     except Exception as e:
-        # 에러가 있어도 앱이 중단되지 않도록
+        # 에러가 있어도 앱이 중단되지 않도록 (마지막으로 받은 데이터 유지)
         print(f"Padlet fetch error: {e}")  # 디버깅용
         return False
 
-# 메인 탭 (사용 설명을 첫 번째로)
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["📖 사용 설명", "🗺️ Padlet 지도", "✍️ 직접 작성", "📊 대시보드", "📈 분석"])
+def _shared_padlet_snapshot():
+    """세션의 padlet_data가 공유 스냅샷의 것이면 그 스냅샷 반환 (파생 값 공유 가능 여부)"""
+    snapshot = get_board_refresher().snapshot()
+    if snapshot is not None and st.session_state.padlet_data is snapshot.derive("padlet_data", build_padlet_data):
+        return snapshot
+    return None
+
+def _memoized(name, compute):
+    """(스냅샷 버전, 데이터, 후기 수)가 그대로면 세션에 저장된 이전 결과 재사용"""
+    padlet_data = st.session_state.padlet_data
+    snapshot = _shared_padlet_snapshot()
+    if name not in st.session_state:
+        st.session_state[name] = aggregates.AggregateMemo()
+    
+    # 후기는 추가만 되므로 개수로 변경 여부를 판단
+    key = (snapshot.version if snapshot else None, id(padlet_data), len(padlet_data), len(st.session_state.reviews))
+    return st.session_state[name].get(key, lambda: compute(snapshot, padlet_data, st.session_state.reviews))
+
+def _top_keywords(snapshot, padlet_data, k):
+    """Padlet 단어 색인의 전체 빈도에 이 세션의 로컬 후기 빈도만 더한 상위 k개"""
+    if snapshot is not None:
+        padlet_terms = snapshot.derive("term_index", lambda s: sync_padlet_terms(padlet_data))
+    else:
+        padlet_terms = TermIndex(tokenizer=aggregates.review_terms)
+        padlet_terms.sync({i: r['review'] for i, r in enumerate(padlet_data) if r.get('review')})
+    return padlet_terms.top_k(k, extra=get_local_term_index().counts())
+
+def get_top_keywords(k=12):
+    """인기 키워드 상위 k개 (데이터가 바뀔 때만 다시 조회)"""
+    return _memoized(f'keywords_memo_{k}', lambda snapshot, padlet_data, reviews: _top_keywords(snapshot, padlet_data, k))
+
+# 대시보드 집계 (데이터가 바뀔 때만 다시 계산)
+def get_dashboard_aggregates():
+    """
+    대시보드 지표 반환
+    
+    Padlet 쪽 집계와 단어 색인은 스냅샷 버전마다 한 번 갱신해 모든 세션이 공유하고,
+    로컬 후기와 합친 결과는 (스냅샷 버전, 후기 수)가 바뀔 때만 세션별로 다시 만든다.
+    """
+    def _compute(snapshot, padlet_data, reviews):
+        if snapshot is not None:
+            padlet_partial = snapshot.derive(
+                "dashboard_partial",
+                lambda s: aggregates.aggregate_records(padlet_data, exclude_gallery=aggregates.DEFAULT_GALLERY_NAME)
+            )
+        else:
+            padlet_partial = aggregates.aggregate_records(padlet_data, exclude_gallery=aggregates.DEFAULT_GALLERY_NAME)
+        most_common_words = _top_keywords(snapshot, padlet_data, 5)
+        return aggregates.merge_aggregates(padlet_partial, aggregates.aggregate_records(reviews), most_common_words)
+    
+    return _memoized('dashboard_memo', _compute)
+
+# 분석 탭 롤업 (데이터가 바뀔 때만 다시 합침)
+def get_analysis_rollups():
+    """
+    Padlet + 로컬 후기 롤업
+    
+    Padlet 쪽 롤업은 스냅샷 버전마다 한 번 증분 갱신해 모든 세션이 공유하고,
+    로컬 후기는 버킷 단위로만 더한다.
+    """
+    def _compute(snapshot, padlet_data, reviews):
+        if snapshot is not None:
+            padlet_rollups = snapshot.derive("review_rollups", lambda s: sync_padlet_rollups(padlet_data))
+        else:
+            padlet_rollups = ReviewRollups()
+            padlet_rollups.sync({r['padlet_id']: r for r in padlet_data})
+        local_rollups = ReviewRollups()
+        local_rollups.sync(dict(enumerate(reviews)))
+        return padlet_rollups.combined(local_rollups)
+    
+    return _memoized('rollups_memo', _compute)
+
+@st.cache_resource
+def get_figure_cache():
+    """차트 그림 캐시 (프로세스 전역, 모든 세션이 공유)"""
+    return FigureCache()
+
+def render_chart(chart_id, builder, *data):
+    """
+    차트 그리기 (같은 데이터로 그린 적이 있으면 저장된 go.Figure 사용)
+    
+    딕셔너리가 아닌 go.Figure를 넘겨야 st.plotly_chart가 그림을 다시 만들어 검증하지 않는다.
+    
+    Args:
+        chart_id: 차트 이름
+        builder: go.Figure를 만드는 함수 (캐시에 없을 때만 실행)
+        data: 차트가 표시하는 데이터 (지문 계산용)
+    """
+    fig = get_figure_cache().get_or_build(chart_id, data_fingerprint(*data), builder)
+    st.plotly_chart(fig, use_container_width=True)
+
+# 차트용 컬럼형 프레임 (데이터가 바뀔 때만 다시 적재)
+def get_review_frame():
+    """
+    Padlet + 로컬 후기 컬럼형 프레임
+    
+    Padlet 쪽 프레임은 스냅샷 버전마다 한 번 만들어 모든 세션이 공유한다.
+    """
+    def _compute(snapshot, padlet_data, reviews):
+        if snapshot is not None:
+            padlet_frame = snapshot.derive("review_frame", lambda s: review_frames.build_review_frame(padlet_data, "padlet"))
+        else:
+            padlet_frame = review_frames.build_review_frame(padlet_data, "padlet")
+        return review_frames.combine_frames(padlet_frame, review_frames.build_review_frame(reviews, "local"))
+    
+    return _memoized('review_frame_memo', _compute)
 
 # 사용 설명 탭
-with tab1:
+def render_guide():
     st.markdown('<div class="section-title">📖 사용 가이드</div>', unsafe_allow_html=True)
     
     # 언어 선택
@@ -593,7 +743,7 @@ with tab1:
             st.caption(f"Target: 50 (Achievement: {progress:.0f}%)")
 
 # Padlet 지도 탭
-with tab2:
+def render_padlet_map():
     st.markdown('<div class="section-title">🗺️ Padlet 실시간 지도</div>', unsafe_allow_html=True)
     
     # Padlet 데이터 가져오기 시도
@@ -629,7 +779,7 @@ with tab2:
         """, unsafe_allow_html=True)
 
 # 직접 작성 탭 (이전 후기 작성 탭)
-with tab3:
+def render_write():
     st.markdown('<div class="section-title">✍️ 갤러리 방문 후기 작성</div>', unsafe_allow_html=True)
     
     col1, col2 = st.columns([2, 1])
@@ -756,13 +906,12 @@ with tab3:
                 help="사진을 업로드하면 Supabase 클라우드에 저장되고 Padlet에 공유됩니다."
             )
             
-            photo_url = None
             if uploaded_file is not None:
                 st.image(uploaded_file, caption="업로드된 사진 (미리보기)", use_container_width=True)
                 
                 # Supabase Storage 초기화
                 if 'storage' not in st.session_state:
-                    st.session_state.storage = SupabaseStorage()
+                    st.session_state.storage = supabase_storage.SupabaseStorage()
                 
                 # Supabase가 설정되어 있으면 업로드 시도
                 if st.session_state.storage.client:
@@ -814,11 +963,8 @@ with tab3:
                 if gallery_name and review_text:
                     st.session_state.submission_in_progress = True
                     st.session_state.last_submission_time = datetime.now()
-                    # 사진 업로드 처리
-                    photo_url = None
-                    if uploaded_file and hasattr(st.session_state, 'storage') and st.session_state.storage.client:
-                        with st.spinner("사진 업로드 중..."):
-                            photo_url = st.session_state.storage.upload_photo(uploaded_file, gallery_name)
+                    # 사진은 바이트만 읽어 두고 업로드는 백그라운드 워커가 처리
+                    photo_bytes = uploaded_file.getvalue() if uploaded_file else None
                     
                     # 데이터 저장
                     new_review = {
@@ -829,90 +975,90 @@ with tab3:
                         'review': review_text,
                         'visit_date': visit_date,
                         'stay_time': stay_time,
-                        'photo': photo_url if photo_url else (uploaded_file.name if uploaded_file else None),
+                        'photo': uploaded_file.name if uploaded_file else None,
                         'timestamp': datetime.now()
                     }
                     
-                    st.session_state.reviews.append(new_review)
+                    # 후기 내용 포맷팅 (사진 URL은 업로드 후 워커가 추가)
+                    post_content = f"""
+                    📍 {gallery_name}
+                    🎨 {exhibition_name if exhibition_name else '전시 정보 없음'}
+                    ⭐ {'⭐' * rating}
+                    {emotion}
+                    
+                    {review_text}
                     
-                    # Padlet API로 전송
+                    ⏱️ 체류시간: {stay_time}시간
+                    📅 방문일: {visit_date}
+                    """
+                    
+                    # 갤러리의 실제 좌표 가져오기 (직접 입력인 경우 지역 정보 전달)
+                    custom_location = st.session_state.get('custom_location', None) if '🖊️ 직접 입력' in str(st.session_state.get('gallery_dropdown', '')) else None
+                    
+                    # 우선 updated_locations에서 정확한 좌표 시도
+                    lat, lng = get_gallery_location(gallery_name)
+                    
+                    # 못 찾으면 gallery_coordinates에서 시도
+                    if lat == 37.5789 and lng == 126.9770:  # 기본 좌표인 경우 (삼청동 중심)
+                        gallery_coords = get_gallery_coordinates(gallery_name, custom_location)
+                        lat, lng = gallery_coords["lat"], gallery_coords["lon"]
+                    
+                    # 디버그: 실제 전송되는 좌표 확인
+                    st.info(f"📍 전송 좌표 확인: {gallery_name} -> 위도: {lat}, 경도: {lng}")
+                    
+                    # Padlet 전송은 로컬 대기열에 기록만 하고 바로 반환 (워커가 재시도하며 처리)
+                    enqueued = False
                     try:
-                        padlet_api = PadletAPI()
-                        board_id = "blwpq840o1u57awd"  # CSS Art Map board ID
-                        
-                        # 후기 내용 포맷팅
-                        post_content = f"""
-                        📍 {gallery_name}
-                        🎨 {exhibition_name if exhibition_name else '전시 정보 없음'}
-                        ⭐ {'⭐' * rating}
-                        {emotion}
-                        
-                        {review_text}
-                        
-                        ⏱️ 체류시간: {stay_time}시간
-                        📅 방문일: {visit_date}
-                        """
-                        
-                        # 사진 URL이 있으면 내용에 추가
-                        if photo_url:
-                            post_content += f"\n\n📸 사진 보기: {photo_url}"
-                        
-                        # 갤러리의 실제 좌표 가져오기 (직접 입력인 경우 지역 정보 전달)
-                        custom_location = st.session_state.get('custom_location', None) if '🖊️ 직접 입력' in str(st.session_state.get('gallery_dropdown', '')) else None
-                        
-                        # 우선 updated_locations에서 정확한 좌표 시도
-                        lat, lng = get_gallery_location(gallery_name)
-                        
-                        # 못 찾으면 gallery_coordinates에서 시도
-                        if lat == 37.5789 and lng == 126.9770:  # 기본 좌표인 경우 (삼청동 중심)
-                            gallery_coords = get_gallery_coordinates(gallery_name, custom_location)
-                            lat, lng = gallery_coords["lat"], gallery_coords["lon"]
-                        
-                        # 디버그: 실제 전송되는 좌표 확인
-                        st.info(f"📍 전송 좌표 확인: {gallery_name} -> 위도: {lat}, 경도: {lng}")
-                        
-                        # Padlet에 포스트 생성 (attachment_url 파라미터 사용)
-                        result = padlet_api.create_post(
-                            board_id=board_id,
-                            subject=f"{gallery_name} - {exhibition_name}",
-                            body=post_content,
-                            attachment_url=photo_url,  # 사진 URL 추가
-                            map_props={
-                                "latitude": lat, 
-                                "longitude": lng,
-                                "locationName": gallery_name
-                            }  # 올바른 Padlet API 키 이름으로 GPS 좌표 전달
+                        worker = get_submission_worker()
+                        submission_id = worker.queue.enqueue(
+                            {
+                                "board_id": PADLET_BOARD_ID,  # CSS Art Map board ID
+                                "subject": f"{gallery_name} - {exhibition_name}",
+                                "body": post_content,
+                                "map_props": {
+                                    "latitude": lat,
+                                    "longitude": lng,
+                                    "locationName": gallery_name
+                                },  # 올바른 Padlet API 키 이름으로 GPS 좌표 전달
+                                "gallery_name": gallery_name,
+                            },
+                            photo=photo_bytes,
+                            photo_name=uploaded_file.name if uploaded_file else None,
+                            photo_type=uploaded_file.type if uploaded_file else None,
                         )
-                        
-                        if 'error' not in result:
-                            st.success(f"✅ {gallery_name} 후기가 등록되고 Padlet에 공유되었습니다!")
-                        else:
-                            st.success(f"✅ {gallery_name} 후기가 등록되었습니다!")
-                            st.warning("Padlet 연동 중 문제가 발생했지만 로컬에는 저장되었습니다.")
+                        worker.wake()
+                        st.session_state.my_submissions.append(submission_id)
+                        enqueued = True
                     except Exception as e:
-                        st.success(f"✅ {gallery_name} 후기가 등록되었습니다!")
-                        st.warning(f"⏳ 잠시 후 다시 시도해주세요. 반복 시 Padlet 지도를 이용해주세요.")
+                        print(f"Submission enqueue error: {e}")
+                        st.error(f"❌ 후기를 저장하지 못했습니다. 입력한 내용은 그대로 있으니 다시 등록해주세요. ({e})")
                     
                     # 제출 상태 초기화
                     st.session_state.submission_in_progress = False
                     
-                    # 위치 데이터도 업데이트 (동일한 좌표 사용)
-                    st.session_state.locations_data.append({
-                        'name': gallery_name,
-                        'lat': lat,
-                        'lon': lng,
-                        'emotion': emotion,
-                        'notes': review_text[:100],
-                        'timestamp': datetime.now()
-                    })
-                    
-                    # 평균 체류시간 업데이트
-                    if len(st.session_state.reviews) > 0:
-                        st.session_state.avg_stay_time = sum(r['stay_time'] for r in st.session_state.reviews) / len(st.session_state.reviews)
-                    
-                    st.success(f"✅ {gallery_name} 후기가 등록되었습니다!")
-                    st.balloons()
-                    st.rerun()
+                    if enqueued:
+                        st.session_state.reviews.append(new_review)
+                        
+                        # 위치 데이터도 업데이트 (동일한 좌표 사용)
+                        st.session_state.locations_data.append({
+                            'name': gallery_name,
+                            'lat': lat,
+                            'lon': lng,
+                            'emotion': emotion,
+                            'notes': review_text[:100],
+                            'timestamp': datetime.now()
+                        })
+                        
+                        # 평균 체류시간 업데이트
+                        if len(st.session_state.reviews) > 0:
+                            st.session_state.avg_stay_time = sum(r['stay_time'] for r in st.session_state.reviews) / len(st.session_state.reviews)
+                        
+                        st.success(f"✅ {gallery_name} 후기가 접수되었습니다! Padlet 공유는 잠시 후 자동으로 진행됩니다.")
+                        st.balloons()
+                        st.rerun()
+                    else:
+                        # 저장 실패 시 폼 내용을 유지하고 바로 다시 등록할 수 있게 함
+                        st.session_state.last_submission_time = None
                 else:
                     st.session_state.submission_in_progress = False
                     st.error("갤러리 이름과 후기를 입력해주세요!")
@@ -946,26 +1092,36 @@ with tab3:
                 """, unsafe_allow_html=True)
         else:
             st.info("아직 등록된 후기가 없습니다. 첫 번째 후기를 작성해보세요!")
+        
+        # 내 후기의 Padlet 전송 상태
+        if st.session_state.my_submissions:
+            st.markdown("### 📮 Padlet 전송 상태")
+            submission_worker = get_submission_worker()
+            for submission in submission_worker.queue.get_many(st.session_state.my_submissions[-5:])[::-1]:
+                label = submissions.STATUS_LABELS.get(submission['status'], submission['status'])
+                gallery = submission['payload'].get('gallery_name', '')
+                st.markdown(f"**{gallery}** · {label}")
+                if submission['status'] == submissions.PENDING and submission['last_error']:
+                    st.caption(f"재시도 {submission['attempts']}회 · {submission['last_error'][:80]}")
+                elif submission['status'] == submissions.FAILED:
+                    st.caption(submission['last_error'] or "")
+                    if st.button("다시 시도", key=f"retry_{submission['id']}"):
+                        submission_worker.queue.requeue(submission['id'])
+                        submission_worker.wake()
+                        st.rerun()
+            if st.button("🔄 상태 새로고침", key="refresh_submissions"):
+                st.rerun()
 
 # 대시보드 탭
-with tab4:
+def render_dashboard():
     # Padlet 데이터 가져오기
     fetch_success = fetch_padlet_data()
     
     # 실제 데이터 계산 (로컬 + Padlet 데이터)
-    # 고유 장소 계산 (중복 제거)
-    unique_locations = set()
-    for review in st.session_state.reviews:
-        gallery = review.get('gallery', '')
-        if gallery:
-            unique_locations.add(gallery)
-    for padlet_post in st.session_state.padlet_data:
-        gallery = padlet_post.get('gallery', '')
-        if gallery and gallery != '갤러리':  # 기본값 제외
-            unique_locations.add(gallery)
-    
-    total_locations = len(unique_locations)
-    total_reviews = len(st.session_state.reviews) + len(st.session_state.padlet_data)
+    dashboard = get_dashboard_aggregates()
+    review_frame = get_review_frame()
+    total_locations = dashboard.total_locations
+    total_reviews = dashboard.total_reviews
     
     # 참여 인원 계산 (Padlet 포스트 수 기반 추정)
     total_participants = max(len(st.session_state.padlet_data), st.session_state.total_participants, 1)
@@ -976,6 +1132,16 @@ with tab4:
     elif st.session_state.last_padlet_fetch:
         st.caption(f"🔄 마지막 동기화: {st.session_state.last_padlet_fetch.strftime('%H:%M')} (Padlet: {len(st.session_state.padlet_data)}개)")
     
+    # 백그라운드 갱신 상태
+    refresh_status = get_board_refresher().status()
+    if refresh_status['staleness_seconds'] is None:
+        st.caption("⏳ Padlet 데이터를 불러오는 중입니다...")
+    else:
+        latency = refresh_status['last_latency_ms']
+        st.caption(f"⏱️ 데이터 경과 {refresh_status['staleness_seconds']:.0f}초"
+                   + (f" · 갱신 소요 {latency}ms" if latency is not None else "")
+                   + (" · ⚠️ 최근 갱신 실패 (이전 데이터 표시 중)" if refresh_status['last_error'] else ""))
+    
     # 주요 지표 카드 (3개로 줄임)
     col1, col2, col3 = st.columns(3)
     
@@ -1020,69 +1186,17 @@ with tab4:
     # 특별 섹션 추가
     st.markdown('<div class="section-title">✨ 특별한 기록들</div>', unsafe_allow_html=True)
     
-    # 모든 후기 데이터 수집 (Padlet + 로컬)
-    all_reviews = []
-    for post in st.session_state.padlet_data:
-        if post.get('review'):
-            all_reviews.append(post)
-    for review in st.session_state.reviews:
-        if review.get('review'):
-            all_reviews.append(review)
+    # 모든 후기 데이터 (Padlet + 로컬)
+    all_reviews = dashboard.all_reviews
     
     if all_reviews:
         import re
-        from collections import Counter
-        import math
-        
-        # 서울 시청 좌표 (거리 계산 기준점)
-        seoul_lat, seoul_lon = 37.5665, 126.9780
         
-        # 거리 계산 함수 (Haversine formula)
-        def calculate_distance(lat1, lon1, lat2, lon2):
-            R = 6371  # 지구 반지름 (km)
-            lat1_rad = math.radians(lat1)
-            lat2_rad = math.radians(lat2)
-            delta_lat = math.radians(lat2 - lat1)
-            delta_lon = math.radians(lon2 - lon1)
-            
-            a = math.sin(delta_lat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon/2)**2
-            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-            return R * c
-        
-        # 1. 가장 많이 나온 단어 분석
-        all_text = " ".join([r.get('review', '') for r in all_reviews])
-        # HTML 태그 제거
-        all_text = re.sub('<.*?>', '', all_text)
-        # 한글, 영문, 숫자만 추출
-        words = re.findall(r'[가-힣]+|[a-zA-Z]+', all_text.lower())
-        # 불용어 제거
-        stopwords = {'은', '는', '이', '가', '을', '를', '에', '의', '와', '과', '도', '로', '으로', '만', '라서', '하고', '지만', '에서', '으로서', '부터', '까지', '이고', '이며', '이나', '나', '고', '를', '을', '은', '는', '이', '가', '의', '에', '에서', '로', '으로', '와', '과', '한', '하는', '할', '해', '했', '하고', '하는', '된', '되는', '되고', '되어', '됩니다', '합니다', '있습니다', '있다', '있고', '없다', '있는', '있어', '같은', '같다', 'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been', 'be'}
-        filtered_words = [w for w in words if len(w) > 1 and w not in stopwords]
-        
-        if filtered_words:
-            word_counts = Counter(filtered_words)
-            most_common_words = word_counts.most_common(5)
-        else:
-            most_common_words = []
-        
-        # 2. 가장 긴 후기 찾기
-        longest_review = max(all_reviews, key=lambda x: len(x.get('review', '')), default=None)
-        
-        # 3. 서울에서 가장 먼 후기 찾기
-        farthest_review = None
-        max_distance = 0
-        
-        for review in all_reviews:
-            lat = review.get('latitude')
-            lon = review.get('longitude')
-            if lat and lon:
-                try:
-                    distance = calculate_distance(seoul_lat, seoul_lon, float(lat), float(lon))
-                    if distance > max_distance:
-                        max_distance = distance
-                        farthest_review = review
-                except:
-                    continue
+        # 가장 많이 나온 단어 / 가장 긴 후기 / 서울에서 가장 먼 후기 (집계 결과 사용)
+        most_common_words = dashboard.most_common_words
+        longest_review = dashboard.longest_review
+        farthest_review = dashboard.farthest_review
+        max_distance = dashboard.max_distance
         
         # UI 렌더링
         special_cols = st.columns(3)
@@ -1180,110 +1294,60 @@ with tab4:
         today = date.today()
         start_date = date(2025, 9, 1)
         
-        # 날짜 범위 생성
-        dates = pd.date_range(start=start_date, end=today, freq='D')
-        
-        # 날짜별 방문 데이터 집계
-        daily_visits = {}
+        # 날짜별 방문 데이터 집계 (컬럼형 프레임에서 벡터화 집계, 빈 날짜는 0)
+        daily_visits = review_frames.daily_counts(review_frame, start_date, today)
         
-        # Padlet 데이터에서 날짜별 집계
-        for post in st.session_state.padlet_data:
-            try:
-                if isinstance(post.get('timestamp'), str):
-                    post_date = pd.to_datetime(post['timestamp']).date()
-                else:
-                    post_date = post.get('timestamp', datetime.now()).date()
-                
-                if post_date in daily_visits:
-                    daily_visits[post_date] += 1
-                else:
-                    daily_visits[post_date] = 1
-            except:
-                continue
-        
-        # 로컬 데이터에서 날짜별 집계
-        for review in st.session_state.reviews:
-            review_date = review.get('timestamp', datetime.now()).date()
-            if review_date in daily_visits:
-                daily_visits[review_date] += 1
-            else:
-                daily_visits[review_date] = 1
+        def build_daily_chart():
+            df = pd.DataFrame({'Date': daily_visits.index, 'Visits': daily_visits.values})
         
-        # 날짜 리스트에 맞춰 방문 수 배열 생성
-        visits = []
-        for d in dates:
-            date_key = d.date()
-            visits.append(daily_visits.get(date_key, 0))
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=df['Date'], 
+                y=df['Visits'],
+                mode='lines',
+                line=dict(
+                    color='#667eea',
+                    width=3,
+                    shape='spline'
+                ),
+                fill='tozeroy',
+                fillcolor='rgba(102, 126, 234, 0.1)',
+                name='방문자'
+            ))
         
-        df = pd.DataFrame({'Date': dates, 'Visits': visits})
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=df['Date'], 
-            y=df['Visits'],
-            mode='lines',
-            line=dict(
-                color='#667eea',
-                width=3,
-                shape='spline'
-            ),
-            fill='tozeroy',
-            fillcolor='rgba(102, 126, 234, 0.1)',
-            name='방문자'
-        ))
-        
-        fig.update_layout(
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            height=350,
-            margin=dict(l=0, r=0, t=0, b=0),
-            showlegend=False,
-            xaxis=dict(
-                showgrid=False,
-                showline=False,
-                zeroline=False,
-                tickformat='%m/%d',  # 월/일 형식으로 표시
-                tickmode='linear',
-                dtick=86400000  # 1일 간격 (밀리초 단위)
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor='rgba(0,0,0,0.05)',
-                showline=False,
-                zeroline=False
-            ),
-            hovermode='x unified'
-        )
+            fig.update_layout(
+                plot_bgcolor='white',
+                paper_bgcolor='white',
+                height=350,
+                margin=dict(l=0, r=0, t=0, b=0),
+                showlegend=False,
+                xaxis=dict(
+                    showgrid=False,
+                    showline=False,
+                    zeroline=False,
+                    tickformat='%m/%d',  # 월/일 형식으로 표시
+                    tickmode='linear',
+                    dtick=86400000  # 1일 간격 (밀리초 단위)
+                ),
+                yaxis=dict(
+                    showgrid=True,
+                    gridcolor='rgba(0,0,0,0.05)',
+                    showline=False,
+                    zeroline=False
+                ),
+                hovermode='x unified'
+            )
+            return fig
         
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart("daily_visits", build_daily_chart, daily_visits)
     
     with col2:
         st.markdown('<div class="section-title">🏆 인기 장소</div>', unsafe_allow_html=True)
         
         # 모든 데이터(로컬 + Padlet)에서 인기 장소 집계
-        gallery_counts = {}
-        
-        # Padlet 데이터 집계
-        for post in st.session_state.padlet_data:
-            gallery = post.get('gallery', '')
-            if gallery and gallery != '갤러리':
-                if gallery in gallery_counts:
-                    gallery_counts[gallery] += 1
-                else:
-                    gallery_counts[gallery] = 1
-        
-        # 로컬 데이터 집계
-        for review in st.session_state.reviews:
-            gallery = review.get('gallery', '')
-            if gallery:
-                if gallery in gallery_counts:
-                    gallery_counts[gallery] += 1
-                else:
-                    gallery_counts[gallery] = 1
+        sorted_galleries = review_frames.top_galleries(review_frame, 5)
         
-        if gallery_counts:
-            sorted_galleries = sorted(gallery_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-            
+        if sorted_galleries:
             for i, (gallery, count) in enumerate(sorted_galleries, 1):
                 st.markdown(f"""
                 <div class="hover-card" style="display: flex; align-items: center; justify-content: space-between; padding: 0.75rem; margin-bottom: 0.5rem; background: white; border-radius: 10px; box-shadow: 0 2px 5px rgba(0,0,0,0.05);">
@@ -1301,162 +1365,189 @@ with tab4:
             st.info("📊 Padlet 데이터를 불러오는 중입니다...\n잠시 후 다시 확인해주세요.")
 
 # 분석 탭
-with tab5:
+def render_analysis():
     st.markdown('<div class="section-title">📈 상세 분석</div>', unsafe_allow_html=True)
     
-    st.info("📊 아래 그래프들은 현재 예시 데이터로 표시됩니다. 실제 데이터가 쌓이면 자동으로 업데이트됩니다.")
+    # 공유 스냅샷 연결 (네트워크 요청 없음)
+    fetch_padlet_data()
+    
+    # 롤업 테이블에서 바로 읽음 (후기 수와 관계없이 버킷 수만큼만 계산)
+    rollups = get_analysis_rollups()
+    
+    if not len(st.session_state.padlet_data) and not st.session_state.reviews:
+        st.info("📊 아직 분석할 후기가 없습니다. 후기가 쌓이면 자동으로 표시됩니다.")
     
     # 첫 번째 행
     col1, col2 = st.columns(2)
     
     with col1:
-        # 평점 분포 (Mock Data)
+        # 평점 분포
         st.markdown("### ⭐ 평점 분포")
-        mock_ratings = {1: 2, 2: 5, 3: 12, 4: 28, 5: 45}
-        
-        fig = go.Figure(data=[go.Bar(
-            x=list(mock_ratings.keys()),
-            y=list(mock_ratings.values()),
-            text=list(mock_ratings.values()),
-            textposition='outside',
-            marker=dict(
-                color=list(mock_ratings.values()),
-                colorscale='Purples',
-                showscale=False
-            )
-        )])
-        
-        fig.update_layout(
-            xaxis_title="별점",
-            yaxis_title="후기 수",
-            height=350,
-            margin=dict(l=0, r=0, t=20, b=0),
-            paper_bgcolor='white',
-            plot_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(tickmode='linear', tick0=1, dtick=1)
-        )
+        ratings = rollups.rating_distribution()
         
-        st.plotly_chart(fig, use_container_width=True)
+        if sum(ratings.values()):
+            def build_rating_chart():
+                fig = go.Figure(data=[go.Bar(
+                    x=list(ratings.keys()),
+                    y=list(ratings.values()),
+                    text=list(ratings.values()),
+                    textposition='outside',
+                    marker=dict(
+                        color=list(ratings.values()),
+                        colorscale='Purples',
+                        showscale=False
+                    )
+                )])
+            
+                fig.update_layout(
+                    xaxis_title="별점",
+                    yaxis_title="후기 수",
+                    height=350,
+                    margin=dict(l=0, r=0, t=20, b=0),
+                    paper_bgcolor='white',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    xaxis=dict(tickmode='linear', tick0=1, dtick=1)
+                )
+                return fig
+            
+            render_chart("rating_distribution", build_rating_chart, ratings)
+        else:
+            st.caption("별점이 기록된 후기가 없습니다.")
     
     with col2:
-        # 감정 분포 (Mock Data)
+        # 감정 분포
         st.markdown("### 😊 감정 분석")
-        mock_emotions = {"😍": 35, "👍": 28, "😊": 20, "🤔": 12, "😴": 5}
-        
-        fig = go.Figure(data=[go.Pie(
-            labels=list(mock_emotions.keys()),
-            values=list(mock_emotions.values()),
-            hole=.6,
-            marker_colors=['#667eea', '#764ba2', '#ec4899', '#f59e0b', '#64748b']
-        )])
-        
-        fig.update_layout(
-            annotations=[dict(text='감정<br>분포', x=0.5, y=0.5, font_size=14, showarrow=False)],
-            showlegend=True,
-            height=350,
-            margin=dict(l=0, r=0, t=20, b=0),
-            paper_bgcolor='white'
-        )
+        emotions = rollups.emotion_counts()
         
-        st.plotly_chart(fig, use_container_width=True)
+        if emotions:
+            def build_emotion_chart():
+                fig = go.Figure(data=[go.Pie(
+                    labels=[emotion for emotion, _ in emotions],
+                    values=[count for _, count in emotions],
+                    hole=.6,
+                    marker_colors=['#667eea', '#764ba2', '#ec4899', '#f59e0b', '#64748b']
+                )])
+            
+                fig.update_layout(
+                    annotations=[dict(text='감정<br>분포', x=0.5, y=0.5, font_size=14, showarrow=False)],
+                    showlegend=True,
+                    height=350,
+                    margin=dict(l=0, r=0, t=20, b=0),
+                    paper_bgcolor='white'
+                )
+                return fig
+            
+            render_chart("emotion_pie", build_emotion_chart, emotions)
+        else:
+            st.caption("감정이 기록된 후기가 없습니다.")
     
     # 두 번째 행
     col3, col4 = st.columns(2)
     
     with col3:
-        # 시간대별 방문 (Mock Data)
+        # 시간대별 방문
         st.markdown("### ⏰ 시간대별 방문 패턴")
-        hours = list(range(10, 20))  # 10시부터 19시까지
-        visits = [5, 8, 15, 22, 18, 25, 30, 28, 20, 12]
-        
-        fig = go.Figure(data=[go.Scatter(
-            x=hours,
-            y=visits,
-            mode='lines+markers',
-            fill='tozeroy',
-            line=dict(color='#667eea', width=3),
-            marker=dict(size=8, color='#764ba2'),
-            fillcolor='rgba(102, 126, 234, 0.2)'
-        )])
+        visits = rollups.hourly_counts()
         
-        fig.update_layout(
-            xaxis_title="시간",
-            yaxis_title="방문자 수",
-            height=350,
-            margin=dict(l=0, r=0, t=20, b=0),
-            paper_bgcolor='white',
-            xaxis=dict(tickmode='linear', tick0=10, dtick=1, ticksuffix="시")
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        if sum(visits):
+            # 후기가 있는 시간 범위만 표시
+            active = [hour for hour, count in enumerate(visits) if count]
+            hours = list(range(active[0], active[-1] + 1))
+            
+            def build_hourly_chart():
+                fig = go.Figure(data=[go.Scatter(
+                    x=hours,
+                    y=[visits[hour] for hour in hours],
+                    mode='lines+markers',
+                    fill='tozeroy',
+                    line=dict(color='#667eea', width=3),
+                    marker=dict(size=8, color='#764ba2'),
+                    fillcolor='rgba(102, 126, 234, 0.2)'
+                )])
+            
+                fig.update_layout(
+                    xaxis_title="시간",
+                    yaxis_title="방문자 수",
+                    height=350,
+                    margin=dict(l=0, r=0, t=20, b=0),
+                    paper_bgcolor='white',
+                    xaxis=dict(tickmode='linear', tick0=hours[0], dtick=1, ticksuffix="시")
+                )
+                return fig
+            
+            render_chart("hourly_visits", build_hourly_chart, visits)
+        else:
+            st.caption("방문 시각이 기록된 후기가 없습니다.")
     
     with col4:
-        # 체류 시간 분석 (Mock Data)
+        # 체류 시간 분석
         st.markdown("### ⏱️ 평균 체류 시간")
-        galleries = ["국제갤러리", "갤러리현대", "리움", "페로탕", "송은"]
-        stay_times = [2.5, 1.8, 3.2, 1.5, 2.0]
-        
-        fig = go.Figure(data=[go.Bar(
-            x=stay_times,
-            y=galleries,
-            orientation='h',
-            text=[f"{t}시간" for t in stay_times],
-            textposition='outside',
-            marker=dict(
-                color=stay_times,
-                colorscale='Purples',
-                showscale=False
-            )
-        )])
+        stays = rollups.stay_time_by_gallery(5)
         
-        fig.update_layout(
-            xaxis_title="시간",
-            yaxis_title="",
-            height=350,
-            margin=dict(l=0, r=0, t=20, b=0),
-            paper_bgcolor='white'
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        if stays:
+            galleries = [name for name, _ in stays]
+            stay_times = [round(hours, 1) for _, hours in stays]
+            
+            def build_stay_chart():
+                fig = go.Figure(data=[go.Bar(
+                    x=stay_times,
+                    y=galleries,
+                    orientation='h',
+                    text=[f"{t}시간" for t in stay_times],
+                    textposition='outside',
+                    marker=dict(
+                        color=stay_times,
+                        colorscale='Purples',
+                        showscale=False
+                    )
+                )])
+            
+                fig.update_layout(
+                    xaxis_title="시간",
+                    yaxis_title="",
+                    height=350,
+                    margin=dict(l=0, r=0, t=20, b=0),
+                    paper_bgcolor='white',
+                    yaxis=dict(autorange="reversed")
+                )
+                return fig
+            
+            render_chart("stay_time_bars", build_stay_chart, stays)
+        else:
+            st.caption("체류 시간이 기록된 후기가 없습니다.")
     
     # 세 번째 행 - 히트맵
     st.markdown("### 🗓️ 주간 활동 히트맵")
     
-    # Mock data for heatmap
-    days = ['월', '화', '수', '목', '금', '토', '일']
-    times = ['오전', '오후', '저녁']
-    z_data = [[5, 15, 8], [10, 25, 12], [8, 30, 15], [12, 35, 20], [20, 40, 25], [35, 45, 30], [30, 38, 22]]
-    
-    fig = go.Figure(data=go.Heatmap(
-        z=z_data,
-        x=times,
-        y=days,
-        colorscale='Purples',
-        text=z_data,
-        texttemplate="%{text}",
-        textfont={"size": 12},
-        colorbar=dict(title="방문 수")
-    ))
-    
-    fig.update_layout(
-        height=300,
-        margin=dict(l=0, r=0, t=20, b=0),
-        paper_bgcolor='white'
-    )
+    z_data = rollups.weekday_period_matrix()
+    
+    def build_heatmap():
+        fig = go.Figure(data=go.Heatmap(
+            z=z_data,
+            x=[label for label, _, _ in DAY_PERIODS],
+            y=WEEKDAY_LABELS,
+            colorscale='Purples',
+            text=z_data,
+            texttemplate="%{text}",
+            textfont={"size": 12},
+            colorbar=dict(title="방문 수")
+        ))
     
-    st.plotly_chart(fig, use_container_width=True)
+        fig.update_layout(
+            height=300,
+            margin=dict(l=0, r=0, t=20, b=0),
+            paper_bgcolor='white'
+        )
+        return fig
+    
+    render_chart("weekday_heatmap", build_heatmap, z_data)
     
     # 네 번째 행 - 워드 클라우드 대체
     st.markdown("### 🏷️ 인기 키워드")
     
-    keywords_data = {
-        "현대미술": 45, "설치미술": 38, "회화": 35, "조각": 30,
-        "미디어아트": 28, "사진": 25, "퍼포먼스": 22, "개념미술": 20,
-        "추상": 18, "구상": 15, "팝아트": 12, "미니멀리즘": 10
-    }
+    sorted_keywords = get_top_keywords(12)
     
     col5, col6, col7, col8 = st.columns(4)
-    sorted_keywords = sorted(keywords_data.items(), key=lambda x: x[1], reverse=True)
     
     for i, col in enumerate([col5, col6, col7, col8]):
         if i*3 < len(sorted_keywords):
@@ -1483,7 +1574,45 @@ with tab5:
                         """, unsafe_allow_html=True)
     
     st.markdown("---")
-    st.caption("💡 참고: 위 분석 데이터는 예시입니다. 실제 후기가 누적되면 자동으로 실제 데이터 기반 분석으로 전환됩니다.")
+    st.caption("💡 참고: 방문 시각은 한국 시간 기준이며, 별점/체류 시간은 후기 양식에 기록된 값만 집계합니다.")
+
+# 메인 화면 (사용 설명을 첫 번째로)
+# st.tabs는 모든 탭 본문을 매번 실행하므로, 선택된 화면 하나만 렌더링하는 전환기를 사용
+VIEWS = {
+    "📖 사용 설명": render_guide,
+    "🗺️ Padlet 지도": render_padlet_map,
+    "✍️ 직접 작성": render_write,
+    "📊 대시보드": render_dashboard,
+    "📈 분석": render_analysis,
+}
+
+@st.cache_resource
+def get_view_timings():
+    """화면별 렌더링 시간 누적 (프로세스 전역)"""
+    return {}
+
+def render_view(name):
+    """선택된 화면 하나만 렌더링하고 소요 시간 기록"""
+    loaded_before = set(load_times())
+    started = time.perf_counter()
+    try:
+        VIEWS[name]()
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        timing = get_view_timings().setdefault(name, {"renders": 0, "total_ms": 0.0, "last_ms": 0.0})
+        timing["renders"] += 1
+        timing["total_ms"] += elapsed_ms
+        timing["last_ms"] = elapsed_ms
+        charts = get_figure_cache().stats()
+        print(f"View render: {name} {elapsed_ms:.1f}ms "
+              f"(avg {timing['total_ms'] / timing['renders']:.1f}ms over {timing['renders']} renders, "
+              f"chart cache {charts['hits']} hits / {charts['misses']} misses)")
+        for module, ms in load_times().items():
+            if module not in loaded_before:
+                print(f"  lazy import: {module} {ms:.0f}ms")
+
+active_view = st.radio("화면", list(VIEWS), horizontal=True, key="active_view", label_visibility="collapsed")
+render_view(active_view)
 
 # 푸터
 st.markdown("""
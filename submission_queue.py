@@ -0,0 +1,362 @@
+"""
+후기 제출 대기열 (write-behind)
+폼 제출은 로컬 SQLite(WAL)에 기록하고 바로 반환하며,
+백그라운드 워커가 사진 업로드와 Padlet 포스트 생성을 재시도하며 처리
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from padlet_http import backoff_delay
+from padlet_models import iter_posts
+
+DEFAULT_QUEUE_DB = os.getenv('SUBMISSION_QUEUE_DB', os.path.join('css_art_map_data', 'submissions.sqlite'))
+MAX_ATTEMPTS = int(os.getenv('SUBMISSION_MAX_ATTEMPTS', '8'))
+LEASE_SECONDS = 120          # 처리 중 워커가 죽었을 때 다른 워커가 다시 가져가기까지의 시간
+
+# 포스트 본문 끝에 붙이는 제출 ID (결과가 불확실했던 제출을 보드에서 다시 찾을 때 사용)
+SUBMISSION_TAG = "🔖 제출 ID: {submission_id}"
+
+# 제출 상태
+PENDING = "pending"          # 대기 (재시도 대기 포함)
+PROCESSING = "processing"    # 워커가 처리 중
+DONE = "done"                # Padlet 포스트 생성 완료
+FAILED = "failed"            # 재시도 불가 또는 재시도 소진
+
+STATUS_LABELS = {
+    PENDING: "⏳ 대기 중",
+    PROCESSING: "🔄 전송 중",
+    DONE: "✅ Padlet 공유 완료",
+    FAILED: "❌ 전송 실패",
+}
+
+
+class SubmissionQueue:
+    """
+    SQLite(WAL) 기반 영속 대기열
+
+    - 제출 ID(uuid)가 멱등 키 역할: 사진은 같은 경로에 덮어쓰고, 포스트 본문에도 제출 ID를 넣어
+      포스트 생성 결과가 불확실했던 제출은 재시도 전에 보드에서 그 ID로 먼저 찾아본다
+    - 진행 단계(photo_url, post_id)를 즉시 기록해 재시도 시 끝난 단계는 건너뜀
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DEFAULT_QUEUE_DB
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS submissions ("
+                " id TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " photo BLOB,"
+                " photo_name TEXT,"
+                " photo_type TEXT,"
+                " photo_url TEXT,"
+                " post_id TEXT,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " post_attempted INTEGER NOT NULL DEFAULT 0,"
+                " first_post_attempt_at REAL,"
+                " next_attempt_at REAL NOT NULL,"
+                " last_error TEXT,"
+                " created_at TEXT NOT NULL,"
+                " updated_at TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_submissions_due"
+                " ON submissions (status, next_attempt_at)"
+            )
+            # 이전 버전 DB에는 첫 포스트 요청 시각 열이 없음
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(submissions)")}
+            if "first_post_attempt_at" not in columns:
+                conn.execute("ALTER TABLE submissions ADD COLUMN first_post_attempt_at REAL")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA synchronous=NORMAL")   # WAL에서는 커밋 단위 내구성 유지
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def enqueue(self, payload: Dict[str, Any], photo: Optional[bytes] = None,
+                photo_name: Optional[str] = None, photo_type: Optional[str] = None) -> str:
+        """
+        제출을 대기열에 기록 (디스크에 커밋된 뒤 반환)
+
+        Args:
+            payload: board_id, subject, body, map_props, gallery_name
+            photo: 사진 바이트 (선택)
+            photo_name: 원본 파일명
+            photo_type: MIME 타입
+
+        Returns:
+            제출 ID
+        """
+        submission_id = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO submissions (id, status, payload, photo, photo_name, photo_type,"
+                " next_attempt_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (submission_id, PENDING, json.dumps(payload, ensure_ascii=False), photo,
+                 photo_name, photo_type, time.time(), now, now)
+            )
+        return submission_id
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """
+        처리할 제출 하나를 임대 (다른 워커가 동시에 가져가지 않도록 잠금)
+
+        Returns:
+            제출 레코드 (없으면 None)
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM submissions"
+                " WHERE status IN (?, ?) AND next_attempt_at <= ?"
+                " ORDER BY next_attempt_at LIMIT 1",
+                (PENDING, PROCESSING, now)
+            ).fetchone()
+            if row is None:
+                conn.commit()
+                return None
+            conn.execute(
+                "UPDATE submissions SET status = ?, attempts = attempts + 1,"
+                " next_attempt_at = ?, updated_at = ? WHERE id = ?",
+                (PROCESSING, now + LEASE_SECONDS, datetime.now().isoformat(), row["id"])
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        record = dict(row)
+        record["attempts"] += 1
+        record["payload"] = json.loads(record["payload"])
+        return record
+
+    def _update(self, submission_id: str, **fields):
+        fields["updated_at"] = datetime.now().isoformat()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE submissions SET {columns} WHERE id = ?",
+                         (*fields.values(), submission_id))
+
+    def record_photo(self, submission_id: str, photo_url: str):
+        """사진 업로드 완료 기록 (원본 바이트는 더 이상 필요 없으므로 삭제)"""
+        self._update(submission_id, photo_url=photo_url, photo=None)
+
+    def record_post_attempt(self, submission_id: str):
+        """
+        포스트 생성 요청 직전에 호출 (결과가 불확실할 때 재조회 여부 판단용)
+
+        첫 요청 시각은 처음 한 번만 기록한다 (보드에서 찾을 때 이보다 먼저 생긴 포스트는 제외).
+        """
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE submissions SET post_attempted = 1,"
+                " first_post_attempt_at = COALESCE(first_post_attempt_at, ?), updated_at = ?"
+                " WHERE id = ?",
+                (int(time.time()), now, submission_id)  # Padlet 생성 시각은 초 단위
+            )
+
+    def complete(self, submission_id: str, post_id: Optional[str]):
+        self._update(submission_id, status=DONE, post_id=post_id, last_error=None)
+
+    def retry_later(self, submission_id: str, attempts: int, error: str):
+        """재시도 예약 (시도 횟수를 모두 쓰면 실패 처리)"""
+        if attempts >= MAX_ATTEMPTS:
+            self.fail(submission_id, error)
+            return
+        delay = max(1.0, backoff_delay(attempts))
+        self._update(submission_id, status=PENDING, last_error=error,
+                     next_attempt_at=time.time() + delay)
+
+    def fail(self, submission_id: str, error: str):
+        self._update(submission_id, status=FAILED, last_error=error)
+
+    def requeue(self, submission_id: str):
+        """실패한 제출을 다시 시도하도록 대기열로 되돌림"""
+        self._update(submission_id, status=PENDING, attempts=0, next_attempt_at=time.time())
+
+    def get_many(self, submission_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        제출 상태 조회 (UI용, 사진 바이트 제외)
+
+        Returns:
+            요청한 순서대로 정렬된 상태 리스트
+        """
+        if not submission_ids:
+            return []
+        placeholders = ", ".join("?" for _ in submission_ids)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, status, payload, photo_url, post_id, attempts, last_error,"
+                f" created_at, updated_at FROM submissions WHERE id IN ({placeholders})",
+                submission_ids
+            ).fetchall()
+        by_id = {row["id"]: dict(row, payload=json.loads(row["payload"])) for row in rows}
+        return [by_id[i] for i in submission_ids if i in by_id]
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 제출 수"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM submissions GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+
+class SubmissionWorker:
+    """
+    대기열을 비우는 백그라운드 스레드
+
+    단계별 처리:
+    1. 사진 업로드 (제출 ID를 파일 경로로 사용 → 재시도해도 같은 파일)
+    2. Padlet 포스트 생성 (이전 시도 결과가 불확실하면 보드에서 먼저 확인)
+    """
+
+    def __init__(self, queue: SubmissionQueue, api, storage=None, poll_interval: float = 2.0):
+        self.queue = queue
+        self.api = api
+        self.storage = storage
+        self.poll_interval = poll_interval
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="submission-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def wake(self):
+        """새 제출이 들어왔을 때 대기 없이 바로 처리하도록 깨움"""
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                processed = self.process_one()
+            except Exception as e:
+                print(f"Submission worker error: {e}")
+                processed = False
+            if not processed:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def process_one(self) -> bool:
+        """
+        제출 하나를 처리
+
+        Returns:
+            처리할 제출이 있었으면 True
+        """
+        record = self.queue.claim()
+        if record is None:
+            return False
+
+        submission_id = record["id"]
+        attempts = record["attempts"]
+        payload = record["payload"]
+
+        # 1. 사진 업로드 (이미 끝났으면 건너뜀)
+        photo_url = record["photo_url"]
+        if record["photo"] is not None and not photo_url:
+            if self.storage is not None and getattr(self.storage, "client", None):
+                try:
+                    photo_url = self.storage.upload_bytes(
+                        record["photo"], record["photo_name"] or "photo.jpg",
+                        record["photo_type"], payload.get("gallery_name", ""), key=submission_id
+                    )
+                except Exception as e:
+                    self.queue.retry_later(submission_id, attempts, f"사진 업로드 실패: {e}")
+                    return True
+                if photo_url:
+                    self.queue.record_photo(submission_id, photo_url)
+
+        # 2. 이전 포스트 요청의 결과가 불확실하면 보드에서 먼저 찾아봄 (중복 포스트 방지)
+        if record["post_attempted"]:
+            try:
+                existing = self._find_existing_post(record)
+            except Exception as e:
+                self.queue.retry_later(submission_id, attempts, f"보드 확인 실패: {e}")
+                return True
+            if existing:
+                self.queue.complete(submission_id, existing)
+                return True
+
+        body = payload["body"]
+        if photo_url:
+            body += f"\n\n📸 사진 보기: {photo_url}"
+        body += "\n\n" + SUBMISSION_TAG.format(submission_id=submission_id)
+
+        self.queue.record_post_attempt(submission_id)
+        try:
+            result = self.api.create_post(
+                board_id=payload["board_id"],
+                subject=payload["subject"],
+                body=body,
+                attachment_url=photo_url,
+                map_props=payload.get("map_props"),
+            )
+        except Exception as e:
+            self.queue.retry_later(submission_id, attempts, str(e))
+            return True
+
+        if "error" not in result:
+            post_id = (result.get("data") or {}).get("id")
+            self.queue.complete(submission_id, post_id)
+            return True
+
+        status_code = result.get("status_code")
+        if status_code and 400 <= status_code < 500 and status_code not in (408, 429):
+            # 요청 자체가 잘못된 경우는 재시도해도 같은 결과
+            self.queue.fail(submission_id, result["error"])
+        else:
+            self.queue.retry_later(submission_id, attempts, result["error"])
+        return True
+
+    def _find_existing_post(self, record: Dict[str, Any]) -> Optional[str]:
+        """
+        이 제출로 만들어진 포스트가 보드에 있으면 그 ID 반환
+
+        본문에 이 제출의 ID가 들어 있고, 첫 포스트 요청 이후에 생성된 포스트만 인정한다
+        (생성 시각이 없는 포스트는 인정하지 않음). 같은 갤러리의 다른 방문자 후기는
+        제목/장소가 같아도 제출 ID가 다르므로 섞이지 않는다.
+        """
+        payload = record["payload"]
+        since = record.get("first_post_attempt_at")
+        if since is None:
+            since = datetime.fromisoformat(record["created_at"]).timestamp()
+
+        items = self.api.iter_board_items(payload["board_id"], include_sections=False,
+                                          types=("post",))
+        for post in iter_posts(items):
+            # 본문은 HTML로 바뀌어 돌아올 수 있으므로 ID 문자열만 비교
+            if post.created_at is None or record["id"] not in post.body:
+                continue
+            if post.created_at.timestamp() >= since:
+                return post.id
+        return None
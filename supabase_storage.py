@@ -65,37 +65,70 @@ class SupabaseStorage:
             return None
         
         try:
-            # 파일명 생성 (timestamp + uuid + 원본 확장자)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
-            file_extension = file.name.split('.')[-1]
-            
-            # 갤러리 이름에서 특수문자 제거
-            safe_gallery_name = "".join(c for c in gallery_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_gallery_name = safe_gallery_name.replace(' ', '_')
-            
-            # 파일 경로 생성
-            file_path = f"{safe_gallery_name}/{timestamp}_{unique_id}.{file_extension}"
-            
-            # 파일 읽기
-            file_bytes = file.read()
-            
-            # Supabase에 업로드
-            response = self.client.storage.from_(self.bucket_name).upload(
-                path=file_path,
-                file=file_bytes,
-                file_options={"content-type": file.type}
-            )
-            
-            # 공개 URL 가져오기
-            public_url = self.client.storage.from_(self.bucket_name).get_public_url(file_path)
-            
-            return public_url
-            
+            return self.upload_bytes(file.read(), file.name, file.type, gallery_name)
         except Exception as e:
             st.error(f"사진 업로드 실패: {e}")
             return None
     
+    def photo_path(self, gallery_name: str, filename: str, key: str = None) -> str:
+        """
+        저장 경로 생성
+        
+        Args:
+            gallery_name: 갤러리 이름
+            filename: 원본 파일명 (확장자 추출용)
+            key: 고정 키 (지정하면 같은 키는 항상 같은 경로 → 재시도해도 중복 업로드 없음)
+        
+        Returns:
+            버킷 내 파일 경로
+        """
+        file_extension = filename.split('.')[-1]
+        
+        # 갤러리 이름에서 특수문자 제거
+        safe_gallery_name = "".join(c for c in gallery_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        safe_gallery_name = safe_gallery_name.replace(' ', '_')
+        
+        if key:
+            return f"{safe_gallery_name}/{key}.{file_extension}"
+        
+        # 파일명 생성 (timestamp + uuid + 원본 확장자)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        unique_id = str(uuid.uuid4())[:8]
+        return f"{safe_gallery_name}/{timestamp}_{unique_id}.{file_extension}"
+    
+    def upload_bytes(self, data: bytes, filename: str, content_type: Optional[str],
+                     gallery_name: str, key: str = None) -> Optional[str]:
+        """
+        바이트 데이터를 업로드 (백그라운드 작업용, 실패 시 예외 발생)
+        
+        Args:
+            data: 파일 내용
+            filename: 원본 파일명
+            content_type: MIME 타입
+            gallery_name: 갤러리 이름
+            key: 고정 키 (재시도 시 같은 경로에 덮어씀)
+        
+        Returns:
+            업로드된 파일의 공개 URL (클라이언트가 없으면 None)
+        """
+        if not self.client:
+            return None
+        
+        file_path = self.photo_path(gallery_name, filename, key)
+        file_options = {"content-type": content_type or "application/octet-stream"}
+        if key:
+            file_options["upsert"] = "true"
+        
+        # Supabase에 업로드
+        self.client.storage.from_(self.bucket_name).upload(
+            path=file_path,
+            file=data,
+            file_options=file_options
+        )
+        
+        # 공개 URL 가져오기
+        return self.client.storage.from_(self.bucket_name).get_public_url(file_path)
+    
     def delete_photo(self, file_path: str) -> bool:
         """
         Supabase Storage에서 사진 삭제
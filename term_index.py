@@ -0,0 +1,233 @@
+"""
+단어 빈도 색인
+문서(포스트) id별 단어 수를 기억해 추가/수정/삭제된 문서만 다시 토큰화하고
+전체 말뭉치를 다시 훑지 않고 상위 k개 단어를 반환
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+FORMAT_VERSION = 1
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class TermIndex:
+    """
+    증분 단어 빈도 색인
+
+    - add(): 새 문서 추가 또는 기존 문서 갱신 (본문이 같으면 토큰화 생략)
+    - remove(): 문서 삭제 (그 문서의 단어 수만큼 전체 빈도에서 뺌)
+    - sync(): 현재 문서 집합과 맞추기 (바뀐 문서만 처리)
+    - top_k(): 전체 빈도 상위 k개
+    - path를 주면 save()로 JSON 파일에 저장하고 다음 실행에서 이어서 사용
+      (tokenizer_version이 바뀌면 저장된 색인은 버리고 새로 만듦)
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 tokenizer: Callable[[str], Iterable[str]] = str.split,
+                 tokenizer_version: str = "1"):
+        self.path = path
+        self.tokenizer = tokenizer
+        self.tokenizer_version = tokenizer_version
+
+        self._lock = threading.RLock()
+        self._docs: Dict[str, Dict[str, int]] = {}     # 문서 id → 단어별 수
+        self._digests: Dict[str, str] = {}              # 문서 id → 본문 해시
+        self._totals: Counter = Counter()               # 단어 → 전체 빈도
+        self._dirty = False
+        self._stats = {"tokenized": 0, "skipped": 0, "removed": 0}
+
+        if path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return str(doc_id) in self._docs
+
+    def add(self, doc_id: Hashable, text: str) -> bool:
+        """
+        문서 추가/갱신
+
+        Args:
+            doc_id: 문서 id (문자열로 저장)
+            text: 본문
+
+        Returns:
+            색인이 바뀌었으면 True (본문이 같으면 False)
+        """
+        doc_id = str(doc_id)
+        text = text or ""
+        digest = _digest(text)
+        with self._lock:
+            if self._digests.get(doc_id) == digest:
+                self._stats["skipped"] += 1
+                return False
+            self._discard(doc_id)
+            terms = dict(Counter(self.tokenizer(text)))
+            self._docs[doc_id] = terms
+            self._digests[doc_id] = digest
+            self._totals.update(terms)
+            self._stats["tokenized"] += 1
+            self._dirty = True
+            return True
+
+    update = add
+
+    def remove(self, doc_id: Hashable) -> bool:
+        """문서 삭제 (없으면 False)"""
+        with self._lock:
+            if self._discard(str(doc_id)):
+                self._stats["removed"] += 1
+                self._dirty = True
+                return True
+            return False
+
+    def _discard(self, doc_id: str) -> bool:
+        terms = self._docs.pop(doc_id, None)
+        self._digests.pop(doc_id, None)
+        if terms is None:
+            return False
+        for term, count in terms.items():
+            remaining = self._totals[term] - count
+            if remaining > 0:
+                self._totals[term] = remaining
+            else:
+                del self._totals[term]
+        return True
+
+    def sync(self, docs: Mapping[Hashable, str]) -> Dict[str, int]:
+        """
+        색인을 주어진 문서 집합과 같게 맞춤
+
+        Args:
+            docs: 문서 id → 본문 (여기 없는 문서는 색인에서 삭제)
+
+        Returns:
+            changed: 추가/수정된 문서 수
+            removed: 삭제된 문서 수
+        """
+        with self._lock:
+            changed = sum(1 for doc_id, text in docs.items() if self.add(doc_id, text))
+            removed = self.retain(docs.keys())
+        return {"changed": changed, "removed": removed}
+
+    def retain(self, doc_ids: Iterable[Hashable]) -> int:
+        """주어진 id 외의 문서를 모두 삭제하고 삭제한 수 반환"""
+        keep = {str(doc_id) for doc_id in doc_ids}
+        with self._lock:
+            stale = [doc_id for doc_id in self._docs if doc_id not in keep]
+            for doc_id in stale:
+                self.remove(doc_id)
+        return len(stale)
+
+    def top_k(self, k: int = 10, extra: Optional[Mapping[str, int]] = None) -> List[Tuple[str, int]]:
+        """
+        전체 빈도 상위 k개 단어
+
+        Args:
+            k: 개수
+            extra: 색인에 넣지 않고 이번 조회에만 더할 빈도 (세션 로컬 후기 등)
+
+        Returns:
+            [(단어, 빈도), ...] 많은 순
+        """
+        with self._lock:
+            if not extra:
+                return self._totals.most_common(k)
+            # extra에 없는 단어는 색인 빈도 그대로이므로 상위 k + len(extra) 안에서만 나온다
+            candidates = dict(self._totals.most_common(k + len(extra)))
+            for term in extra:
+                candidates[term] = self._totals.get(term, 0)
+        merged = Counter(candidates)
+        merged.update(extra)
+        return merged.most_common(k)
+
+    def count(self, term: str) -> int:
+        return self._totals.get(term, 0)
+
+    def counts(self) -> Counter:
+        """전체 빈도 복사본"""
+        with self._lock:
+            return Counter(self._totals)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        색인 통계
+
+        Returns:
+            documents: 문서 수
+            terms: 서로 다른 단어 수
+            tokenized: 토큰화한 문서 수 (이번 실행)
+            skipped: 본문이 같아 토큰화를 생략한 수
+            removed: 삭제된 문서 수
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["documents"] = len(self._docs)
+            stats["terms"] = len(self._totals)
+        return stats
+
+    def load(self) -> bool:
+        """저장된 색인 불러오기 (없거나 형식/토크나이저가 다르면 빈 색인으로 시작)"""
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Term index load error: {e}")
+            return False
+        if data.get("format") != FORMAT_VERSION or data.get("tokenizer") != self.tokenizer_version:
+            return False
+
+        with self._lock:
+            self._docs = {doc_id: entry["terms"] for doc_id, entry in data["docs"].items()}
+            self._digests = {doc_id: entry["digest"] for doc_id, entry in data["docs"].items()}
+            self._totals = Counter()
+            for terms in self._docs.values():
+                self._totals.update(terms)
+            self._dirty = False
+        return True
+
+    def save(self) -> bool:
+        """바뀐 내용이 있으면 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = {
+                "format": FORMAT_VERSION,
+                "tokenizer": self.tokenizer_version,
+                "docs": {
+                    doc_id: {"digest": self._digests[doc_id], "terms": terms}
+                    for doc_id, terms in self._docs.items()
+                },
+            }
+            payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            self._dirty = False
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with self._lock:
+                self._dirty = True
+            raise
+        return True
@@ -0,0 +1,29 @@
+"""bulk_poster 멱등 게시 테스트"""
+
+import pytest
+
+from bulk_poster import BulkPoster, PostLedger, POSTED, SKIPPED
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return PostLedger(str(tmp_path / "ledger.sqlite"))
+
+
+@pytest.mark.parametrize("retry_unknown", [False, True])
+@pytest.mark.parametrize("with_finder", [False, True])
+def test_duplicate_in_batch_posted_once(ledger, retry_unknown, with_finder):
+    calls = []
+
+    def post(item):
+        calls.append(item)
+        return {"data": {"id": f"post-{len(calls)}"}}
+
+    poster = BulkPoster(post, ledger, concurrency=2,
+                        find_existing=(lambda key, since: None) if with_finder else None)
+    item = {"title": "같은 후기", "location": "코엑스"}
+    results = poster.post_all([item, dict(item)], retry_unknown=retry_unknown)
+
+    assert len(calls) == 1
+    assert [r.status for r in results] == [POSTED, SKIPPED]
+    assert poster.stats.posted == 1 and poster.stats.skipped == 1
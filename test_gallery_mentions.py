@@ -0,0 +1,35 @@
+"""gallery_mentions 본문 언급 추출 테스트 (오탐 방지)"""
+
+import pytest
+
+from gallery_mentions import extract_mentions, mentioned_gallery
+
+
+def _ids(text):
+    return [mention.gallery_id for mention in extract_mentions(text)]
+
+
+@pytest.mark.parametrize("text", [
+    "문화 큐레이터 워크숍",      # 단어 경계를 넘는 "화 큐" → 화큐
+    "문화큐레이션",              # 단어 안의 "화큐"
+    "삼성 역사를 공부",          # "삼성 역" → 삼성역
+    "김송은 작가님",             # 사람 이름 안의 "송은"
+    "현대미술 이야기",
+    "PKMX 브랜드",
+])
+def test_no_false_mentions(text):
+    assert _ids(text) == []
+    assert mentioned_gallery(text, include_areas=True) is None
+
+
+@pytest.mark.parametrize("text, gallery_id", [
+    ("갤러리 현대 다녀왔어요", "갤러리현대"),
+    ("갤러리현대에서 봤다", "갤러리현대"),
+    ("PKM 갤러리 좋아요", "PKM갤러리"),
+    ("양혜규 스튜디오 방문", "양혜규스튜디오"),
+    ("리움에서 본 작품", "리움미술관"),
+    ("학고재의 전시", "학고재"),
+    ("송은 아트스페이스 추천", "송은아트스페이스"),
+])
+def test_mentions(text, gallery_id):
+    assert _ids(text) == [gallery_id]
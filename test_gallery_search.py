@@ -0,0 +1,31 @@
+"""gallery_search 퍼지 검색 / 직접 입력 좌표 테스트"""
+
+import pytest
+
+from gallery_coordinates import AREA_COORDINATES, get_gallery_coordinates
+from gallery_search import find_gallery
+
+
+@pytest.mark.parametrize("query", ["갤러리", "갤러리 수", "갤러리 현"])
+def test_generic_queries_do_not_fuzzy_match(query):
+    assert find_gallery(query, include_areas=False) is None
+
+
+@pytest.mark.parametrize("query, gallery_id", [
+    ("국제 갤러래", "국제갤러리"),
+    ("리움미슬관", "리움미술관"),
+    ("학고제", "학고재"),
+])
+def test_typos_still_match(query, gallery_id):
+    assert find_gallery(query, include_areas=False).id == gallery_id
+
+
+def test_custom_location_wins_over_similar_name():
+    coords = get_gallery_coordinates("갤러리 수", "성수동")
+    area = AREA_COORDINATES["성수동"]
+    assert abs(coords["lat"] - area["lat"]) <= 0.003
+    assert abs(coords["lon"] - area["lon"]) <= 0.003
+
+
+def test_custom_location_keeps_exact_names():
+    assert get_gallery_coordinates("국제갤러리", "삼청동") == {"lat": 37.5802, "lon": 126.9749}
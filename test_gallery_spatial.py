@@ -0,0 +1,45 @@
+"""gallery_spatial 격자 색인 테스트 (반경 경계에서도 전체 비교와 같은 결과인지)"""
+
+import math
+
+import numpy as np
+import pytest
+
+import geodesic
+from gallery_spatial import SNAP_RADIUS_KM, GridIndex
+
+
+def _offset_lat(lat: float, km: float) -> float:
+    """정북(+)/정남(-)으로 km만큼 떨어진 위도"""
+    return lat + math.degrees(km / geodesic.EARTH_RADIUS_KM)
+
+
+@pytest.mark.parametrize("direction", [1.0, -1.0])
+def test_radius_boundary_at_cell_edge(direction):
+    # 기준점을 칸 경계 바로 옆에 두고 반대쪽으로 반경 바로 안쪽(149.7~150.0m)에서 찾기
+    cell = GridIndex([37.5], [127.0])._deg_lat
+    row = math.floor(37.5 / cell)
+    ref_lat = (row + 1) * cell - 1e-9 if direction > 0 else row * cell + 1e-9
+    grid = GridIndex([ref_lat], [127.0])
+
+    offsets = np.linspace(0.1497, 0.14999, 30) * direction
+    lats = [_offset_lat(ref_lat, km) for km in offsets]
+    index, distance = grid.nearest_each(lats, [127.0] * len(lats), SNAP_RADIUS_KM)
+    assert (index == 0).all()
+    assert (distance < SNAP_RADIUS_KM).all()
+
+
+def test_matches_brute_force():
+    rng = np.random.default_rng(0)
+    ref_lats = 37.4 + rng.random(300) * 0.3
+    ref_lons = 126.9 + rng.random(300) * 0.3
+    grid = GridIndex(ref_lats, ref_lons)
+
+    lats = 37.4 + rng.random(5000) * 0.3
+    lons = 126.9 + rng.random(5000) * 0.3
+    index, distance = grid.nearest_each(lats, lons, SNAP_RADIUS_KM)
+    expected_index, expected_distance = geodesic.nearest_each(lats, lons, ref_lats, ref_lons,
+                                                              max_km=SNAP_RADIUS_KM)
+    assert np.array_equal(index, expected_index)
+    matched = expected_index >= 0
+    assert np.allclose(distance[matched], expected_distance[matched])
@@ -0,0 +1,39 @@
+"""review_rollups 집계 테스트"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from review_rollups import ReviewRollups
+
+
+@pytest.fixture
+def utc_host(monkeypatch):
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_naive_local_timestamp_uses_host_timezone(utc_host):
+    rollups = ReviewRollups()
+    rollups.add("local", {"timestamp": datetime(2025, 9, 1, 3, 0), "emotion": "😍 감동적이었어요"})
+    hours = rollups.hourly_counts()
+    assert hours[12] == 1      # UTC 03:00 → KST 12:00
+    assert sum(hours) == 1
+
+
+def test_undated_records_skip_time_buckets():
+    rollups = ReviewRollups()
+    rollups.add("padlet", {"timestamp": None, "emotion": "😍 감동", "rating": 5})
+    assert sum(rollups.hourly_counts()) == 0
+    assert rollups.rating_distribution()[5] == 1
+
+
+def test_emotion_labels_merge():
+    rollups = ReviewRollups()
+    rollups.add("local", {"emotion": "😍 감동적이었어요"})
+    rollups.add("padlet", {"emotion": "😍 감동"})
+    assert rollups.emotion_counts() == [("😍 감동", 2)]
@@ -7,26 +7,18 @@ import streamlit as st
 from typing import Dict, List, Optional
 import json
 
+from gallery_registry import REGISTRY
+from gallery_search import find_gallery
+
 class UserFriendlyInputSystem:
     """사용자가 쉽게 경험을 입력할 수 있는 시스템"""
     
     def __init__(self):
         pass  # CSSArtMapProject 의존성 제거
         
-        # 장소명 변형 매핑 (자동완성용)
+        # 장소명 변형 매핑 (자동완성용, 갤러리 레지스트리 기준)
         self.location_aliases = {
-            "코엑스": ["coex", "코엑스", "코액스", "삼성역"],
-            "프리즈서울": ["frieze", "프리즈", "frieze seoul", "프리즈 서울"],
-            "키아프": ["kiaf", "키아프", "kiaf seoul"],
-            "국제갤러리": ["국제", "kukje", "kukje gallery", "국제 갤러리"],
-            "리움미술관": ["리움", "leeum", "리움", "삼성미술관"],
-            "아트선재센터": ["아트선재", "art sonje", "선재"],
-            "갤러리현대": ["현대갤러리", "gallery hyundai", "현대"],
-            "페이스갤러리": ["pace", "페이스", "pace gallery"],
-            "PKM갤러리": ["pkm", "피케이엠"],
-            "삼청동": ["삼청", "삼청동길", "북촌"],
-            "한남동": ["한남", "한남동", "이태원"],
-            "성수동": ["성수", "성수동", "뚝섬"]
+            gallery.id: list(gallery.aliases) for gallery in REGISTRY.galleries(include_areas=True)
         }
         
         # 모든 가능한 입력값 리스트 생성
@@ -38,27 +30,10 @@ class UserFriendlyInputSystem:
     def match_location(self, user_input: str) -> Optional[str]:
         """
         사용자 입력을 실제 장소명으로 매칭
-        간단한 문자열 매칭 사용
+        정확한 이름/별칭이 먼저, 없으면 n-gram 퍼지 검색으로 가장 비슷한 장소
         """
-        # 정확히 일치하는 경우 먼저 체크
-        user_input_lower = user_input.lower().strip()
-        
-        for location, aliases in self.location_aliases.items():
-            if user_input_lower == location.lower():
-                return location
-            for alias in aliases:
-                if user_input_lower == alias.lower():
-                    return location
-        
-        # 부분 문자열 매칭
-        for location, aliases in self.location_aliases.items():
-            if user_input_lower in location.lower() or location.lower() in user_input_lower:
-                return location
-            for alias in aliases:
-                if user_input_lower in alias.lower() or alias.lower() in user_input_lower:
-                    return location
-        
-        return None
+        gallery = find_gallery(user_input.strip())
+        return gallery.id if gallery else None
     
     def create_streamlit_form(self):
         """Streamlit 웹 폼 생성"""